@@ -28,6 +28,7 @@ from openforms.submissions.api.permissions import (
 )
 from openforms.submissions.models import Submission
 
+from .. import cache
 from ..exceptions import AppointmentDeleteFailed, CancelAppointmentFailed
 from ..models import Appointment, AppointmentsConfig
 from ..utils import delete_appointment_for_submission, get_plugin
@@ -155,7 +156,7 @@ class LocationsListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-locations", span_type="app.appointments.get_locations"
         ):
-            return plugin.get_locations(products)
+            return cache.get_locations(plugin, products)
 
 
 @extend_schema(
@@ -195,7 +196,7 @@ class DatesListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-dates", span_type="app.appointments.get_dates"
         ):
-            dates = plugin.get_dates(products, location)
+            dates = cache.get_dates(plugin, products, location)
         return [{"date": date} for date in dates]
 
 
@@ -244,7 +245,7 @@ class TimesListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-times", span_type="app.appointments.get_times"
         ):
-            times = plugin.get_times(products, location, date)
+            times = cache.get_times(plugin, products, location, date)
         return [{"time": time} for time in times]
 
 
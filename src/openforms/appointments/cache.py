@@ -0,0 +1,138 @@
+"""
+Short-lived cache for the availability of appointments.
+
+Every user clicking through the appointment calendar causes the available locations,
+dates and times to be looked up in the appointment backend. The results are cached
+per plugin, products, location and date (range) for
+``settings.APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT`` seconds.
+
+After looking up the available dates, the available times of the first
+``settings.APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS`` dates are fetched in the
+background, as the user is likely to select one of them next.
+
+Creating or cancelling an appointment changes the availability - the cached dates
+and times of the location are invalidated by bumping the cache version of the
+location (or of the plugin when the location is unknown).
+
+.. note:: The appointment itself is always validated against the live availability,
+   see :class:`openforms.appointments.api.serializers.AppointmentSerializer`.
+"""
+import hashlib
+import time
+from datetime import date, datetime
+from typing import Callable, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .base import BasePlugin, Location, Product
+
+T = TypeVar("T")
+
+CACHE_PREFIX = "appointments_availability"
+
+
+def _get_version(*bits: str) -> str:
+    version_key = ":".join([CACHE_PREFIX, "version", *bits])
+    if (version := cache.get(version_key)) is None:
+        cache.add(version_key, str(time.time_ns()), timeout=None)
+        version = cache.get(version_key, "")
+    return version
+
+
+def flush_availability(plugin_id: str, location_id: str = "") -> None:
+    """
+    Invalidate the cached availability of a location, or of all locations of a plugin.
+    """
+    bits = [plugin_id, location_id] if location_id else [plugin_id]
+    cache.set(
+        ":".join([CACHE_PREFIX, "version", *bits]), str(time.time_ns()), timeout=None
+    )
+
+
+def _get_or_fetch(
+    plugin: BasePlugin,
+    resource: str,
+    products: list[Product],
+    location: Location | None,
+    params: str,
+    fetch: Callable[[], T],
+) -> tuple[T, bool]:
+    timeout: int = settings.APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT
+    if not timeout:
+        return fetch(), False
+
+    bits = [
+        _get_version(plugin.identifier),
+        resource,
+        ",".join(sorted(f"{p.identifier}x{p.amount}" for p in products)),
+        params,
+    ]
+    if location is not None:
+        bits.append(_get_version(plugin.identifier, location.identifier))
+        bits.append(location.identifier)
+    digest = hashlib.md5("|".join(bits).encode(), usedforsecurity=False).hexdigest()
+    key = f"{CACHE_PREFIX}:{plugin.identifier}:{digest}"
+
+    if (cached := cache.get(key)) is not None:
+        return cached, True
+    result = fetch()
+    # the plugins return empty results when the backend is unavailable
+    if result:
+        cache.set(key, result, timeout=timeout)
+    return result, False
+
+
+def get_locations(plugin: BasePlugin, products: list[Product]) -> list[Location]:
+    locations, _ = _get_or_fetch(
+        plugin,
+        "locations",
+        products,
+        None,
+        "",
+        lambda: plugin.get_locations(products),
+    )
+    return locations
+
+
+def get_dates(
+    plugin: BasePlugin,
+    products: list[Product],
+    location: Location,
+    start_at: date | None = None,
+    end_at: date | None = None,
+) -> list[date]:
+    dates, cached = _get_or_fetch(
+        plugin,
+        "dates",
+        products,
+        location,
+        f"{start_at}/{end_at}",
+        lambda: plugin.get_dates(products, location, start_at=start_at, end_at=end_at),
+    )
+    num_days: int = settings.APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS
+    is_cache_enabled = bool(settings.APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT)
+    if is_cache_enabled and not cached and dates and num_days:
+        from .tasks import prefetch_available_times
+
+        prefetch_available_times.delay(
+            plugin_id=plugin.identifier,
+            products=[(product.identifier, product.amount) for product in products],
+            location_id=location.identifier,
+            days=[day.isoformat() for day in dates[:num_days]],
+        )
+    return dates
+
+
+def get_times(
+    plugin: BasePlugin, products: list[Product], location: Location, day: date
+) -> list[datetime]:
+    times, _ = _get_or_fetch(
+        plugin,
+        "times",
+        products,
+        location,
+        day.isoformat(),
+        lambda: plugin.get_times(products, location, day),
+    )
+    return times
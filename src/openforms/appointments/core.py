@@ -14,6 +14,7 @@ from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
 from .base import BasePlugin, CustomerDetails, Location, Product
+from .cache import flush_availability
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
     AppointmentCreateFailed,
@@ -58,6 +59,7 @@ def book(appointment: Appointment, remarks: str = "") -> str:
         customer,
         remarks=remarks,
     )
+    flush_availability(plugin.identifier, location.identifier)
     appointment_info = AppointmentInfo.objects.create(
         status=AppointmentDetailsStatus.success,
         appointment_id=appointment_id,
@@ -1,17 +1,21 @@
 import logging
 import warnings
+from datetime import date
 
 from celery_once import QueueOnce
 
 from openforms.celery import app
 from openforms.submissions.models import Submission
 
+from . import cache
+from .base import Location, Product
 from .core import book_for_submission
 from .exceptions import AppointmentRegistrationFailed, NoAppointmentForm
 from .models import AppointmentInfo
+from .registry import register
 from .utils import book_appointment_for_submission
 
-__all__ = ["maybe_register_appointment"]
+__all__ = ["maybe_register_appointment", "prefetch_available_times"]
 
 logger = logging.getLogger(__name__)
 
@@ -75,3 +79,31 @@ def maybe_register_appointment(submission_id: int) -> None | str:
             extra={"submission": submission_id},
         )
         raise
+
+
+@app.task(ignore_result=True)
+def prefetch_available_times(
+    plugin_id: str,
+    products: list[tuple[str, int]],
+    location_id: str,
+    days: list[str],
+) -> None:
+    """
+    Populate the availability cache with the available times of the given days.
+    """
+    plugin = register[plugin_id]
+    _products = [
+        Product(identifier=identifier, amount=amount, name="")
+        for identifier, amount in products
+    ]
+    location = Location(identifier=location_id, name="")
+    for day in days:
+        try:
+            cache.get_times(plugin, _products, location, date.fromisoformat(day))
+        except Exception:  # the times are simply not prefetched
+            logger.info(
+                "Could not prefetch the available times of %s for location %s",
+                day,
+                location_id,
+                exc_info=True,
+            )
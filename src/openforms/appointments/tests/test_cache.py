@@ -0,0 +1,140 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..base import Location, Product
+from ..cache import flush_availability, get_dates, get_locations, get_times
+from ..contrib.demo.plugin import DemoAppointment
+from ..tasks import prefetch_available_times
+
+PRODUCTS = [Product(identifier="1", name="")]
+LOCATION = Location(identifier="1", name="")
+
+
+@override_settings(
+    APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT=60,
+    APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS=0,
+)
+class AvailabilityCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.plugin = DemoAppointment("demo")
+
+    def test_availability_is_cached(self):
+        with (
+            patch.object(self.plugin, "get_locations", wraps=self.plugin.get_locations),
+            patch.object(self.plugin, "get_dates", wraps=self.plugin.get_dates),
+            patch.object(self.plugin, "get_times", wraps=self.plugin.get_times),
+        ):
+            for _ in range(2):
+                locations = get_locations(self.plugin, PRODUCTS)
+                dates = get_dates(self.plugin, PRODUCTS, LOCATION)
+                times = get_times(self.plugin, PRODUCTS, LOCATION, date(2023, 8, 1))
+
+            self.plugin.get_locations.assert_called_once()
+            self.plugin.get_dates.assert_called_once()
+            self.plugin.get_times.assert_called_once()
+
+        self.assertEqual(locations, [Location(identifier="1", name="Test location")])
+        self.assertEqual(len(dates), 1)
+        self.assertEqual(len(times), 3)
+
+    def test_cached_per_products_location_and_date(self):
+        other_location = Location(identifier="2", name="")
+        other_products = [Product(identifier="1", name="", amount=2)]
+
+        with patch.object(
+            self.plugin, "get_times", wraps=self.plugin.get_times
+        ) as mock_get_times:
+            get_times(self.plugin, PRODUCTS, LOCATION, date(2023, 8, 1))
+            get_times(self.plugin, PRODUCTS, LOCATION, date(2023, 8, 2))
+            get_times(self.plugin, PRODUCTS, other_location, date(2023, 8, 1))
+            get_times(self.plugin, other_products, LOCATION, date(2023, 8, 1))
+
+        self.assertEqual(mock_get_times.call_count, 4)
+
+    def test_empty_results_are_not_cached(self):
+        with patch.object(self.plugin, "get_dates", return_value=[]) as mock_get_dates:
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+
+        self.assertEqual(mock_get_dates.call_count, 2)
+
+    def test_flush_location(self):
+        other_location = Location(identifier="2", name="")
+
+        with patch.object(
+            self.plugin, "get_dates", wraps=self.plugin.get_dates
+        ) as mock_get_dates:
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, other_location)
+
+            flush_availability("demo", LOCATION.identifier)
+
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, other_location)
+
+        self.assertEqual(mock_get_dates.call_count, 3)
+
+    def test_flush_plugin(self):
+        with patch.object(
+            self.plugin, "get_dates", wraps=self.plugin.get_dates
+        ) as mock_get_dates:
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+
+            flush_availability("demo")
+
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+
+        self.assertEqual(mock_get_dates.call_count, 2)
+
+    @override_settings(APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT=0)
+    def test_caching_disabled(self):
+        with patch.object(
+            self.plugin, "get_locations", wraps=self.plugin.get_locations
+        ) as mock_get_locations:
+            get_locations(self.plugin, PRODUCTS)
+            get_locations(self.plugin, PRODUCTS)
+
+        self.assertEqual(mock_get_locations.call_count, 2)
+
+    @override_settings(APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS=2)
+    @patch("openforms.appointments.tasks.prefetch_available_times.delay")
+    def test_times_of_available_dates_are_prefetched(self, mock_delay):
+        available_dates = [date(2023, 8, 1), date(2023, 8, 2), date(2023, 8, 3)]
+
+        with patch.object(self.plugin, "get_dates", return_value=available_dates):
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+
+        mock_delay.assert_called_once_with(
+            plugin_id="demo",
+            products=[("1", 1)],
+            location_id="1",
+            days=["2023-08-01", "2023-08-02"],
+        )
+
+    def test_prefetch_task(self):
+        with patch(
+            "openforms.appointments.contrib.demo.plugin.DemoAppointment.get_times",
+            return_value=[],
+        ) as mock_get_times:
+            prefetch_available_times(
+                plugin_id="demo",
+                products=[("1", 1)],
+                location_id="1",
+                days=["2023-08-01", "2023-08-02"],
+            )
+
+        self.assertEqual(mock_get_times.call_count, 2)
+        products, location, day = mock_get_times.call_args.args
+        self.assertEqual(products, [Product(identifier="1", name="")])
+        self.assertEqual(location, Location(identifier="1", name=""))
+        self.assertEqual(day, date(2023, 8, 2))
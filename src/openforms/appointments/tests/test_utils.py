@@ -1,5 +1,7 @@
 from datetime import timedelta
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 from django.utils.translation import gettext as _
@@ -17,6 +19,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionStepFactory,
 )
+from openforms.utils.tests.cache import clear_caches
 
 from ..constants import AppointmentDetailsStatus
 from ..contrib.jcc.tests.test_plugin import mock_response
@@ -28,6 +31,7 @@ from ..utils import (
     create_base64_qrcode,
     find_first_appointment_step,
     get_formatted_phone_number,
+    get_qrcode_png,
 )
 from .factories import AppointmentInfoFactory
 from .utils import setup_jcc
@@ -605,6 +609,28 @@ class BookAppointmentForSubmissionTest(TestCase):
 class UtilsTests(TestCase):
     maxDiff = 1024
 
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+        create_base64_qrcode.cache_clear()
+        self.addCleanup(create_base64_qrcode.cache_clear)
+
+    def test_qrcode_image_cached_and_reused(self):
+        png = get_qrcode_png("44b322c32c5329b135e1")
+
+        with patch("openforms.appointments.utils.qrcode.make") as mock_make:
+            create_base64_qrcode("44b322c32c5329b135e1")
+            create_base64_qrcode("44b322c32c5329b135e1")
+
+        mock_make.assert_not_called()
+        cache_key = (
+            "appointments:qrcode:"
+            "21a36b8853fb2a3a6e6b89b6a240fff84231d0ee6ec4eb29074b05c1859ae7d1"
+        )
+        self.assertEqual(cache.get(cache_key), png)
+
     def test_create_base64_qrcode(self):
         data = "44b322c32c5329b135e1"
         expected = (
@@ -1,11 +1,14 @@
 import base64
+import hashlib
 import io
 import logging
 import re
 import warnings
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 
 import elasticapm
@@ -16,6 +19,7 @@ from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
 from .base import BasePlugin, Customer, Location, Product
+from .cache import flush_availability
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
     AppointmentCreateFailed,
@@ -27,6 +31,10 @@ from .registry import register
 
 logger = logging.getLogger()
 
+QRCODE_CACHE_PREFIX = "appointments:qrcode"
+QRCODE_CACHE_TIMEOUT = 7 * 24 * 60 * 60  # seconds
+QRCODE_CACHE_SIZE = 256
+
 
 def get_plugin(plugin: str = "") -> BasePlugin:
     """returns plugin selected in AppointmentsConfig"""
@@ -150,6 +158,7 @@ def book_appointment_for_submission(submission: Submission) -> None:
         appointment_id = plugin.create_appointment(
             [product], location, start_at, appointment_client
         )
+        flush_availability(plugin.identifier, location.identifier)
         appointment_info = AppointmentInfo.objects.create(
             status=AppointmentDetailsStatus.success,
             appointment_id=appointment_id,
@@ -246,6 +255,11 @@ def delete_appointment_for_submission(submission: Submission, plugin=None) -> No
     try:
         plugin.delete_appointment(appointment_info.appointment_id)
         appointment_info.cancel()
+        # the appointments made with the old flow do not record the location
+        appointment = getattr(submission, "appointment", None)
+        flush_availability(
+            plugin.identifier, appointment.location if appointment else ""
+        )
     except AppointmentDeleteFailed as e:
         logevent.appointment_cancel_failure(appointment_info, plugin, e)
         raise
@@ -253,13 +267,31 @@ def delete_appointment_for_submission(submission: Submission, plugin=None) -> No
     logevent.appointment_cancel_success(appointment_info, plugin)
 
 
-def create_base64_qrcode(text):
+def get_qrcode_png(text: str) -> bytes:
+    """
+    Get the PNG image of the QR code for the given text.
+
+    Generating the QR codes is CPU intensive, while the same QR codes are rendered
+    over and over again (confirmation emails, PDF reports, retries...). The images
+    are stored in the (shared) cache for ``QRCODE_CACHE_TIMEOUT`` seconds, keyed on the
+    hash of their content, so that they are shared by all the processes.
+    """
+    cache_key = f"{QRCODE_CACHE_PREFIX}:{hashlib.sha256(text.encode()).hexdigest()}"
+    if (png := cache.get(cache_key)) is not None:
+        return png
+
     img = qrcode.make(text)
     buffer = io.BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
+    png = buffer.getvalue()
+
+    cache.set(cache_key, png, timeout=QRCODE_CACHE_TIMEOUT)
+    return png
+
 
-    return base64.b64encode(buffer.read()).decode("ascii")
+@lru_cache(maxsize=QRCODE_CACHE_SIZE)
+def create_base64_qrcode(text: str) -> str:
+    return base64.b64encode(get_qrcode_png(text)).decode("ascii")
 
 
 def find_first_appointment_step(form: Form) -> Optional[FormStep]:
@@ -121,8 +121,11 @@ CACHES = {
         },
     },
     "solo": {
-        "BACKEND": "openforms.utils.cache.RequestProxyCache",
+        "BACKEND": "openforms.utils.cache.ProcessLocalProxyCache",
         "LOCATION": "default",
+        "OPTIONS": {
+            "CHECK_INTERVAL": config("SOLO_CACHE_CHECK_INTERVAL", default=5),
+        },
     },
 }
 
@@ -256,6 +259,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "openforms.logging.middleware.TimelineLogBufferMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -353,7 +357,7 @@ SENDFILE_URL = PRIVATE_MEDIA_URL
 #
 # Sending EMAIL
 #
-EMAIL_BACKEND = "django_yubin.backends.QueuedEmailBackend"
+EMAIL_BACKEND = "openforms.emails.backends.BatchedQueuedEmailBackend"
 EMAIL_HOST = config("EMAIL_HOST", default="localhost")
 EMAIL_PORT = config(
     "EMAIL_PORT", default=25
@@ -365,6 +369,24 @@ EMAIL_TIMEOUT = 10
 
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", "openforms@example.com")
 
+# Queued emails are sent in batches over a single connection, see
+# :mod:`openforms.emails.dispatch`. Use ``EMAIL_DISPATCH_DELAY=0`` to send every email
+# in its own task instead. The rate limits are in messages per second per provider
+# (recipient domain), ``0`` means unlimited, e.g.
+# ``EMAIL_DISPATCH_PROVIDER_RATE_LIMITS=gmail.com=5,outlook.com=2``.
+EMAIL_DISPATCH_DELAY = config("EMAIL_DISPATCH_DELAY", default=5)
+EMAIL_DISPATCH_BATCH_SIZE = config("EMAIL_DISPATCH_BATCH_SIZE", default=100)
+EMAIL_DISPATCH_RATE_LIMIT = config("EMAIL_DISPATCH_RATE_LIMIT", default=0.0)
+EMAIL_DISPATCH_PROVIDER_RATE_LIMITS = {
+    provider.strip().lower(): float(rate_limit)
+    for provider, rate_limit in (
+        item.split("=", 1)
+        for item in config(
+            "EMAIL_DISPATCH_PROVIDER_RATE_LIMITS", split=True, default=[]
+        )
+    )
+}
+
 #
 # LOGGING
 #
@@ -578,6 +600,18 @@ TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
 # Zip files for file exports: after how long should they be deleted
 FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", default=7)
 
+# Cache alias to share the (derived) Formio component indices between processes. The
+# indices are always cached in memory per process.
+FORMIO_COMPONENT_INDEX_CACHE = config("FORMIO_COMPONENT_INDEX_CACHE", default="")
+
+# Buffer the timeline log entries of a request/celery task and save them in bulk at the
+# end, rather than saving every entry immediately.
+TIMELINE_LOG_BUFFERED = config("TIMELINE_LOG_BUFFERED", default=False)
+TIMELINE_LOG_BUFFER_SIZE = config("TIMELINE_LOG_BUFFER_SIZE", default=100)
+TIMELINE_LOG_BUFFER_OVERFLOW_TASK = config(
+    "TIMELINE_LOG_BUFFER_OVERFLOW_TASK", default=False
+)
+
 # a custom default timeout for the requests library, added via monkeypatch in
 # :mod:`openforms.setup`. Value is in seconds.
 DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
@@ -723,6 +757,12 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openforms.emails.tasks.send_email_digest",
         "schedule": crontab(hour=0, minute=0, day_of_week="*"),
     },
+    # picks up queued emails of which the scheduled dispatch got lost, and emails of
+    # which the sending got interrupted
+    "dispatch-queued-emails": {
+        "task": "openforms.emails.tasks.dispatch_queued_emails",
+        "schedule": crontab(minute="*/5"),
+    },
 }
 
 RETRY_SUBMISSIONS_TIME_LIMIT = config(
@@ -739,6 +779,75 @@ CELERY_TASK_ACKS_LATE = True
 # *should* have the same effect...
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
+# Replace worker processes after they executed this many tasks. Rendering PDFs with
+# WeasyPrint grows the memory of the worker processes, recycling them bounds the
+# memory usage. The default (``None``) never replaces the worker processes.
+CELERY_WORKER_MAX_TASKS_PER_CHILD = config(
+    "CELERY_WORKER_MAX_TASKS_PER_CHILD",
+    default=None,
+    cast=lambda val: int(val) if val is not None else None,
+)
+
+#
+# ZGW APIs
+#
+# Cache the (read-only) Catalogi API resources for this many seconds, use ``0`` to
+# disable caching. Afterwards, the stale data is still used while it's being
+# revalidated or when the API is unavailable.
+ZGW_CATALOGI_CACHE_TIMEOUT = config("ZGW_CATALOGI_CACHE_TIMEOUT", default=15 * 60)
+ZGW_CATALOGI_CACHE_STALE_TIMEOUT = config(
+    "ZGW_CATALOGI_CACHE_STALE_TIMEOUT", default=24 * 60 * 60
+)
+
+#
+# Appointments
+#
+# Cache the availability of appointments (locations, dates and times) for this many
+# seconds, use ``0`` to disable caching. The available times of the first
+# ``APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS`` available dates are fetched in the
+# background.
+APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT", default=60
+)
+APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS = config(
+    "APPOINTMENTS_AVAILABILITY_PREFETCH_DAYS", default=3
+)
+
+#
+# SOAP
+#
+# Cache the WSDL documents (and the XSDs they import) on disk for this many seconds,
+# use ``0`` to disable caching. The cache file must be in a writable directory - the
+# default location of zeep (in the home directory) doesn't exist in the Docker image.
+SOAP_WSDL_CACHE_TIMEOUT = config("SOAP_WSDL_CACHE_TIMEOUT", default=24 * 60 * 60)
+SOAP_WSDL_CACHE_PATH = config(
+    "SOAP_WSDL_CACHE_PATH", default=os.path.join(BASE_DIR, "tmp", "zeep-cache.db")
+)
+
+#
+# StUF
+#
+# Documents larger than this number of bytes are streamed into the StUF-ZDS request
+# body in chunks, rather than being rendered into the XML message in memory.
+STUF_ZDS_STREAMING_THRESHOLD = config(
+    "STUF_ZDS_STREAMING_THRESHOLD", default=1024 * 1024
+)
+
+#
+# Prefill
+#
+# Cache the (encrypted) values retrieved by the prefill plugins for this many
+# seconds, use ``0`` to disable caching. The timeout can be overridden per plugin,
+# e.g. ``PREFILL_CACHE_PLUGIN_TIMEOUTS=haalcentraal=300,kvk-kvknumber=0``.
+PREFILL_CACHE_TIMEOUT = config("PREFILL_CACHE_TIMEOUT", default=0)
+PREFILL_CACHE_PLUGIN_TIMEOUTS = {
+    plugin_id.strip(): int(timeout)
+    for plugin_id, timeout in (
+        item.split("=", 1)
+        for item in config("PREFILL_CACHE_PLUGIN_TIMEOUTS", split=True, default=[])
+    )
+}
+
 #
 # DJANGO-CORS-MIDDLEWARE
 #
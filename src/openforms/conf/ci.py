@@ -31,6 +31,16 @@ CACHES.update(
     }
 )
 
+# tests modify the configuration models - do not use outdated in-memory copies
+CACHES["solo"]["OPTIONS"]["CHECK_INTERVAL"] = 0
+
+# tests mock the Catalogi API responses
+ZGW_CATALOGI_CACHE_TIMEOUT = 0
+# tests mock the appointment backends
+APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT = 0
+# tests mock the WSDL documents
+SOAP_WSDL_CACHE_TIMEOUT = 0
+
 # shut up logging
 LOGGING["loggers"].update(
     {
@@ -0,0 +1,90 @@
+"""
+Optional local index of BAG addresses.
+
+The address autocomplete looks up the street name and city of a postcode and house
+number. Rather than calling the BAG API for every (uncached) address, the addresses
+can be loaded from a BAG extract into a local table with the ``load_bag_addresses``
+management command. Addresses missing from the local index are still looked up with
+the BAG API.
+
+The extract is expected to be a CSV file with (at least) the ``openbareruimte``,
+``huisnummer``, ``postcode`` and ``woonplaats`` columns, like the address exports of
+NLExtract.
+"""
+import csv
+import logging
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+
+from django.db import transaction
+
+from .clients.bag import AddressResult
+from .models import BAGAddress
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+
+
+def normalize_postcode(postcode: str) -> str:
+    return postcode.replace(" ", "").upper()
+
+
+def lookup_local_address(postcode: str, house_number: str) -> AddressResult | None:
+    if not house_number.isdigit():
+        return None
+
+    address = (
+        BAGAddress.objects.filter(
+            postcode=normalize_postcode(postcode), house_number=int(house_number)
+        )
+        .values_list("street_name", "city")
+        .first()
+    )
+    if address is None:
+        return None
+    street_name, city = address
+    return AddressResult(street_name=street_name, city=city)
+
+
+def read_extract(file: TextIO, delimiter: str = ";") -> Iterator[BAGAddress]:
+    """
+    Read the addresses from a BAG extract, skipping invalid rows.
+
+    Multiple addresses share the same postcode and house number (e.g. with different
+    house letters) - these are all emitted, :func:`replace_addresses` only keeps the
+    first one.
+    """
+    for row in csv.DictReader(file, delimiter=delimiter):
+        postcode = normalize_postcode(row["postcode"] or "")
+        house_number = row["huisnummer"] or ""
+        if not postcode or not house_number.isdigit():
+            continue
+
+        yield BAGAddress(
+            postcode=postcode,
+            house_number=int(house_number),
+            street_name=row["openbareruimte"],
+            city=row["woonplaats"],
+        )
+
+
+@transaction.atomic
+def replace_addresses(addresses: Iterable[BAGAddress]) -> int:
+    """
+    Replace the contents of the local index with the given addresses.
+
+    Addresses with the same postcode and house number as an already loaded address
+    are skipped by the database, through the unique constraint.
+
+    :returns: the number of loaded addresses.
+    """
+    BAGAddress.objects.all().delete()
+
+    num_read = 0
+    addresses = iter(addresses)
+    while batch := list(islice(addresses, BATCH_SIZE)):
+        BAGAddress.objects.bulk_create(batch, ignore_conflicts=True)
+        num_read += len(batch)
+        logger.debug("Read %s BAG addresses so far", num_read)
+    return BAGAddress.objects.count()
@@ -16,6 +16,7 @@ from openforms.api.views.mixins import ListMixin
 from openforms.contrib.kadaster.clients.bag import AddressResult
 from openforms.submissions.api.permissions import AnyActiveSubmissionPermission
 
+from ..address_index import lookup_local_address
 from ..clients import get_bag_client, get_locatieserver_client
 from .serializers import (
     AddressSearchResultSerializer,
@@ -34,6 +35,8 @@ ADDRESS_AUTOCOMPLETE_CACHE_TIMEOUT = (
 
 
 def lookup_address(postcode: str, number: str) -> AddressResult | None:
+    if (address := lookup_local_address(postcode, number)) is not None:
+        return address
     with get_bag_client() as client:
         return client.get_address(postcode, number)
 
@@ -0,0 +1,25 @@
+from django.core.management import BaseCommand
+
+from ...address_index import read_extract, replace_addresses
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the addresses from a BAG extract (CSV) into the local address index, "
+        "replacing the existing addresses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="Path to the BAG extract CSV file.")
+        parser.add_argument(
+            "--delimiter",
+            default=";",
+            help="Column delimiter of the CSV file. Defaults to ';'.",
+        )
+
+    def handle(self, **options):
+        with open(options["file"], newline="", encoding="utf-8") as file:
+            num_loaded = replace_addresses(
+                read_extract(file, delimiter=options["delimiter"])
+            )
+        self.stdout.write(f"Loaded {num_loaded} addresses.")
@@ -0,0 +1,49 @@
+# Generated by Django 3.2.23 on 2026-10-18 07:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kadaster", "0004_alter_kadasterapiconfig_search_service"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BAGAddress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("postcode", models.CharField(max_length=6, verbose_name="postcode")),
+                (
+                    "house_number",
+                    models.PositiveIntegerField(verbose_name="house number"),
+                ),
+                (
+                    "street_name",
+                    models.CharField(max_length=100, verbose_name="street name"),
+                ),
+                ("city", models.CharField(max_length=100, verbose_name="city")),
+            ],
+            options={
+                "verbose_name": "BAG address",
+                "verbose_name_plural": "BAG addresses",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="bagaddress",
+            constraint=models.UniqueConstraint(
+                fields=("postcode", "house_number"),
+                include=("street_name", "city"),
+                name="unique_postcode_house_number",
+            ),
+        ),
+    ]
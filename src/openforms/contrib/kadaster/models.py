@@ -61,3 +61,32 @@ class KadasterApiConfig(SingletonModel):
 
     class Meta:
         verbose_name = _("Kadaster API configuration")
+
+
+class BAGAddress(models.Model):
+    """
+    Local index of the BAG addresses, loaded from a BAG extract.
+
+    The index is optional - when an address is not present, it is looked up with
+    the BAG API.
+    """
+
+    postcode = models.CharField(_("postcode"), max_length=6)
+    house_number = models.PositiveIntegerField(_("house number"))
+    street_name = models.CharField(_("street name"), max_length=100)
+    city = models.CharField(_("city"), max_length=100)
+
+    class Meta:
+        verbose_name = _("BAG address")
+        verbose_name_plural = _("BAG addresses")
+        constraints = [
+            # covering the street name and city allows index-only lookups
+            models.UniqueConstraint(
+                fields=["postcode", "house_number"],
+                include=["street_name", "city"],
+                name="unique_postcode_house_number",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.postcode} {self.house_number}"
@@ -0,0 +1,78 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..address_index import lookup_local_address
+from ..api.views import lookup_address
+from ..clients.bag import AddressResult
+from ..models import BAGAddress
+
+EXTRACT = """\
+openbareruimte;huisnummer;huisletter;huisnummertoevoeging;postcode;woonplaats
+Keizersgracht;117;;;1015CJ;Amsterdam
+Keizersgracht;117;A;;1015CJ;Amsterdam
+Keizersgracht;119;;;1015CJ;Amsterdam
+Ergens;;;;;Nergenshuizen
+"""
+
+
+class AddressIndexTests(TestCase):
+    def _load_extract(self, content: str) -> str:
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        path = Path(tempdir.name) / "extract.csv"
+        path.write_text(content)
+
+        stdout = StringIO()
+        call_command("load_bag_addresses", str(path), stdout=stdout)
+        return stdout.getvalue()
+
+    def test_load_extract(self):
+        BAGAddress.objects.create(
+            postcode="1000AA", house_number=1, street_name="Oud", city="Oud"
+        )
+
+        output = self._load_extract(EXTRACT)
+
+        self.assertEqual(output.strip(), "Loaded 2 addresses.")
+        self.assertQuerysetEqual(
+            BAGAddress.objects.order_by("house_number"),
+            [("1015CJ", 117), ("1015CJ", 119)],
+            transform=lambda address: (address.postcode, address.house_number),
+        )
+
+    def test_lookup_local_address(self):
+        self._load_extract(EXTRACT)
+
+        with self.subTest("found"):
+            address = lookup_local_address("1015 cj", "117")
+
+            self.assertEqual(
+                address, AddressResult(street_name="Keizersgracht", city="Amsterdam")
+            )
+
+        with self.subTest("not found"):
+            self.assertIsNone(lookup_local_address("1015CJ", "121"))
+
+        with self.subTest("invalid house number"):
+            self.assertIsNone(lookup_local_address("1015CJ", "117a"))
+
+    @patch("openforms.contrib.kadaster.api.views.get_bag_client")
+    def test_remote_lookup_skipped_for_local_addresses(self, m_get_bag_client):
+        self._load_extract(EXTRACT)
+
+        address = lookup_address("1015CJ", "119")
+
+        self.assertEqual(
+            address, AddressResult(street_name="Keizersgracht", city="Amsterdam")
+        )
+        m_get_bag_client.assert_not_called()
+
+        with self.subTest("fallback to BAG API"):
+            lookup_address("1015CJ", "121")
+
+            m_get_bag_client.assert_called_once_with()
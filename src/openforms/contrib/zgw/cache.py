@@ -0,0 +1,102 @@
+"""
+Shared cache for Catalogi API resources.
+
+Catalogi API resources (catalogi, informatieobjecttypen, statustypen, roltypen...) are
+configuration data that hardly ever changes, yet they are looked up during every
+registration. The responses are cached (per API root) for
+``settings.ZGW_CATALOGI_CACHE_TIMEOUT`` seconds.
+
+Expired entries are kept around for another ``settings.ZGW_CATALOGI_CACHE_STALE_TIMEOUT``
+seconds. While a single caller revalidates an expired entry, concurrent callers are
+served the stale data, and the stale data is used when the revalidation fails.
+
+Every API root has its own cache version - flushing the cache for an API root bumps
+the version, which invalidates all of its entries at once.
+"""
+import hashlib
+import logging
+import time
+from typing import Any, Callable, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_PREFIX = "zgw_catalogi"
+REVALIDATE_LOCK_TIMEOUT = 60  # seconds
+
+
+def _hash(value: str) -> str:
+    return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
+
+
+def _get_version_key(api_root: str) -> str:
+    return f"{CACHE_PREFIX}:version:{_hash(api_root)}"
+
+
+def _get_version(api_root: str) -> str:
+    version_key = _get_version_key(api_root)
+    if (version := cache.get(version_key)) is None:
+        cache.add(version_key, str(time.time_ns()), timeout=None)
+        version = cache.get(version_key, "")
+    return version
+
+
+def flush_catalogi_cache(api_root: str) -> None:
+    """
+    Invalidate all cached resources of the Catalogi API at ``api_root``.
+    """
+    cache.set(_get_version_key(api_root), str(time.time_ns()), timeout=None)
+
+
+def get_or_fetch(api_root: str, resource: str, fetch: Callable[[], T]) -> T:
+    """
+    Get the cached data of a Catalogi API resource, or fetch and cache it.
+
+    :param api_root: the API root of the Catalogi API service.
+    :param resource: the (relative) URL of the resource, including the query string.
+    :param fetch: callable performing the actual request(s) to the API.
+    """
+    timeout: int = settings.ZGW_CATALOGI_CACHE_TIMEOUT
+    if not timeout:
+        return fetch()
+
+    version = _get_version(api_root)
+    key = f"{CACHE_PREFIX}:{_hash(api_root)}:{version}:{_hash(resource)}"
+    entry: tuple[float, Any] | None = cache.get(key)
+
+    now = time.time()
+    if entry is not None:
+        fresh_until, data = entry
+        if now < fresh_until:
+            return data
+        # only a single caller revalidates the entry, the others use the stale data
+        if not cache.add(f"{key}:revalidate", True, timeout=REVALIDATE_LOCK_TIMEOUT):
+            return data
+
+    try:
+        data = fetch()
+    except requests.RequestException:
+        if entry is None:
+            raise
+        logger.warning(
+            "Could not revalidate Catalogi API resource %s, using stale data.",
+            resource,
+            exc_info=True,
+        )
+        return entry[1]
+    finally:
+        if entry is not None:
+            cache.delete(f"{key}:revalidate")
+
+    cache.set(
+        key,
+        (now + timeout, data),
+        timeout=timeout + settings.ZGW_CATALOGI_CACHE_STALE_TIMEOUT,
+    )
+    return data
@@ -1,7 +1,9 @@
 from typing import Callable
+from urllib.parse import urlencode
 
 from zgw_consumers_ext.api_client import NLXClient
 
+from ..cache import get_or_fetch
 from .utils import pagination_helper
 
 
@@ -21,31 +23,43 @@ def omschrijving_matcher(omschrijving: str):
 
 
 class CatalogiClient(NLXClient):
+    """
+    Catalogi API client.
+
+    The (read-only) resources are cached, see :mod:`openforms.contrib.zgw.cache`.
+    """
+
+    def _get_all(self, path: str) -> list[dict]:
+        def fetch():
+            response = self.get(path)
+            response.raise_for_status()
+            data = response.json()
+            all_data = pagination_helper(self, data)
+            return list(all_data)
+
+        return get_or_fetch(self.base_url, path, fetch)
+
+    def _get_results(self, path: str, query: dict[str, str]) -> list[dict]:
+        def fetch():
+            response = self.get(path, params=query)
+            response.raise_for_status()
+            return response.json()["results"]
+
+        resource = f"{path}?{urlencode(sorted(query.items()))}"
+        return get_or_fetch(self.base_url, resource, fetch)
+
     def get_all_catalogi(self) -> list[dict]:
         """
         List all available catalogi, consuming pagination if relevant.
         """
-        response = self.get("catalogussen")
-        response.raise_for_status()
-        data = response.json()
-        all_data = pagination_helper(self, data)
-        return list(all_data)
+        return self._get_all("catalogussen")
 
     def get_all_informatieobjecttypen(self) -> list[dict]:
-        response = self.get("informatieobjecttypen")
-        response.raise_for_status()
-        data = response.json()
-        all_data = pagination_helper(self, data)
-        return list(all_data)
+        return self._get_all("informatieobjecttypen")
 
     def list_statustypen(self, zaaktype: str) -> list[dict]:
         query = {"zaaktype": zaaktype}
-
-        response = self.get("statustypen", params=query)
-        response.raise_for_status()
-
-        results = response.json()["results"]
-        return results
+        return self._get_results("statustypen", query)
 
     def list_roltypen(
         self,
@@ -57,8 +71,5 @@ class CatalogiClient(NLXClient):
         if omschrijving_generiek:
             query["omschrijvingGeneriek"] = omschrijving_generiek
 
-        response = self.get("roltypen", params=query)
-        response.raise_for_status()
-
-        results = response.json()["results"]
+        results = self._get_results("roltypen", query)
         return matcher(results)
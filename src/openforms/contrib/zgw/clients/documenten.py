@@ -1,5 +1,7 @@
+import json
+import os
 from base64 import b64encode
-from typing import BinaryIO, Literal, TypeAlias
+from typing import BinaryIO, Iterator, Literal, TypeAlias
 
 from django.core.files.base import ContentFile
 
@@ -15,6 +17,63 @@ DocumentStatus: TypeAlias = Literal[
 ]
 
 
+# documents up to this size are base64 encoded in memory, larger documents are streamed
+STREAMING_THRESHOLD = 10 * 1024 * 1024  # 10 MiB
+STREAMING_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def _get_size(content: ContentFile | BinaryIO) -> int:
+    """
+    Get the number of bytes from the current position to the end of the content.
+    """
+    position = content.tell()
+    if hasattr(content, "size"):
+        return content.size - position
+    end = content.seek(0, os.SEEK_END)
+    content.seek(position)
+    return end - position
+
+
+class Base64JSONBody:
+    """
+    Iterable JSON request body with base64 encoded file content.
+
+    The file content is read and encoded chunk by chunk while the request body is
+    sent, so that the (encoded) file content is never fully held in memory. The
+    length of the body is known upfront, which allows ``requests`` to set the
+    ``Content-Length`` header rather than using a chunked transfer encoding.
+    """
+
+    def __init__(self, data: dict, key: str, content: BinaryIO, size: int):
+        self.content = content
+        self.start = content.tell()
+        # the base64 alphabet does not need escaping, so the encoded content can be
+        # placed between the (serialized) envelope as-is
+        envelope = json.dumps({**data, key: ""}).encode()
+        self.prefix, self.suffix = envelope[:-2], envelope[-2:]
+        self.size = size
+
+    def __len__(self) -> int:
+        encoded_size = 4 * -(-self.size // 3)
+        return len(self.prefix) + encoded_size + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        # support re-sending the body
+        self.content.seek(self.start)
+        yield self.prefix
+        remainder = b""
+        while chunk := self.content.read(STREAMING_CHUNK_SIZE):
+            chunk = remainder + chunk
+            # file objects may return less than requested - only encode whole groups
+            # of 3 bytes so no padding ends up in the middle of the output
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            yield b64encode(chunk[:cutoff])
+        if remainder:
+            yield b64encode(remainder)
+        yield self.suffix
+
+
 class DocumentenClient(NLXClient):
     def create_document(
         self,
@@ -32,8 +91,7 @@ class DocumentenClient(NLXClient):
     ):
         assert author, "author must be a non-empty string"
         today = get_today()
-        file_content = content.read()
-        base64_body = b64encode(file_content).decode()
+        size = _get_size(content)
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -42,20 +100,25 @@ class DocumentenClient(NLXClient):
             "auteur": author,
             "taal": language,
             "formaat": format,
-            "inhoud": base64_body,
             "status": status,
             "bestandsnaam": filename,
             "beschrijving": description,
             "indicatieGebruiksrecht": False,
-            "bestandsomvang": (
-                content.size if hasattr(content, "size") else len(file_content)
-            ),
+            "bestandsomvang": size,
         }
 
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        if size > STREAMING_THRESHOLD:
+            response = self.post(
+                "enkelvoudiginformatieobjecten",
+                data=Base64JSONBody(data, key="inhoud", content=content, size=size),
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            data["inhoud"] = b64encode(content.read()).decode()
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
         response.raise_for_status()
 
         return response.json()
@@ -0,0 +1,104 @@
+from django.test import SimpleTestCase, override_settings
+
+import requests
+import requests_mock
+from freezegun import freeze_time
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..cache import flush_catalogi_cache
+from ..clients import CatalogiClient
+
+STATUSTYPEN_URL = "https://catalogi.nl/api/v1/statustypen"
+ZAAKTYPE = "https://catalogi.nl/api/v1/zaaktypen/1"
+
+
+@override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=60, ZGW_CATALOGI_CACHE_STALE_TIMEOUT=3600)
+class CatalogiCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.requests_mock = requests_mock.Mocker()
+        self.requests_mock.start()
+        self.addCleanup(self.requests_mock.stop)
+
+        self.client = CatalogiClient("https://catalogi.nl/api/v1/")
+
+    def _mock_statustypen(self, omschrijving: str = "Ontvangen", **kwargs):
+        self.requests_mock.get(
+            STATUSTYPEN_URL,
+            json={"results": [{"omschrijving": omschrijving}]},
+            **kwargs,
+        )
+
+    def test_resources_cached(self):
+        self._mock_statustypen()
+
+        with self.client:
+            statustypen1 = self.client.list_statustypen(ZAAKTYPE)
+            statustypen2 = self.client.list_statustypen(ZAAKTYPE)
+            other_statustypen = self.client.list_statustypen(f"{ZAAKTYPE}-other")
+
+        self.assertEqual(statustypen1, [{"omschrijving": "Ontvangen"}])
+        self.assertEqual(statustypen1, statustypen2)
+        self.assertEqual(other_statustypen, [{"omschrijving": "Ontvangen"}])
+        self.assertEqual(len(self.requests_mock.request_history), 2)
+
+    def test_flush(self):
+        self._mock_statustypen()
+        with self.client:
+            self.client.list_statustypen(ZAAKTYPE)
+
+        flush_catalogi_cache("https://catalogi.nl/api/v1/")
+        self._mock_statustypen("Afgehandeld")
+
+        with self.client:
+            statustypen = self.client.list_statustypen(ZAAKTYPE)
+
+        self.assertEqual(statustypen, [{"omschrijving": "Afgehandeld"}])
+        self.assertEqual(len(self.requests_mock.request_history), 2)
+
+    def test_expired_data_revalidated(self):
+        with freeze_time("2023-10-01T12:00:00Z") as frozen_time:
+            self._mock_statustypen()
+            with self.client:
+                self.client.list_statustypen(ZAAKTYPE)
+
+            frozen_time.tick(61)
+            self._mock_statustypen("Afgehandeld")
+            with self.client:
+                statustypen = self.client.list_statustypen(ZAAKTYPE)
+
+        self.assertEqual(statustypen, [{"omschrijving": "Afgehandeld"}])
+
+    def test_stale_data_used_if_revalidation_fails(self):
+        with freeze_time("2023-10-01T12:00:00Z") as frozen_time:
+            self._mock_statustypen()
+            with self.client:
+                self.client.list_statustypen(ZAAKTYPE)
+
+            frozen_time.tick(61)
+            self._mock_statustypen(status_code=503)
+            with self.client:
+                statustypen = self.client.list_statustypen(ZAAKTYPE)
+
+        self.assertEqual(statustypen, [{"omschrijving": "Ontvangen"}])
+
+    def test_errors_without_cached_data_propagate(self):
+        self.requests_mock.get(STATUSTYPEN_URL, exc=requests.ConnectTimeout)
+
+        with self.client, self.assertRaises(requests.ConnectTimeout):
+            self.client.list_statustypen(ZAAKTYPE)
+
+    @override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=0)
+    def test_caching_disabled(self):
+        self._mock_statustypen()
+
+        with self.client:
+            self.client.list_statustypen(ZAAKTYPE)
+            self.client.list_statustypen(ZAAKTYPE)
+
+        self.assertEqual(len(self.requests_mock.request_history), 2)
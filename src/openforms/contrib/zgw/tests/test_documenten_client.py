@@ -0,0 +1,93 @@
+import json
+from base64 import b64decode
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+
+import requests_mock
+
+from ..clients.documenten import DocumentenClient
+
+
+class ShortReadsIO(BytesIO):
+    """
+    Stream returning less than requested, like remote storages may do.
+    """
+
+    def read(self, size=-1):
+        return super().read(min(size, 2) if size > 0 else size)
+
+
+@patch("openforms.contrib.zgw.clients.documenten.get_today", return_value="2023-10-01")
+class CreateDocumentTests(TestCase):
+    def _create_document(self, content):
+        client = DocumentenClient("https://documenten.nl/api/v1/")
+        with client, requests_mock.Mocker() as m:
+            m.post(
+                "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+                status_code=201,
+                json={"url": "https://documenten.nl/api/v1/eio/1"},
+            )
+            result = client.create_document(
+                informatieobjecttype="https://catalogi.nl/api/v1/iot/1",
+                bronorganisatie="000000000",
+                title="Document",
+                author="Aanvrager",
+                language="nld",
+                format="text/plain",
+                content=content,
+                status="definitief",
+                filename="document.txt",
+            )
+
+        self.assertEqual(result, {"url": "https://documenten.nl/api/v1/eio/1"})
+        return m.last_request
+
+    def test_small_document_encoded_in_memory(self, m_today):
+        request = self._create_document(BytesIO(b"some content"))
+
+        data = request.json()
+        self.assertEqual(b64decode(data["inhoud"]), b"some content")
+        self.assertEqual(data["bestandsomvang"], 12)
+        self.assertEqual(data["creatiedatum"], "2023-10-01")
+
+    @patch("openforms.contrib.zgw.clients.documenten.STREAMING_THRESHOLD", new=10)
+    @patch("openforms.contrib.zgw.clients.documenten.STREAMING_CHUNK_SIZE", new=3)
+    def test_large_document_streamed(self, m_today):
+        content = BytesIO(b"some larger content")
+
+        request = self._create_document(content)
+
+        body = b"".join(request.body)
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        data = json.loads(body)
+        self.assertEqual(b64decode(data["inhoud"]), b"some larger content")
+        self.assertEqual(data["bestandsomvang"], 19)
+        self.assertEqual(data["titel"], "Document")
+        # the body can be sent again, e.g. when retrying
+        self.assertEqual(b"".join(request.body), body)
+
+    @patch("openforms.contrib.zgw.clients.documenten.STREAMING_THRESHOLD", new=10)
+    def test_large_document_streamed_with_short_reads(self, m_today):
+        request = self._create_document(ShortReadsIO(b"some larger content"))
+
+        body = b"".join(request.body)
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        data = json.loads(body)
+        self.assertEqual(b64decode(data["inhoud"]), b"some larger content")
+
+    @patch("openforms.contrib.zgw.clients.documenten.STREAMING_THRESHOLD", new=10)
+    def test_large_document_streamed_from_current_position(self, m_today):
+        content = ContentFile(b"header: some larger content")
+        content.seek(8)
+
+        request = self._create_document(content)
+
+        body = b"".join(request.body)
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        data = json.loads(body)
+        self.assertEqual(b64decode(data["inhoud"]), b"some larger content")
+        self.assertEqual(data["bestandsomvang"], 19)
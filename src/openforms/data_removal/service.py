@@ -0,0 +1,97 @@
+"""
+Remove (sensitive) submission data in bounded batches.
+
+Deleting or cleaning all matching submissions with a single query makes Django's
+deletion collector load every related object in memory and keeps the affected rows
+locked for the duration of the whole operation. Instead, the submissions are processed
+in batches of primary keys, where every batch is handled in its own (short)
+transaction. Interrupted runs can simply be started again - the submissions that were
+already processed no longer match the removal criteria.
+"""
+import logging
+from typing import Iterator, List
+
+from django.db import transaction
+
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+    SubmissionStep,
+    SubmissionValueVariable,
+)
+from openforms.submissions.query import SubmissionQuerySet
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+
+def iter_pk_batches(
+    queryset: SubmissionQuerySet, batch_size: int = BATCH_SIZE
+) -> Iterator[List[int]]:
+    """
+    Iterate over the primary keys of the queryset, in ascending batches.
+
+    The batches are determined with keyset pagination rather than offsets, so that
+    processing (e.g. deleting) the records of a batch does not shift the next batch.
+    """
+    last_pk = 0
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
+
+
+def _delete_batch(pks: List[int]) -> None:
+    # Delete the related records with the most rows first, from the leaves up. Every
+    # delete only involves the (bounded) records of the batch, and the file attachment
+    # contents are removed in bulk once the transaction is committed.
+    SubmissionFileAttachment.objects.filter(
+        submission_step__submission__in=pks
+    ).delete()
+    SubmissionValueVariable.objects.filter(submission__in=pks).delete()
+    SubmissionStep.objects.filter(submission__in=pks).delete()
+    SubmissionReport.objects.filter(submission__in=pks).delete()
+    # the remaining relations are handled by the regular cascade
+    Submission.objects.filter(pk__in=pks).delete()
+
+
+def delete_submissions_in_batches(
+    queryset: SubmissionQuerySet, description: str, batch_size: int = BATCH_SIZE
+) -> int:
+    """
+    Delete the submissions matching the queryset in batches.
+
+    :returns: the number of deleted submissions.
+    """
+    num_deleted = 0
+    for pks in iter_pk_batches(queryset, batch_size=batch_size):
+        with transaction.atomic():
+            _delete_batch(pks)
+        num_deleted += len(pks)
+        logger.info("Deleted %s %s submissions so far", num_deleted, description)
+    return num_deleted
+
+
+def remove_sensitive_data_in_batches(
+    queryset: SubmissionQuerySet, description: str, batch_size: int = BATCH_SIZE
+) -> int:
+    """
+    Remove the sensitive data of the submissions matching the queryset in batches.
+
+    :returns: the number of cleaned submissions.
+    """
+    num_cleaned = 0
+    for pks in iter_pk_batches(queryset, batch_size=batch_size):
+        with transaction.atomic():
+            Submission.objects.filter(pk__in=pks).remove_sensitive_data()
+        num_cleaned += len(pks)
+        logger.info("Anonymized %s %s submissions so far", num_cleaned, description)
+    return num_cleaned
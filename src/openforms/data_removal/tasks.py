@@ -1,14 +1,16 @@
-import itertools
 import logging
 from datetime import timedelta
 
 from django.db.models import F
 
+from celery.exceptions import SoftTimeLimitExceeded
+
 from openforms.celery import app
 from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
 
 from .constants import RemovalMethods
+from .service import delete_submissions_in_batches, remove_sensitive_data_in_batches
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,16 @@ logger = logging.getLogger(__name__)
 @app.task(ignore_result=True)
 def delete_submissions():
     logger.debug("Deleting submissions")
+    try:
+        _delete_submissions()
+    except SoftTimeLimitExceeded:
+        # every batch is committed separately, so a new task continues where this one
+        # stopped
+        logger.warning("Time limit exceeded while deleting submissions, continuing")
+        delete_submissions.delay()
+
 
+def _delete_submissions() -> None:
     successful_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "successful_submissions_removal_limit",
         method_field="successful_submissions_removal_method",
@@ -28,7 +39,7 @@ def delete_submissions():
     logger.info(
         "Deleting %s successful submissions", successful_submissions_to_delete.count()
     )
-    successful_submissions_to_delete.delete()
+    delete_submissions_in_batches(successful_submissions_to_delete, "successful")
 
     incomplete_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "incomplete_submissions_removal_limit",
@@ -44,7 +55,7 @@ def delete_submissions():
     logger.info(
         "Deleting %s incomplete submissions", incomplete_submissions_to_delete.count()
     )
-    incomplete_submissions_to_delete.delete()
+    delete_submissions_in_batches(incomplete_submissions_to_delete, "incomplete")
 
     errored_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "errored_submissions_removal_limit",
@@ -58,7 +69,7 @@ def delete_submissions():
     logger.info(
         "Deleting %s errored submissions", errored_submissions_to_delete.count()
     )
-    errored_submissions_to_delete.delete()
+    delete_submissions_in_batches(errored_submissions_to_delete, "errored")
 
     other_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "all_submissions_removal_limit"
@@ -69,13 +80,22 @@ def delete_submissions():
         "Deleting %s other submissions regardless of registration",
         other_submissions_to_delete.count(),
     )
-    other_submissions_to_delete.delete()
+    delete_submissions_in_batches(other_submissions_to_delete, "other")
 
 
 @app.task(ignore_result=True)
 def make_sensitive_data_anonymous() -> None:
     logger.debug("Making sensitive submission data anonymous")
+    try:
+        _make_sensitive_data_anonymous()
+    except SoftTimeLimitExceeded:
+        # every batch is committed separately, so a new task continues where this one
+        # stopped
+        logger.warning("Time limit exceeded while anonymizing submissions, continuing")
+        make_sensitive_data_anonymous.delay()
+
 
+def _make_sensitive_data_anonymous() -> None:
     successful_submissions = Submission.objects.annotate_removal_fields(
         "successful_submissions_removal_limit",
         method_field="successful_submissions_removal_method",
@@ -122,9 +142,6 @@ def make_sensitive_data_anonymous() -> None:
         errored_submissions.count(),
     )
 
-    for submission in itertools.chain(
-        successful_submissions.iterator(),
-        incomplete_submissions.iterator(),
-        errored_submissions.iterator(),
-    ):
-        submission.remove_sensitive_data()
+    remove_sensitive_data_in_batches(successful_submissions, "successful")
+    remove_sensitive_data_in_batches(incomplete_submissions, "incomplete")
+    remove_sensitive_data_in_batches(errored_submissions, "errored")
@@ -0,0 +1,125 @@
+import os
+from unittest.mock import patch
+
+from django.test import TestCase, TransactionTestCase
+
+from celery.exceptions import SoftTimeLimitExceeded
+from privates.test import temp_private_root
+
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+    SubmissionStep,
+)
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionFileAttachmentFactory,
+    SubmissionReportFactory,
+)
+
+from ..service import (
+    delete_submissions_in_batches,
+    iter_pk_batches,
+    remove_sensitive_data_in_batches,
+)
+from ..tasks import delete_submissions, make_sensitive_data_anonymous
+
+
+class BatchTests(TestCase):
+    def test_iter_pk_batches(self):
+        submissions = SubmissionFactory.create_batch(5)
+        pks = [submission.pk for submission in submissions]
+
+        batches = list(iter_pk_batches(Submission.objects.all(), batch_size=2))
+
+        self.assertEqual(batches, [pks[:2], pks[2:4], pks[4:]])
+
+    def test_remove_sensitive_data_in_batches(self):
+        submissions = SubmissionFactory.create_batch(
+            3,
+            auth_info__value="123456782",
+            co_sign_data={
+                "plugin": "digid",
+                "identifier": "123456782",
+                "representation": "Bar",
+                "fields": {"voornaam": "Foo"},
+            },
+        )
+        not_matching = SubmissionFactory.create(auth_info__value="123456782")
+
+        num_cleaned = remove_sensitive_data_in_batches(
+            Submission.objects.exclude(pk=not_matching.pk), "test", batch_size=2
+        )
+
+        self.assertEqual(num_cleaned, 3)
+        for submission in submissions:
+            with self.subTest(submission=submission):
+                submission.refresh_from_db()
+
+                self.assertTrue(submission._is_cleaned)
+                self.assertEqual(submission.auth_info.value, "")
+                self.assertEqual(
+                    submission.co_sign_data,
+                    {
+                        "plugin": "digid",
+                        "identifier": "",
+                        "representation": "Bar",
+                        "fields": {},
+                    },
+                )
+        not_matching.refresh_from_db()
+        self.assertFalse(not_matching._is_cleaned)
+        self.assertEqual(not_matching.auth_info.value, "123456782")
+
+    @patch("openforms.data_removal.tasks.delete_submissions.delay")
+    @patch(
+        "openforms.data_removal.tasks._delete_submissions",
+        side_effect=SoftTimeLimitExceeded,
+    )
+    def test_delete_continues_after_soft_time_limit(self, m_delete, m_delay):
+        delete_submissions()
+
+        m_delay.assert_called_once_with()
+
+    @patch("openforms.data_removal.tasks.make_sensitive_data_anonymous.delay")
+    @patch(
+        "openforms.data_removal.tasks._make_sensitive_data_anonymous",
+        side_effect=SoftTimeLimitExceeded,
+    )
+    def test_anonymize_continues_after_soft_time_limit(self, m_anonymize, m_delay):
+        make_sensitive_data_anonymous()
+
+        m_delay.assert_called_once_with()
+
+
+@temp_private_root()
+class DeleteInBatchesTests(TransactionTestCase):
+    def test_related_records_and_files_are_deleted(self):
+        attachments = SubmissionFileAttachmentFactory.create_batch(3)
+        reports = [
+            SubmissionReportFactory.create(
+                submission=attachment.submission_step.submission
+            )
+            for attachment in attachments
+        ]
+        kept = SubmissionFileAttachmentFactory.create()
+        paths = [attachment.content.path for attachment in attachments] + [
+            report.content.path for report in reports
+        ]
+
+        num_deleted = delete_submissions_in_batches(
+            Submission.objects.exclude(pk=kept.submission_step.submission.pk),
+            "test",
+            batch_size=2,
+        )
+
+        self.assertEqual(num_deleted, 3)
+        self.assertEqual(Submission.objects.get(), kept.submission_step.submission)
+        self.assertEqual(SubmissionStep.objects.get(), kept.submission_step)
+        self.assertEqual(SubmissionFileAttachment.objects.get(), kept)
+        self.assertFalse(SubmissionReport.objects.exists())
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertFalse(os.path.exists(path))
+        self.assertTrue(os.path.exists(kept.content.path))
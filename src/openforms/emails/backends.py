@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.db import transaction
+
+from django_yubin.backends import QueuedEmailBackend
+
+from .dispatch import queue_message, schedule_dispatch
+
+
+class BatchedQueuedEmailBackend(QueuedEmailBackend):
+    """
+    Queue the messages with django-yubin, to be sent in batches.
+
+    Falls back to a task per message when ``settings.EMAIL_DISPATCH_DELAY`` is ``0``.
+    See :mod:`openforms.emails.dispatch`.
+    """
+
+    def send_messages(self, email_messages):
+        if not settings.EMAIL_DISPATCH_DELAY:
+            return super().send_messages(email_messages)
+
+        num_queued = sum(queue_message(message) for message in email_messages)
+        if num_queued:
+            transaction.on_commit(schedule_dispatch)
+        return num_queued
@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Sequence, Union
 
 from django.conf import settings
 from django.core.mail import send_mail
+from django.utils.module_loading import import_string
 from django.utils.translation import gettext as _
 
 
@@ -26,6 +27,14 @@ class MailCheckResult:
         return ", ".join(self.recipients)
 
 
+def uses_yubin(backend: str) -> bool:
+    try:
+        from django_yubin.backends import QueuedEmailBackend
+    except ImportError:
+        return False
+    return issubclass(import_string(backend), QueuedEmailBackend)
+
+
 def check_email_backend(recipients: Sequence[str]) -> MailCheckResult:
     if not recipients:
         raise ValueError("recipients must be a list of email-addresses")
@@ -39,9 +48,9 @@ def check_email_backend(recipients: Sequence[str]) -> MailCheckResult:
         success=False,
         backend=settings.EMAIL_BACKEND,
     )
-    uses_yubin = "yubin" in result.backend
+    yubin_detected = uses_yubin(result.backend)
 
-    if uses_yubin:
+    if yubin_detected:
         try:
             from django_yubin import settings as yubin_settings
 
@@ -86,7 +95,7 @@ def check_email_backend(recipients: Sequence[str]) -> MailCheckResult:
             )
             % {"recipients": result.recipients_str}
         )
-        if uses_yubin:
+        if yubin_detected:
             result.feedback.append(
                 _(
                     "If the message doesn't arrive check the Django-yubin queue and cronjob."
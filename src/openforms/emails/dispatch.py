@@ -0,0 +1,273 @@
+"""
+Deliver the queued emails in batches.
+
+Out of the box, django-yubin schedules a Celery task for every queued message, which
+opens its own connection to the SMTP server. When many submissions complete at the same
+time (e.g. when a form closes), this results in thousands of small tasks and
+connections.
+
+The :class:`openforms.emails.backends.BatchedQueuedEmailBackend` queues the messages
+without scheduling a task per message. Instead, the dispatch of the queued messages is
+scheduled at most once every ``settings.EMAIL_DISPATCH_DELAY`` seconds. Every dispatch
+sends a batch of at most ``settings.EMAIL_DISPATCH_BATCH_SIZE`` messages over a single
+SMTP connection, and schedules the next batch if there are more queued messages.
+
+Messages to the same provider (the domain of the first recipient) are throttled to
+``settings.EMAIL_DISPATCH_RATE_LIMIT`` messages per second, which can be overridden per
+provider with ``settings.EMAIL_DISPATCH_PROVIDER_RATE_LIMITS``. The messages of a batch
+are interleaved by provider, so a throttled provider holds up the others as little as
+possible.
+
+A batch is claimed by marking its messages as "in process" in a short transaction.
+The messages are then sent outside of the transaction, and the status of every
+message is committed right after sending it - a crash or time limit in the middle of
+a batch doesn't revert the status of the messages that were sent already. The
+messages that are left "in process" for longer than the time limit of the task are
+queued again by :func:`requeue_stuck_messages`.
+
+The status changes of the messages go through the django-yubin models, so the email
+status logevents are still created per submission.
+"""
+import logging
+import time
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import chain, zip_longest
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from django_yubin import _set_message_test_mode, settings as yubin_settings
+from django_yubin.models import Blacklist, Message
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "emails:dispatch_scheduled"
+
+
+@dataclass
+class BatchMetrics:
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    duration: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return self.sent + self.failed + self.skipped
+
+    @property
+    def throughput(self) -> float:
+        """
+        The number of sent messages per second.
+        """
+        return self.sent / self.duration if self.duration else 0.0
+
+
+def queue_message(email_message: EmailMessage) -> bool:
+    """
+    Queue the message in django-yubin, without scheduling a task to send it.
+
+    Mirrors :func:`django_yubin.queue_email_message`.
+    """
+    if yubin_settings.MAILER_TEST_MODE and yubin_settings.MAILER_TEST_EMAIL:
+        email_message = _set_message_test_mode(
+            email_message, yubin_settings.MAILER_TEST_EMAIL
+        )
+
+    if not email_message.recipients():
+        return False
+
+    message = Message.objects.create(
+        to_address=",".join(email_message.to),
+        cc_address=",".join(email_message.cc),
+        bcc_address=",".join(email_message.bcc),
+        from_address=email_message.from_email,
+        subject=email_message.subject,
+        message_data=email_message.message().as_string(),
+        storage=yubin_settings.MAILER_STORAGE_BACKEND,
+    )
+    message.mark_as(Message.STATUS_QUEUED, "Enqueued for batched delivery.")
+    return True
+
+
+def schedule_dispatch() -> None:
+    """
+    Schedule the dispatch of the queued messages, unless it's scheduled already.
+    """
+    from .tasks import dispatch_queued_emails
+
+    delay: int = settings.EMAIL_DISPATCH_DELAY
+    if cache.add(CACHE_KEY, True, timeout=delay):
+        dispatch_queued_emails.apply_async(countdown=delay)
+
+
+def get_provider(message: Message) -> str:
+    recipients = message.recipients()
+    return recipients[0].rpartition("@")[2].lower() if recipients else ""
+
+
+class Throttle:
+    """
+    Limit the number of messages sent to each provider per second.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.clock = clock
+        self.sleep = sleep
+        self._next_send_at: dict[str, float] = {}
+
+    def wait(self, provider: str) -> None:
+        rate_limit: float = settings.EMAIL_DISPATCH_PROVIDER_RATE_LIMITS.get(
+            provider, settings.EMAIL_DISPATCH_RATE_LIMIT
+        )
+        if not rate_limit:
+            return
+
+        now = self.clock()
+        if (next_send_at := self._next_send_at.get(provider, now)) > now:
+            self.sleep(next_send_at - now)
+            now = next_send_at
+        self._next_send_at[provider] = now + 1 / rate_limit
+
+
+def _interleave_providers(messages: list[Message]) -> list[Message]:
+    by_provider: dict[str, list[Message]] = defaultdict(list)
+    for message in messages:
+        by_provider[get_provider(message)].append(message)
+    rounds = zip_longest(*by_provider.values())
+    return [message for message in chain.from_iterable(rounds) if message is not None]
+
+
+def _claim_batch(batch_size: int) -> list[Message]:
+    with transaction.atomic():
+        messages = list(
+            Message.objects.filter(status=Message.STATUS_QUEUED)
+            .select_for_update(skip_locked=True)
+            .order_by("date_enqueued", "pk")[:batch_size]
+        )
+        for message in messages:
+            message.mark_as(Message.STATUS_IN_PROCESS, "Trying to send the message.")
+    return messages
+
+
+def requeue_stuck_messages() -> int:
+    """
+    Queue the messages again that are "in process" for longer than the time limit of
+    the dispatch task, e.g. because the worker crashed in the middle of a batch.
+
+    :returns: the number of queued messages.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+    messages = (
+        Message.objects.filter(status=Message.STATUS_IN_PROCESS)
+        .annotate(
+            claimed_at=Max("log__date", filter=Q(log__action=Message.STATUS_IN_PROCESS))
+        )
+        .filter(claimed_at__lt=cutoff)
+    )
+    num_requeued = 0
+    for message in messages:
+        logger.warning("Queueing the email message %s again", message.pk)
+        message.mark_as(
+            Message.STATUS_QUEUED, "Queued again, sending it did not complete."
+        )
+        num_requeued += 1
+    return num_requeued
+
+
+def dispatch_batch(batch_size: int, throttle: Throttle | None = None) -> BatchMetrics:
+    """
+    Send a batch of queued messages over a single connection.
+
+    Like :func:`django_yubin.engine.send_db_message`, blacklisted recipients are
+    skipped, messages are discarded when sending is paused and failures are recorded
+    on the message, so that django-yubin can retry them.
+    """
+    throttle = throttle or Throttle()
+    metrics = BatchMetrics()
+    start = time.perf_counter()
+
+    messages = _claim_batch(batch_size)
+    if not messages:
+        return metrics
+
+    blacklist = set(
+        Blacklist.objects.filter(
+            email__in=[
+                recipient for message in messages for recipient in message.recipients()
+            ]
+        ).values_list("email", flat=True)
+    )
+
+    connection = get_connection(backend=yubin_settings.USE_BACKEND)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.exception("Could not open the connection to send the emails")
+        for message in messages:
+            message.mark_as(Message.STATUS_FAILED, str(exc))
+        metrics.failed = len(messages)
+        metrics.duration = time.perf_counter() - start
+        return metrics
+
+    try:
+        for message in _interleave_providers(messages):
+            recipients = message.recipients()
+            if blacklist.intersection(recipients):
+                msg = "Not sending due blacklisted email in: %s" % recipients
+                logger.info(msg)
+                message.mark_as(Message.STATUS_BLACKLISTED, msg)
+                metrics.skipped += 1
+                continue
+
+            if yubin_settings.PAUSE_SEND:
+                msg = "Sending is paused, discarding the email."
+                logger.info(msg)
+                message.mark_as(Message.STATUS_DISCARDED, msg)
+                metrics.skipped += 1
+                continue
+
+            throttle.wait(get_provider(message))
+            try:
+                connection.send_messages([message.get_email_message()])
+            except Exception as exc:
+                logger.exception(
+                    "Message sending has failed", extra={"email_message": message}
+                )
+                message.mark_as(Message.STATUS_FAILED, str(exc))
+                metrics.failed += 1
+                # the connection may be broken, start over with a new one
+                connection.close()
+                with suppress(Exception):
+                    connection.open()
+            else:
+                message.mark_as(Message.STATUS_SENT, f"Message sent {message}")
+                metrics.sent += 1
+    finally:
+        connection.close()
+
+    metrics.duration = time.perf_counter() - start
+    logger.info(
+        "Dispatched a batch of %d email(s) in %.3fs: %d sent (%.1f/s), %d failed, "
+        "%d skipped",
+        metrics.size,
+        metrics.duration,
+        metrics.sent,
+        metrics.throughput,
+        metrics.failed,
+        metrics.skipped,
+        extra={"batch_metrics": metrics},
+    )
+    return metrics
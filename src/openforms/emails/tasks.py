@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from datetime import timedelta
 
 from django.conf import settings
@@ -11,6 +12,7 @@ from openforms.celery import app
 from openforms.config.models import GlobalConfiguration
 from openforms.logging.models import TimelineLogProxy
 
+from .dispatch import dispatch_batch, requeue_stuck_messages
 from .utils import send_mail_html
 
 
@@ -50,3 +52,20 @@ def send_email_digest() -> None:
         settings.DEFAULT_FROM_EMAIL,
         recipients,
     )
+
+
+@app.task
+def dispatch_queued_emails() -> dict:
+    """
+    Send a batch of the queued emails and schedule the next batch if it was full.
+
+    Sending a single batch per task bounds the duration of the task, even when the
+    messages are throttled. The messages of which the sending got interrupted are
+    queued again first.
+    """
+    requeue_stuck_messages()
+    batch_size: int = settings.EMAIL_DISPATCH_BATCH_SIZE
+    metrics = dispatch_batch(batch_size)
+    if metrics.size >= batch_size:
+        dispatch_queued_emails.delay()
+    return {**asdict(metrics), "throughput": metrics.throughput}
@@ -0,0 +1,250 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from django_yubin.models import Blacklist, Message
+from freezegun import freeze_time
+
+from openforms.logging.models import TimelineLogProxy
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ..constants import (
+    X_OF_CONTENT_TYPE_HEADER,
+    X_OF_CONTENT_UUID_HEADER,
+    X_OF_EVENT_HEADER,
+    EmailContentTypeChoices,
+    EmailEventChoices,
+)
+from ..dispatch import (
+    Throttle,
+    _claim_batch,
+    _interleave_providers,
+    dispatch_batch,
+    queue_message,
+)
+from ..tasks import dispatch_queued_emails
+from ..utils import send_mail_html
+
+LOCMEM_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+
+class WorkerCrashed(BaseException):
+    pass
+
+
+def _queue(*recipients: str, **headers: str) -> None:
+    for recipient in recipients:
+        queue_message(
+            EmailMessage(
+                "Subject", "Body", "foo@sender.com", [recipient], headers=headers
+            )
+        )
+
+
+@override_settings(
+    EMAIL_BACKEND="openforms.emails.backends.BatchedQueuedEmailBackend",
+    EMAIL_DISPATCH_DELAY=5,
+    EMAIL_DISPATCH_BATCH_SIZE=100,
+    EMAIL_DISPATCH_RATE_LIMIT=0,
+    EMAIL_DISPATCH_PROVIDER_RATE_LIMITS={},
+)
+@patch("django_yubin.settings.USE_BACKEND", LOCMEM_BACKEND)
+class BatchedDispatchTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    @patch("openforms.emails.tasks.dispatch_queued_emails.apply_async")
+    @patch("django_yubin.tasks.send_email.delay")
+    def test_backend_schedules_a_single_dispatch(self, mock_send_email, mock_dispatch):
+        with self.captureOnCommitCallbacks(execute=True):
+            for recipient in ("foo@example.com", "bar@example.com"):
+                send_mail_html("Subject", "<p>Body</p>", "foo@sender.com", [recipient])
+
+        mock_send_email.assert_not_called()
+        mock_dispatch.assert_called_once_with(countdown=5)
+        self.assertEqual(
+            Message.objects.filter(status=Message.STATUS_QUEUED).count(), 2
+        )
+
+    @override_settings(EMAIL_DISPATCH_DELAY=0)
+    @patch("openforms.emails.tasks.dispatch_queued_emails.apply_async")
+    @patch("django_yubin.tasks.send_email.delay")
+    def test_backend_without_batching(self, mock_send_email, mock_dispatch):
+        with self.captureOnCommitCallbacks(execute=True):
+            send_mail_html("Subject", "<p>Body</p>", "foo@sender.com", ["a@b.nl"])
+
+        mock_send_email.assert_called_once()
+        mock_dispatch.assert_not_called()
+
+    def test_batch_is_sent_over_a_single_connection(self):
+        _queue("a@example.com", "b@example.com", "c@example.nl")
+
+        with patch(
+            "openforms.emails.dispatch.get_connection",
+            wraps=mail.get_connection,
+        ) as mock_get_connection:
+            metrics = dispatch_batch(batch_size=100)
+
+        mock_get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual((metrics.sent, metrics.failed, metrics.skipped), (3, 0, 0))
+        self.assertGreater(metrics.throughput, 0)
+        self.assertFalse(Message.objects.exclude(status=Message.STATUS_SENT).exists())
+
+    def test_batch_size(self):
+        _queue("a@example.com", "b@example.com", "c@example.com")
+
+        metrics = dispatch_batch(batch_size=2)
+
+        self.assertEqual(metrics.sent, 2)
+        self.assertEqual(
+            Message.objects.filter(status=Message.STATUS_QUEUED).count(), 1
+        )
+
+    def test_blacklisted_and_failed_messages(self):
+        Blacklist.objects.create(email="blocked@example.com")
+        _queue("blocked@example.com", "fails@example.com", "ok@example.com")
+
+        def send_messages(messages):
+            if messages[0].to == ["fails@example.com"]:
+                raise Exception("Connection reset")
+            return len(messages)
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=send_messages,
+        ):
+            metrics = dispatch_batch(batch_size=100)
+
+        self.assertEqual((metrics.sent, metrics.failed, metrics.skipped), (1, 1, 1))
+        statuses = dict(Message.objects.values_list("to_address", "status"))
+        self.assertEqual(
+            statuses,
+            {
+                "blocked@example.com": Message.STATUS_BLACKLISTED,
+                "fails@example.com": Message.STATUS_FAILED,
+                "ok@example.com": Message.STATUS_SENT,
+            },
+        )
+
+    def test_status_committed_after_every_message(self):
+        _queue("a@example.com", "b@example.com", "c@example.com")
+
+        def send_messages(messages):
+            if messages[0].to == ["b@example.com"]:
+                raise WorkerCrashed()
+            return len(messages)
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=send_messages,
+        ):
+            with self.assertRaises(WorkerCrashed):
+                dispatch_batch(batch_size=100)
+
+        statuses = dict(Message.objects.values_list("to_address", "status"))
+        self.assertEqual(
+            statuses,
+            {
+                "a@example.com": Message.STATUS_SENT,
+                "b@example.com": Message.STATUS_IN_PROCESS,
+                "c@example.com": Message.STATUS_IN_PROCESS,
+            },
+        )
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True, CELERY_TASK_TIME_LIMIT=60)
+    def test_task_requeues_stuck_messages(self):
+        with freeze_time(timezone.now() - timedelta(minutes=2)):
+            _queue("stuck@example.com")
+            _claim_batch(batch_size=100)
+        _queue("in-process@example.com")
+        _claim_batch(batch_size=100)
+
+        result = dispatch_queued_emails()
+
+        self.assertEqual(result["sent"], 1)
+        self.assertEqual([email.to for email in mail.outbox], [["stuck@example.com"]])
+        self.assertEqual(
+            Message.objects.get(to_address="in-process@example.com").status,
+            Message.STATUS_IN_PROCESS,
+        )
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True, EMAIL_DISPATCH_BATCH_SIZE=2)
+    def test_task_dispatches_until_queue_is_empty(self):
+        _queue("a@example.com", "b@example.com", "c@example.com")
+
+        result = dispatch_queued_emails()
+
+        self.assertEqual(result["sent"], 2)
+        self.assertIn("throughput", result)
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_status_changes_are_logged_per_submission(self):
+        submission = SubmissionFactory.create()
+        _queue(
+            "foo@example.com",
+            **{
+                X_OF_CONTENT_TYPE_HEADER: EmailContentTypeChoices.submission,
+                X_OF_CONTENT_UUID_HEADER: str(submission.uuid),
+                X_OF_EVENT_HEADER: EmailEventChoices.confirmation,
+            },
+        )
+
+        dispatch_batch(batch_size=100)
+
+        logs = TimelineLogProxy.objects.filter(
+            template="logging/events/email_status_change.txt"
+        ).order_by("pk")
+        self.assertEqual(
+            [(log.content_object, log.extra_data["status"]) for log in logs],
+            [
+                (submission, Message.STATUS_QUEUED),
+                (submission, Message.STATUS_IN_PROCESS),
+                (submission, Message.STATUS_SENT),
+            ],
+        )
+
+
+class ThrottleTests(SimpleTestCase):
+    @override_settings(
+        EMAIL_DISPATCH_RATE_LIMIT=2,
+        EMAIL_DISPATCH_PROVIDER_RATE_LIMITS={"unlimited.nl": 0},
+    )
+    def test_rate_limit_per_provider(self):
+        now = 0.0
+        sleeps = []
+
+        def sleep(seconds):
+            nonlocal now
+            sleeps.append(seconds)
+            now += seconds
+
+        throttle = Throttle(clock=lambda: now, sleep=sleep)
+
+        for provider in ("gmail.com", "outlook.com", "gmail.com", "gmail.com"):
+            throttle.wait(provider)
+        for _ in range(3):
+            throttle.wait("unlimited.nl")
+
+        self.assertEqual(sleeps, [0.5, 0.5])
+
+    def test_messages_are_interleaved_by_provider(self):
+        messages = [
+            Message(to_address=address)
+            for address in ("a@gmail.com", "b@gmail.com", "c@gmail.com", "d@x.nl")
+        ]
+
+        interleaved = _interleave_providers(messages)
+
+        self.assertEqual(
+            [message.to_address for message in interleaved],
+            ["a@gmail.com", "d@x.nl", "b@gmail.com", "c@gmail.com"],
+        )
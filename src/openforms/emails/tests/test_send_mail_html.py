@@ -11,6 +11,7 @@ from django_yubin.models import Message
 from pyquery import PyQuery
 
 from openforms.config.models import GlobalConfiguration
+from openforms.config.tests.factories import ThemeFactory
 from openforms.logging.models import TimelineLogProxy
 from openforms.submissions.tests.factories import SubmissionFactory
 
@@ -21,8 +22,8 @@ from ..constants import (
     EmailContentTypeChoices,
     EmailEventChoices,
 )
-from ..context import _get_design_token_values
-from ..utils import send_mail_html
+from ..context import _get_design_token_values, get_wrapper_context
+from ..utils import render_wrapper, send_mail_html
 
 
 class HTMLEmailWrapperTest(TestCase):
@@ -121,6 +122,42 @@ class HTMLEmailWrapperTest(TestCase):
                 ["foo@bar.baz"],
             )
 
+    def test_wrapper_equals_full_render(self):
+        theme = ThemeFactory.create(
+            design_token_values={"of": {"page-header": {"bg": {"value": "#ff0000"}}}}
+        )
+        body = "<p>My Message</p>"
+
+        html_message = render_wrapper(body, theme=theme)
+
+        expected = get_template("emails/wrapper.html").render(
+            get_wrapper_context(body, theme=theme)
+        )
+        self.assertEqual(html_message, expected)
+
+    def test_wrapper_rendered_once_per_theme(self):
+        theme1, theme2 = ThemeFactory.create_batch(2)
+        # make sure the styles differ from any wrapper cached by other tests
+        theme2.design_token_values = {
+            "of": {"layout": {"bg": {"value": f"#{theme2.pk:06d}"}}}
+        }
+
+        with patch(
+            "openforms.emails.utils.get_template", wraps=get_template
+        ) as mock_get_template:
+            for theme in (theme2, theme2, theme1, theme2):
+                html_message = render_wrapper(f"<p>{theme.pk}</p>", theme=theme)
+                self.assertIn(f"<p>{theme.pk}</p>", html_message)
+
+        self.assertLessEqual(mock_get_template.call_count, 2)
+        self.assertIn(f"#{theme2.pk:06d}", html_message)
+
+        theme2.design_token_values["of"]["layout"]["bg"]["value"] = "#abcdef"
+        html_message = render_wrapper("<p>changed</p>", theme=theme2)
+
+        self.assertIn("#abcdef", html_message)
+        self.assertNotIn(f"#{theme2.pk:06d}", html_message)
+
 
 @override_settings(
     EMAIL_BACKEND="django_yubin.backends.QueuedEmailBackend",
@@ -1,14 +1,19 @@
+import json
 import logging
 import re
+import uuid
+from functools import lru_cache
 from typing import Any, Sequence
 from urllib.parse import urlsplit
 
 from django.conf import settings
 from django.template.loader import get_template
+from django.utils.safestring import mark_safe
 
+from mail_cleaner.constants import URL_REGEX
 from mail_cleaner.mail import send_mail_plus
-from mail_cleaner.sanitizer import sanitize_content as _sanitize_content
 from mail_cleaner.text import strip_tags_plus
+from mail_cleaner.utils import check_message_size
 
 from openforms.config.models import GlobalConfiguration, Theme
 from openforms.template import openforms_backend, render_from_string
@@ -21,6 +26,9 @@ MESSAGE_SIZE_LIMIT = 2 * 1024 * 1024
 
 RE_NON_WHITESPACE = re.compile(r"\S")
 
+# rendered in place of the content to split the wrapper in the part before and after it
+WRAPPER_CONTENT_PLACEHOLDER = f"<!-- content-{uuid.uuid4()} -->"
+
 
 def get_system_netloc_allowlist() -> list[str]:
     return [
@@ -29,6 +37,22 @@ def get_system_netloc_allowlist() -> list[str]:
     ]
 
 
+def get_netloc_allowlist() -> frozenset[str]:
+    """
+    Return the system and configured netlocs that may be linked to in emails.
+    """
+    config = GlobalConfiguration.get_solo()
+    return _build_netloc_allowlist(
+        tuple(get_system_netloc_allowlist()),
+        tuple(config.email_template_netloc_allowlist),
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_netloc_allowlist(*allowlists: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(netloc for allowlist in allowlists for netloc in allowlist)
+
+
 def sanitize_content(content: str) -> str:
     """
     Sanitize the content by stripping untrusted content.
@@ -38,10 +62,40 @@ def sanitize_content(content: str) -> str:
 
     * strip URLs that are not present in the explicit allow list
     """
-    config = GlobalConfiguration.get_solo()
+    check_message_size(content)
+    allowlist = get_netloc_allowlist()
+
+    def replace_url(match: re.Match) -> str:
+        if urlsplit(url := match.group()).netloc in allowlist:
+            return url
+        logger.debug("Sanitized URL from email: %s", url)
+        return ""
+
     # strip out any hyperlinks that are not in the configured allowlist
-    allowlist = get_system_netloc_allowlist() + config.email_template_netloc_allowlist
-    return _sanitize_content(content, allowlist)
+    return URL_REGEX.sub(replace_url, content)
+
+
+@lru_cache(maxsize=32)
+def _get_wrapper_parts(wrapper_context: str) -> tuple[str, str]:
+    context = json.loads(wrapper_context)
+    context["content"] = mark_safe(WRAPPER_CONTENT_PLACEHOLDER)
+    rendered = get_template("emails/wrapper.html").render(context)
+    head, _, tail = rendered.partition(WRAPPER_CONTENT_PLACEHOLDER)
+    return head, tail
+
+
+def render_wrapper(html_body: str, theme: Theme | None = None) -> str:
+    """
+    Wrap the HTML body in our email scaffolding, styled with the theme.
+
+    The wrapper only depends on the theme and the global configuration, so it is
+    rendered once for every distinct wrapper context and only the body is filled in
+    for each message.
+    """
+    wrapper_context = get_wrapper_context(theme=theme)
+    del wrapper_context["content"]
+    head, tail = _get_wrapper_parts(json.dumps(wrapper_context, sort_keys=True))
+    return f"{head}{html_body}{tail}"
 
 
 AttachmentsType = Sequence[tuple[str, str, Any]] | None
@@ -73,9 +127,7 @@ def send_mail_html(
     html_body = sanitize_content(html_body)
     text_message = sanitize_content(text_message)
 
-    template = get_template("emails/wrapper.html")
-    wrapper_context = get_wrapper_context(html_body, theme=theme)
-    html_message = template.render(wrapper_context)
+    html_message = render_wrapper(html_body, theme=theme)
 
     send_mail_plus(
         subject,
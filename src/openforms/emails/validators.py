@@ -34,16 +34,10 @@ class URLSanitationValidator:
         :func:`openforms.emails.utils.sanitize_content`.
         """
 
-        # local imports because we use this on GlobalConfiguration itself
-        from openforms.config.models import GlobalConfiguration
-        from openforms.emails.utils import get_system_netloc_allowlist
+        # local import because we use this on GlobalConfiguration itself
+        from openforms.emails.utils import get_netloc_allowlist
 
-        config = GlobalConfiguration.get_solo()
-        assert isinstance(config, GlobalConfiguration)
-
-        allowlist = (
-            get_system_netloc_allowlist() + config.email_template_netloc_allowlist
-        )
+        allowlist = get_netloc_allowlist()
 
         for m in URL_REGEX.finditer(value):
             parsed = urlsplit(m.group())
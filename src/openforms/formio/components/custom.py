@@ -8,6 +8,7 @@ from rest_framework.request import Request
 
 from openforms.authentication.constants import AuthAttribute
 from openforms.config.models import GlobalConfiguration
+from openforms.prefill.cache import get_or_fetch
 from openforms.submissions.models import Submission
 from openforms.typing import DataMapping
 from openforms.utils.date import format_date_value
@@ -117,13 +118,12 @@ class NPFamilyMembers(BasePlugin):
     formatter = DefaultFormatter
 
     @staticmethod
-    def _get_handler() -> FamilyMembersHandler:
+    def _get_handler(data_api: str) -> FamilyMembersHandler:
         handlers = {
             FamilyMembersDataAPIChoices.haal_centraal: get_np_family_members_haal_centraal,
             FamilyMembersDataAPIChoices.stuf_bg: get_np_family_members_stuf_bg,
         }
-        config = FamilyMembersTypeConfig.get_solo()
-        return handlers[config.data_api]
+        return handlers[data_api]
 
     @classmethod
     def mutate_config_dynamically(
@@ -169,15 +169,23 @@ class NPFamilyMembers(BasePlugin):
             "value": "",
         }
         if not existing_values or existing_values[0] == empty_option:
-            handler = cls._get_handler()
+            data_api = FamilyMembersTypeConfig.get_solo().data_api
+            handler = cls._get_handler(data_api)
+            include_children = component.get("includeChildren", True)
+            include_partners = component.get("includePartners", True)
             # make the API call
             # TODO: this should eventually be replaced with logic rules/variables that
             # retrieve data from an "arbitrary source", which will cause the data to
             # become available in the ``data`` argument instead.
-            child_choices = handler(
+            child_choices = get_or_fetch(
+                f"np_family_members_{data_api}",
                 bsn,
-                include_children=component.get("includeChildren", True),
-                include_partners=component.get("includePartners", True),
+                [f"children:{include_children}", f"partners:{include_partners}"],
+                lambda: handler(
+                    bsn,
+                    include_children=include_children,
+                    include_partners=include_partners,
+                ),
             )
 
             component["values"] = [
@@ -1,18 +1,124 @@
-import re
 from collections import UserDict
 from collections.abc import Hashable
-from typing import Dict, Iterator, Optional, cast
+from dataclasses import dataclass
+from functools import lru_cache
+from sys import intern
+from typing import Dict, Iterable, Iterator, Optional, cast
+
+from django.conf import settings
+from django.core.cache import caches
 
 from glom import PathAccessError, assign, glom
 
 from openforms.typing import DataMapping, JSONObject, JSONValue
 
 from .typing import Component
-from .utils import flatten_by_path, is_visible_in_frontend, iter_components
+from .utils import is_visible_in_frontend
 
 # TODO: mechanism to wrap/mark root components?
 
-RE_PATH = re.compile(r"(components|columns|rows)\.([0-9]+)")
+PathBits = tuple[str | int, ...]
+
+# upper bound for the number of component indices kept in memory per process
+MAX_CACHED_COMPONENT_INDICES = 1000
+
+_component_indices: dict[str, "ComponentIndex"] = {}
+
+# upper bound for the number of split (dotted) data keys kept in memory per process
+MAX_CACHED_KEY_PATHS = 10_000
+
+_missing = object()
+
+
+@dataclass(frozen=True)
+class ComponentIndex:
+    """
+    Precomputed lookups for the component tree of a Formio configuration.
+
+    The index only holds component keys and configuration paths, never the component
+    objects themselves. It can therefore be shared between all the (mutable) copies of
+    the same configuration - treat the contained mappings as read-only.
+    """
+
+    paths: dict[str, PathBits]
+    """
+    Component key to configuration path, in depth-first order.
+    """
+    flattened: dict[str, PathBits]
+    """
+    The configuration path of every component (see :func:`flatten_by_path`).
+    """
+    ancestors: dict[str, tuple[PathBits, ...]]
+    """
+    Component key to the paths of the nodes from the root down to the component.
+    """
+    keys_by_type: dict[str, tuple[str, ...]]
+
+    @classmethod
+    def from_configuration(cls, configuration: JSONObject) -> "ComponentIndex":
+        paths, flattened, ancestors, keys_by_type = {}, {}, {}, {}
+
+        def _visit(node: JSONObject, prefix: PathBits, parents: tuple[PathBits, ...]):
+            for index, component in enumerate(node.get("components", [])):
+                path = (*prefix, "components", index)
+                chain = (*parents, path)
+                key = component["key"]
+                paths[key] = path
+                flattened[".".join(str(bit) for bit in path)] = path
+                ancestors[key] = chain
+                keys_by_type.setdefault(component.get("type"), {})[key] = None
+
+                # mimick :func:`openforms.formio.utils.flatten_by_path`
+                if "columns" in component:
+                    for col_index, column in enumerate(component["columns"]):
+                        column_path = (*path, "columns", col_index)
+                        _visit(column, column_path, (*chain, column_path))
+                elif "components" in component:
+                    _visit(component, path, chain)
+
+        _visit(configuration, (), ())
+        return cls(
+            paths=paths,
+            flattened=flattened,
+            ancestors=ancestors,
+            keys_by_type={type_: tuple(keys) for type_, keys in keys_by_type.items()},
+        )
+
+
+def get_component_index(configuration: JSONObject, cache_key: str) -> ComponentIndex:
+    """
+    Retrieve the component index for a configuration, building it when needed.
+
+    Indices are kept in memory for the lifetime of the process and optionally shared
+    between processes through the cache configured in
+    ``settings.FORMIO_COMPONENT_INDEX_CACHE``.
+
+    :arg cache_key: a key uniquely identifying the version of the configuration, e.g.
+      derived from the content hash.
+    """
+    if (index := _component_indices.get(cache_key)) is not None:
+        return index
+
+    shared_cache = (
+        caches[alias] if (alias := settings.FORMIO_COMPONENT_INDEX_CACHE) else None
+    )
+    shared_key = f"formio:component-index:{cache_key}"
+    if shared_cache is None or (index := shared_cache.get(shared_key)) is None:
+        index = ComponentIndex.from_configuration(configuration)
+        if shared_cache is not None:
+            shared_cache.set(shared_key, index)
+
+    if len(_component_indices) >= MAX_CACHED_COMPONENT_INDICES:
+        _component_indices.clear()
+    _component_indices[cache_key] = index
+    return index
+
+
+def _resolve(configuration: JSONObject, path: PathBits) -> JSONObject:
+    node = configuration
+    for bit in path:
+        node = node[bit]
+    return node
 
 
 class FormioConfigurationWrapper:
@@ -20,24 +126,38 @@ class FormioConfigurationWrapper:
     Wrap around the Formio configuration dictionary for further processing.
 
     This datastructure caches the internal datastructure to optimize mutations of the
-    formio configuration.
+    formio configuration. The structure of the component tree is described by a
+    :class:`ComponentIndex`, which is shared between instances wrapping the same
+    configuration version when a ``cache_key`` is provided.
     """
 
     _configuration: JSONObject
+    _component_index: Optional[ComponentIndex] = None
     # depth-first ordered of all components in the formio configuration tree
     _cached_component_map: Optional[Dict[str, Component]] = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
 
-    def __init__(self, configuration: JSONObject):
+    def __init__(self, configuration: JSONObject, cache_key: str = ""):
         self._configuration = configuration
+        # resolve the index immediately, before the configuration gets mutated
+        if cache_key:
+            self._component_index = get_component_index(configuration, cache_key)
+
+    @property
+    def component_index(self) -> ComponentIndex:
+        if self._component_index is None:
+            self._component_index = ComponentIndex.from_configuration(
+                self.configuration
+            )
+        return self._component_index
 
     @property
     def component_map(self) -> Dict[str, Component]:
         if self._cached_component_map is None:
             self._cached_component_map = {
-                component["key"]: component
-                for component in iter_components(self.configuration, recursive=True)
+                key: cast(Component, _resolve(self.configuration, path))
+                for key, path in self.component_index.paths.items()
             }
         return self._cached_component_map
 
@@ -56,6 +176,9 @@ class FormioConfigurationWrapper:
     ) -> "FormioConfigurationWrapper":
         self._configuration["components"] += other_wrapper._configuration["components"]
         self.component_map.update(other_wrapper.component_map)
+        # the structure changed, the indices must be rebuilt when needed
+        self._component_index = None
+        self._flattened_by_path = self._reverse_flattened = None
         return self
 
     @property
@@ -65,29 +188,41 @@ class FormioConfigurationWrapper:
     @property
     def flattened_by_path(self) -> dict[str, Component]:
         if self._flattened_by_path is None:
-            self._flattened_by_path = flatten_by_path(self.configuration)
+            self._flattened_by_path = {
+                path: cast(Component, _resolve(self.configuration, path_bits))
+                for path, path_bits in self.component_index.flattened.items()
+            }
         return self._flattened_by_path
 
     @property
     def reverse_flattened(self) -> dict[str, str]:
         if self._reverse_flattened is None:
             self._reverse_flattened = {
-                component["key"]: path
-                for path, component in self.flattened_by_path.items()
+                key: ".".join(str(bit) for bit in path)
+                for key, path in self.component_index.paths.items()
             }
         return self._reverse_flattened
 
+    def get_keys_of_type(self, component_type: str) -> tuple[str, ...]:
+        return self.component_index.keys_by_type.get(component_type, ())
+
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
+        # leftmost is root, rightmost is leaf
+        nodes = (
+            cast(Component, _resolve(self.configuration, path))
+            for path in self.component_index.ancestors[key]
+        )
         return all(is_visible_in_frontend(node, values) for node in nodes)
 
 
+@lru_cache(maxsize=MAX_CACHED_KEY_PATHS)
+def split_key(key: str) -> tuple[str, ...]:
+    """
+    Split a (dotted) Formio data key into its path bits.
+    """
+    return tuple(intern(bit) for bit in key.split("."))
+
+
 class FormioData(UserDict):
     """
     Handle formio (submission) data transparently.
@@ -105,19 +240,70 @@ class FormioData(UserDict):
 
     without having to worry about potential deep assignments or leak implementation
     details (such as using ``glom`` for this).
+
+    Dotted keys are split into (interned) path tuples once per process, and the
+    nested data is traversed directly. Only when the path runs into something else than
+    a dict, the lookup or assignment is delegated to ``glom`` to preserve its
+    semantics (e.g. for list indices).
     """
 
     data: dict[str, JSONValue]
 
     def __getitem__(self, key: Hashable):
-        return cast(JSONValue, glom(self.data, key))
+        value = self._lookup(key)
+        if value is _missing:
+            # let glom build the exception with the details of the failing path bit
+            return cast(JSONValue, glom(self.data, key))
+        return cast(JSONValue, value)
 
     def __setitem__(self, key: Hashable, value: JSONValue):
-        assign(self.data, key, value, missing=dict)
+        if not isinstance(key, str):
+            assign(self.data, key, value, missing=dict)
+            return
+
+        *parents, leaf = split_key(key)
+        node = self.data
+        for bit in parents:
+            child = node.get(bit, _missing)
+            if child is _missing:
+                child = node[bit] = {}
+            elif not isinstance(child, dict):
+                assign(self.data, key, value, missing=dict)
+                return
+            node = child
+        node[leaf] = value
 
     def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not _missing
+
+    def get(self, key: Hashable, default=None):
+        value = self._lookup(key)
+        return default if value is _missing else value
+
+    def _lookup(self, key: Hashable):
+        if not isinstance(key, str):
+            return self._glom_lookup(key)
+
+        node = self.data
+        for bit in split_key(key):
+            if not isinstance(node, dict):
+                return self._glom_lookup(key)
+            node = node.get(bit, _missing)
+            if node is _missing:
+                return _missing
+        return node
+
+    def _glom_lookup(self, key: Hashable):
         try:
-            self[key]
+            return glom(self.data, key)
         except PathAccessError:
-            return False
-        return True
+            return _missing
+
+    def to_flat(self, keys: Iterable[str]) -> dict[str, JSONValue]:
+        """
+        Look up the values of the (dotted) keys in a single pass.
+
+        Keys that are not present in the data are omitted from the result.
+        """
+        lookup = self._lookup
+        return {key: value for key in keys if (value := lookup(key)) is not _missing}
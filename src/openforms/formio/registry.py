@@ -87,6 +87,11 @@ class BasePlugin(Generic[T], AbstractBasePlugin):
 class ComponentRegistry(BaseRegistry[BasePlugin]):
     module = "formio_components"
 
+    def __init__(self):
+        super().__init__()
+        # formatters are stateless apart from their options, so instances are re-used
+        self._formatters: dict[tuple[str, bool], FormatterProtocol] = {}
+
     def normalize(self, component: Component, value: Any) -> Any:
         """
         Given a value from any source, normalize it according to the component rules.
@@ -108,12 +113,22 @@ class ComponentRegistry(BaseRegistry[BasePlugin]):
         type.
         """
         assert "type" in component
-        if (component_type := component["type"]) not in self:
+        formatter = self.get_formatter(component["type"], as_html=as_html)
+        return formatter(component, value)
+
+    def get_formatter(self, component_type: str, as_html=False) -> FormatterProtocol:
+        """
+        Get the (shared) formatter instance for the specified component type.
+        """
+        if component_type not in self:
             component_type = "default"
 
-        component_plugin = self[component_type]
-        formatter = component_plugin.formatter(as_html=as_html)
-        return formatter(component, value)
+        cache_key = (component_type, as_html)
+        if (formatter := self._formatters.get(cache_key)) is None:
+            component_plugin = self[component_type]
+            formatter = component_plugin.formatter(as_html=as_html)
+            self._formatters[cache_key] = formatter
+        return formatter
 
     def update_config(
         self,
@@ -303,11 +303,12 @@ class FormioNode(Node):
             else None
         )
 
+        step_data = self.step.data
         for configuration_path, component in iterate_components_with_configuration_path(
             configuration, recursive=False
         ):
             child_node = ComponentNode.build_node(
-                step_data=self.step.data,
+                step_data=step_data,
                 component=component,
                 renderer=self.renderer,
                 configuration_path=configuration_path,
@@ -1,6 +1,39 @@
+from copy import deepcopy
 from unittest import TestCase
-
-from ..datastructures import FormioData
+from unittest.mock import patch
+
+from glom import PathAccessError, PathAssignError, assign, glom
+
+from ..datastructures import (
+    ComponentIndex,
+    FormioConfigurationWrapper,
+    FormioData,
+    _component_indices,
+    split_key,
+)
+from ..utils import flatten_by_path, iter_components
+
+CONFIGURATION = {
+    "components": [
+        {"type": "textfield", "key": "toggle"},
+        {
+            "type": "fieldset",
+            "key": "fieldset",
+            "conditional": {"show": False, "when": "toggle", "eq": "hide"},
+            "components": [
+                {
+                    "type": "columns",
+                    "key": "columns",
+                    "columns": [
+                        {"components": [{"type": "textfield", "key": "nested1"}]},
+                        {"components": [{"type": "email", "key": "nested2"}]},
+                    ],
+                },
+            ],
+        },
+        {"type": "textfield", "key": "last"},
+    ]
+}
 
 
 class FormioDataTests(TestCase):
@@ -86,3 +119,135 @@ class FormioDataTests(TestCase):
         }
 
         self.assertEqual(formio_data, expected)
+
+    def test_equivalent_to_glom(self):
+        data = {
+            "top": "level",
+            "empty": None,
+            "container": {"nested": "leaf"},
+            "list": [{"item": "first"}, {"item": "second"}],
+        }
+        keys = (
+            "top",
+            "empty",
+            "empty.nested",
+            "container.nested",
+            "container.absent",
+            "list.1.item",
+            "list.2.item",
+            "absent.nested",
+        )
+
+        for key in keys:
+            with self.subTest(key=key):
+                formio_data = FormioData(deepcopy(data))
+                try:
+                    expected = glom(data, key)
+                except PathAccessError:
+                    self.assertNotIn(key, formio_data)
+                    with self.assertRaises(PathAccessError):
+                        formio_data[key]
+                else:
+                    self.assertIn(key, formio_data)
+                    self.assertEqual(formio_data[key], expected)
+
+                expected_data = deepcopy(data)
+                try:
+                    assign(expected_data, key, "new", missing=dict)
+                except PathAssignError:
+                    with self.assertRaises(PathAssignError):
+                        formio_data[key] = "new"
+                else:
+                    formio_data[key] = "new"
+                    self.assertEqual(formio_data, expected_data)
+
+    def test_to_flat(self):
+        formio_data = FormioData(
+            {"container.nested1": "foo", "container.nested2": None, "topLevel": True}
+        )
+
+        flat = formio_data.to_flat(
+            ["topLevel", "container.nested1", "container.nested2", "absent"]
+        )
+
+        self.assertEqual(
+            flat,
+            {"topLevel": True, "container.nested1": "foo", "container.nested2": None},
+        )
+
+    def test_split_keys_are_interned(self):
+        first = split_key("".join(["container", ".nested"]))
+        second = split_key("container.nested")
+
+        self.assertEqual(first, ("container", "nested"))
+        self.assertIs(first[0], second[0])
+
+
+class FormioConfigurationWrapperTests(TestCase):
+    def test_indices_equivalent_to_traversal(self):
+        wrapper = FormioConfigurationWrapper(CONFIGURATION)
+
+        self.assertEqual(
+            list(wrapper.component_map.items()),
+            [
+                (component["key"], component)
+                for component in iter_components(CONFIGURATION)
+            ],
+        )
+        self.assertEqual(wrapper.flattened_by_path, flatten_by_path(CONFIGURATION))
+        self.assertEqual(
+            wrapper.reverse_flattened["nested2"],
+            "components.1.components.0.columns.1.components.0",
+        )
+
+    def test_keys_of_type(self):
+        wrapper = FormioConfigurationWrapper(CONFIGURATION)
+
+        self.assertEqual(
+            wrapper.get_keys_of_type("textfield"), ("toggle", "nested1", "last")
+        )
+        self.assertEqual(wrapper.get_keys_of_type("email"), ("nested2",))
+        self.assertEqual(wrapper.get_keys_of_type("file"), ())
+
+    def test_visibility_takes_parents_into_account(self):
+        wrapper = FormioConfigurationWrapper(CONFIGURATION)
+
+        self.assertTrue(wrapper.is_visible_in_frontend("nested1", {"toggle": ""}))
+        self.assertFalse(wrapper.is_visible_in_frontend("nested1", {"toggle": "hide"}))
+        self.assertTrue(wrapper.is_visible_in_frontend("last", {"toggle": "hide"}))
+
+    @patch.dict(_component_indices, clear=True)
+    def test_index_shared_between_instances_of_same_version(self):
+        wrapper1 = FormioConfigurationWrapper(CONFIGURATION, cache_key="1:abc")
+        wrapper2 = FormioConfigurationWrapper(
+            {"components": [{"type": "textfield", "key": "other"}]},
+            cache_key="2:def",
+        )
+
+        configuration_copy = deepcopy(CONFIGURATION)
+        with patch.object(
+            ComponentIndex,
+            "from_configuration",
+            side_effect=AssertionError("Must not be rebuilt"),
+        ):
+            wrapper3 = FormioConfigurationWrapper(configuration_copy, cache_key="1:abc")
+
+        self.assertIs(wrapper1.component_index, wrapper3.component_index)
+        self.assertIsNot(wrapper1.component_index, wrapper2.component_index)
+        # component lookups resolve in the wrapped configuration, not the shared one
+        self.assertIs(wrapper3["toggle"], configuration_copy["components"][0])
+
+    def test_combined_wrappers_rebuild_index(self):
+        wrapper = FormioConfigurationWrapper(
+            {"components": [{"type": "textfield", "key": "first"}]}
+        )
+        self.assertEqual(wrapper.reverse_flattened, {"first": "components.0"})
+
+        wrapper += FormioConfigurationWrapper(
+            {"components": [{"type": "textfield", "key": "second"}]}
+        )
+
+        self.assertEqual(
+            wrapper.reverse_flattened,
+            {"first": "components.0", "second": "components.1"},
+        )
@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class CommandTests(SimpleTestCase):
+    def test_compares_formio_data_with_glom(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_formio_data",
+            variables=50,
+            iterations=2,
+            stdout=stdout,
+            no_color=True,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("glom: min:", output)
+        self.assertIn("FormioData: min:", output)
+        self.assertIn("Speed-up (median):", output)
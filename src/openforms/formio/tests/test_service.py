@@ -1,10 +1,12 @@
 from unittest.mock import patch
 
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, SimpleTestCase, TestCase
 from django.urls import reverse
 
+from openforms.formio.registry import register
 from openforms.formio.service import (
     FormioConfigurationWrapper,
+    format_value,
     rewrite_formio_components_for_request,
 )
 
@@ -51,3 +53,19 @@ class ServiceTestCase(TestCase):
             <img id="nonce-5fa62ae6176f3746142503a6ebe96cb3-1234">
             """
             self.assertHTMLEqual(configuration["components"][1]["html"], expected)
+
+
+class FormatValueTests(SimpleTestCase):
+    def test_formatter_instances_are_reused(self):
+        formatter1 = register.get_formatter("textfield", as_html=True)
+        formatter2 = register.get_formatter("textfield", as_html=True)
+
+        self.assertIs(formatter1, formatter2)
+        self.assertIsNot(formatter1, register.get_formatter("textfield"))
+        self.assertIs(
+            register.get_formatter("unknown-type"), register.get_formatter("default")
+        )
+        self.assertEqual(
+            format_value({"type": "textfield", "key": "text"}, "foo", as_html=True),
+            "foo",
+        )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     name = "openforms.forms"
     verbose_name = "OpenForms Form App"
+
+    def ready(self):
+        from . import structure  # noqa
@@ -416,9 +416,10 @@ class Form(models.Model):
     )
 
     def get_cosign_component(self) -> CosignComponent | None:
-        for component in self.iter_components():
-            if component["type"] == "cosign":
-                return component
+        for form_step in self.formstep_set.select_related("form_definition"):
+            wrapper = form_step.form_definition.configuration_wrapper
+            if cosign_keys := wrapper.get_keys_of_type("cosign"):
+                return wrapper[cosign_keys[0]]
 
     @property
     def cosigning_required(self) -> bool:
@@ -91,6 +91,10 @@ class FormDefinition(models.Model):
 
         super().save(*args, **kwargs)
 
+        # the configuration may have changed, derive the hash and wrapper again
+        self.__dict__.pop("configuration_hash", None)
+        self.__dict__.pop("configuration_wrapper", None)
+
         self._check_configuration_integrity()
 
     def delete(self, using=None, keep_parents=False):
@@ -179,11 +183,17 @@ class FormDefinition(models.Model):
             json.dumps(self.configuration, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    @cached_property
+    def configuration_hash(self) -> str:
+        return self.get_hash()
+
     @cached_property
     def configuration_wrapper(self) -> "FormioConfigurationWrapper":
         from openforms.formio.service import FormioConfigurationWrapper
 
-        return FormioConfigurationWrapper(self.configuration)
+        # the structural indices are shared between all instances of the same version
+        cache_key = f"{self.pk}:{self.configuration_hash}" if self.pk else ""
+        return FormioConfigurationWrapper(self.configuration, cache_key=cache_key)
 
     def iter_components(self, configuration=None, recursive=True, **kwargs):
         if configuration is None:
@@ -0,0 +1,136 @@
+"""
+Request-scoped cache of the structure of forms.
+
+Loading the execution state and variables of a submission requires the form steps
+(with their form definitions), form variables and logic rules of the form. Within a
+single request, multiple submission instances are often loaded (serializers, viewset
+``get_object`` calls...), each of which would query the form structure again.
+
+While a request is being processed, the structure of every form is loaded once. Every
+caller receives its own copies of the model instances, since the form definition
+configuration is mutated during logic evaluation and rendering. Outside of the
+request-response cycle (e.g. in Celery tasks and management commands) nothing is
+cached.
+"""
+import copy
+import json
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from django.core import signals
+from django.db.models.signals import post_delete, post_save
+
+from .models import Form, FormDefinition, FormLogic, FormStep, FormVariable
+
+_storage = threading.local()
+
+
+@dataclass
+class FormStructure:
+    form_steps: List[FormStep]
+    form_variables: List[FormVariable]
+    logic_rules: List[FormLogic]
+
+
+@dataclass
+class _CachedFormStructure:
+    # the pristine instances are never handed out, only copies of them
+    form_steps: List[Tuple[FormStep, str]]
+    form_variables: List[FormVariable]
+    logic_rules: List[FormLogic]
+
+    def get_copy(self) -> FormStructure:
+        form_definitions: Dict[int, FormDefinition] = {}
+        form_steps = []
+        for form_step, configuration in self.form_steps:
+            definition_id = form_step.form_definition_id
+            if definition_id not in form_definitions:
+                form_definition = _copy_instance(form_step.form_definition)
+                form_definition.configuration = json.loads(configuration)
+                form_definitions[definition_id] = form_definition
+            step_copy = _copy_instance(form_step)
+            step_copy.form_definition = form_definitions[definition_id]
+            form_steps.append(step_copy)
+
+        form_variables = []
+        for form_variable in self.form_variables:
+            variable_copy = _copy_instance(form_variable)
+            variable_copy.initial_value = copy.deepcopy(form_variable.initial_value)
+            form_variables.append(variable_copy)
+
+        return FormStructure(
+            form_steps=form_steps,
+            form_variables=form_variables,
+            # the rules are not modified during evaluation
+            logic_rules=self.logic_rules,
+        )
+
+
+def _copy_instance(instance):
+    instance_copy = copy.copy(instance)
+    # the model state holds the cache of related objects, which may not be shared
+    instance_copy._state = copy.copy(instance._state)
+    instance_copy._state.fields_cache = {}
+    return instance_copy
+
+
+def _load_form_structure(form: Form) -> _CachedFormStructure:
+    form_steps = list(
+        form.formstep_set.select_related("form_definition").order_by("order")
+    )
+    return _CachedFormStructure(
+        form_steps=[
+            (form_step, json.dumps(form_step.form_definition.configuration))
+            for form_step in form_steps
+        ],
+        form_variables=list(form.formvariable_set.all()),
+        logic_rules=list(
+            FormLogic.objects.select_related("trigger_from_step").filter(form=form)
+        ),
+    )
+
+
+def _get_cache() -> Optional[Dict[int, _CachedFormStructure]]:
+    return getattr(_storage, "structures", None)
+
+
+def get_form_structure(form: Form) -> Optional[FormStructure]:
+    """
+    Get a copy of the (cached) form structure, if caching is active.
+
+    :returns: the form structure, or ``None`` outside of the request-response cycle.
+    """
+    if (cache := _get_cache()) is None:
+        return None
+    if form.pk not in cache:
+        cache[form.pk] = _load_form_structure(form)
+    return cache[form.pk].get_copy()
+
+
+def activate_cache(**kwargs) -> None:
+    _storage.structures = {}
+
+
+def deactivate_cache(**kwargs) -> None:
+    _storage.structures = None
+
+
+def clear_cache(**kwargs) -> None:
+    if _get_cache() is not None:
+        _storage.structures = {}
+
+
+signals.request_started.connect(
+    activate_cache, dispatch_uid="openforms.forms.structure.activate_cache"
+)
+signals.request_finished.connect(
+    deactivate_cache, dispatch_uid="openforms.forms.structure.deactivate_cache"
+)
+for model in (Form, FormStep, FormDefinition, FormVariable, FormLogic):
+    for signal in (post_save, post_delete):
+        signal.connect(
+            clear_cache,
+            sender=model,
+            dispatch_uid=f"openforms.forms.structure.clear_cache.{model.__name__}",
+        )
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings
 from django.utils.translation import gettext as _
@@ -398,6 +400,28 @@ class FormDefinitionTestCase(TestCase):
 
         self.assertEqual(fd._num_components, 2)
 
+    def test_configuration_hash_is_computed_once_until_saved(self):
+        fd = FormDefinitionFactory.create(
+            configuration={"components": [{"type": "textfield", "key": "foo"}]}
+        )
+
+        with patch.object(
+            FormDefinition,
+            "get_hash",
+            autospec=True,
+            side_effect=FormDefinition.get_hash,
+        ) as mock_get_hash:
+            fd.configuration_wrapper
+            fd.configuration_hash
+
+            self.assertEqual(mock_get_hash.call_count, 1)
+
+            fd.configuration = {"components": [{"type": "textfield", "key": "bar"}]}
+            fd.save()
+
+            self.assertIn("bar", fd.configuration_wrapper)
+            self.assertEqual(mock_get_hash.call_count, 2)
+
 
 class FormStepTestCase(TestCase):
     def test_str(self):
@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from openforms.submissions.models import Submission
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..structure import activate_cache, deactivate_cache, get_form_structure
+from .factories import FormFactory, FormLogicFactory, FormStepFactory
+
+
+class FormStructureCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [{"type": "textfield", "key": "textfield"}]
+            },
+        )
+        FormLogicFactory.create(form=cls.form)
+        cls.submission = SubmissionFactory.create(form=cls.form)
+
+    def _simulate_request(self):
+        # equivalent of the request_started/request_finished signal handlers
+        activate_cache()
+        self.addCleanup(deactivate_cache)
+
+    def test_not_cached_outside_of_request(self):
+        self.assertIsNone(get_form_structure(self.form))
+
+    def test_structure_loaded_once_per_request(self):
+        self._simulate_request()
+        Submission.objects.get().load_submission_value_variables_state().variables
+
+        submission = Submission.objects.get()
+        # one query for the form, one for the submission steps and one for the value
+        # variables
+        with self.assertNumQueries(3):
+            state = submission.load_execution_state()
+            variables = submission.load_submission_value_variables_state().variables
+
+        self.assertEqual(len(state.form_steps), 1)
+        self.assertIn("textfield", variables)
+        self.assertEqual(len(submission.form._cached_logic_rules), 1)
+
+    def test_copies_are_independent(self):
+        self._simulate_request()
+        submission1 = Submission.objects.get()
+        submission2 = Submission.objects.get()
+
+        form_step1 = submission1.load_execution_state().form_steps[0]
+        form_step2 = submission2.load_execution_state().form_steps[0]
+
+        self.assertEqual(form_step1, form_step2)
+        self.assertIsNot(form_step1, form_step2)
+        self.assertIsNot(form_step1.form_definition, form_step2.form_definition)
+        form_step1.form_definition.configuration["components"][0]["hidden"] = True
+        self.assertNotIn(
+            "hidden", form_step2.form_definition.configuration["components"][0]
+        )
+
+    def test_cache_cleared_on_changes(self):
+        self._simulate_request()
+        Submission.objects.get().load_execution_state()
+
+        FormStepFactory.create(form=self.form)
+
+        state = Submission.objects.get().load_execution_state()
+        self.assertEqual(len(state.form_steps), 2)
@@ -0,0 +1,165 @@
+"""
+Buffer timeline log entries and write them to the database in bulk.
+
+Creating a timeline log entry for every event results in a database insert for every
+event, while a single request or Celery task typically emits a number of them. When
+buffering is enabled (through the ``TIMELINE_LOG_BUFFERED`` setting), the entries
+created by :mod:`openforms.logging.logevent` are collected for the duration of the
+request or Celery task and inserted with a single ``bulk_create`` at the end.
+
+The timestamps of the entries are recorded at the moment the events are logged, so the
+ordering in the admin timeline is unaffected by buffering.
+"""
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+from celery.signals import task_postrun, task_prerun
+
+from openforms.typing import JSONObject
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .models import TimelineLogProxy
+
+_storage = threading.local()
+
+
+class TimelineLogBuffer:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: List["TimelineLogProxy"] = []
+
+    def add(self, log_entry: "TimelineLogProxy") -> None:
+        # record the moment of logging, the database default would be the moment of
+        # flushing
+        log_entry.timestamp = timezone.now()
+        self.entries.append(log_entry)
+        if len(self.entries) >= self.max_size:
+            self.overflow()
+
+    def overflow(self) -> None:
+        if not settings.TIMELINE_LOG_BUFFER_OVERFLOW_TASK:
+            self.flush()
+            return
+
+        from .tasks import create_timeline_logs
+
+        entries = [serialize_log_entry(log_entry) for log_entry in self.entries]
+        self.entries = []
+        create_timeline_logs.delay(entries=entries)
+
+    def flush(self) -> None:
+        entries, self.entries = self.entries, []
+        bulk_create_log_entries(entries)
+
+
+def get_active_buffer() -> Optional[TimelineLogBuffer]:
+    return getattr(_storage, "buffer", None)
+
+
+def start_buffering(owner) -> None:
+    """
+    Start buffering the log entries, unless buffering is active already.
+    """
+    if get_active_buffer() is not None:
+        return
+    _storage.buffer = TimelineLogBuffer(max_size=settings.TIMELINE_LOG_BUFFER_SIZE)
+    _storage.owner = owner
+
+
+def stop_buffering(owner) -> None:
+    """
+    Write the buffered log entries and stop buffering, if ``owner`` started it.
+    """
+    buffer = get_active_buffer()
+    if buffer is None or _storage.owner != owner:
+        return
+    try:
+        buffer.flush()
+    finally:
+        _storage.buffer = None
+        _storage.owner = None
+
+
+@contextmanager
+def buffered_timeline_logs() -> Iterator[None]:
+    """
+    Buffer the log entries created in the block, and write them when leaving it.
+
+    Nested blocks share the buffer of the outermost block.
+    """
+    owner = object()
+    start_buffering(owner)
+    try:
+        yield
+    finally:
+        stop_buffering(owner)
+
+
+def bulk_create_log_entries(entries: List["TimelineLogProxy"]) -> None:
+    if not entries:
+        return
+
+    from .models import TimelineLogProxy
+
+    # ``bulk_create`` overwrites the ``auto_now_add`` timestamps with the current time,
+    # so set the timestamps of the moment of logging again afterwards.
+    timestamps = [log_entry.timestamp for log_entry in entries]
+    TimelineLogProxy.objects.bulk_create(entries)
+    TimelineLogProxy.objects.filter(pk__in=[entry.pk for entry in entries]).update(
+        timestamp=Case(
+            *[
+                When(pk=log_entry.pk, then=Value(timestamp))
+                for log_entry, timestamp in zip(entries, timestamps)
+            ],
+            output_field=DateTimeField(),
+        )
+    )
+    for log_entry, timestamp in zip(entries, timestamps):
+        log_entry.timestamp = timestamp
+
+
+def serialize_log_entry(log_entry: "TimelineLogProxy") -> JSONObject:
+    return {
+        "content_type_id": log_entry.content_type_id,
+        "object_id": log_entry.object_id,
+        "template": log_entry.template,
+        # identical to what the JSONField (with the same encoder) stores
+        "extra_data": json.loads(
+            json.dumps(log_entry.extra_data, cls=DjangoJSONEncoder)
+        ),
+        "user_id": log_entry.user_id,
+        "timestamp": log_entry.timestamp.isoformat(),
+    }
+
+
+def deserialize_log_entry(data: JSONObject) -> "TimelineLogProxy":
+    from .models import TimelineLogProxy
+
+    return TimelineLogProxy(
+        content_type_id=data["content_type_id"],
+        object_id=data["object_id"],
+        template=data["template"],
+        extra_data=data["extra_data"],
+        user_id=data["user_id"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+@task_prerun.connect
+def start_task_buffering(task_id: str, **kwargs) -> None:
+    if not settings.TIMELINE_LOG_BUFFERED:
+        return
+    start_buffering(owner=task_id)
+
+
+@task_postrun.connect
+def stop_task_buffering(task_id: str, **kwargs) -> None:
+    stop_buffering(owner=task_id)
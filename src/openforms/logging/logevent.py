@@ -15,6 +15,7 @@ from openforms.payments.constants import PaymentStatus
 from openforms.plugins.plugin import AbstractBasePlugin
 from openforms.typing import JSONObject
 
+from .buffer import get_active_buffer
 from .tasks import log_logic_evaluation
 
 if TYPE_CHECKING:  # pragma: nocover
@@ -63,12 +64,17 @@ def _create_log(
         #   save it on the TimelineLogProxy model
         user = None
 
-    log_entry = TimelineLogProxy.objects.create(
+    log_entry = TimelineLogProxy(
         content_object=object,
         template=f"logging/events/{event}.txt",
         extra_data=extra_data,
         user=user,
     )
+    if (buffer := get_active_buffer()) is not None:
+        # the entry is saved in bulk when the buffer is flushed
+        buffer.add(log_entry)
+    else:
+        log_entry.save()
     # logger.debug('Logged event in %s %s %s', event, object._meta.object_name, object.pk)
     return log_entry
 
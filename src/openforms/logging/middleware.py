@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.http import HttpRequest
+
+from openforms.typing import RequestHandler
+
+from .buffer import buffered_timeline_logs
+
+
+class TimelineLogBufferMiddleware:
+    """
+    Write the timeline log entries of a request in bulk at the end of the request.
+
+    Only active if the ``TIMELINE_LOG_BUFFERED`` setting is enabled.
+    """
+
+    def __init__(self, get_response: RequestHandler):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        if not settings.TIMELINE_LOG_BUFFERED:
+            return self.get_response(request)
+
+        with buffered_timeline_logs():
+            return self.get_response(request)
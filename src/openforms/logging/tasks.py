@@ -5,6 +5,8 @@ from openforms.celery import app
 from openforms.forms.models import FormLogic
 from openforms.typing import JSONObject, JSONValue
 
+from .buffer import bulk_create_log_entries, deserialize_log_entry
+
 
 class EvaluatedRuleDict(TypedDict):
     rule_id: int
@@ -55,4 +57,16 @@ def log_logic_evaluation(
     # overwrite the timestamp, since celery tasks run later than 'now'. This makes the
     # timestamp more accurate & matching with server time that ran the evaluation.
     _timestamp = datetime.fromisoformat(timestamp)
+    if log_entry.pk is None:
+        # the log entry is buffered, it is saved with this timestamp later
+        log_entry.timestamp = _timestamp
+        return
     TimelineLogProxy.objects.filter(pk=log_entry.pk).update(timestamp=_timestamp)
+
+
+@app.task(ignore_result=True)
+def create_timeline_logs(*, entries: List[JSONObject]):
+    """
+    Save the (serialized) log entries that overflowed a timeline log buffer.
+    """
+    bulk_create_log_entries([deserialize_log_entry(entry) for entry in entries])
@@ -0,0 +1,128 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from openforms.accounts.tests.factories import StaffUserFactory
+from openforms.logging import logevent
+from openforms.logging.buffer import buffered_timeline_logs
+from openforms.logging.middleware import TimelineLogBufferMiddleware
+from openforms.logging.models import TimelineLogProxy
+from openforms.logging.tasks import create_timeline_logs
+from openforms.submissions.tests.factories import SubmissionFactory
+
+
+@override_settings(
+    TIMELINE_LOG_BUFFER_SIZE=100, TIMELINE_LOG_BUFFER_OVERFLOW_TASK=False
+)
+class TimelineLogBufferTests(TestCase):
+    def test_log_entries_saved_in_bulk_when_leaving_block(self):
+        submission = SubmissionFactory.create()
+        user = StaffUserFactory.create()
+
+        with buffered_timeline_logs():
+            with freeze_time("2023-01-31T12:00:00Z"):
+                logevent.submission_start(submission)
+            with freeze_time("2023-01-31T12:00:05Z"):
+                logevent.submission_details_view_admin(submission, user)
+
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        log_entries = TimelineLogProxy.objects.order_by("timestamp")
+        self.assertEqual(
+            [log_entry.extra_data["log_event"] for log_entry in log_entries],
+            ["submission_start", "submission_details_view_admin"],
+        )
+        self.assertEqual(
+            [log_entry.timestamp for log_entry in log_entries],
+            [
+                datetime(2023, 1, 31, 12, 0, 0, tzinfo=timezone.utc),
+                datetime(2023, 1, 31, 12, 0, 5, tzinfo=timezone.utc),
+            ],
+        )
+        self.assertEqual(log_entries[1].user, user)
+        self.assertEqual(log_entries[0].content_object, submission)
+
+    def test_nested_blocks_share_buffer(self):
+        submission = SubmissionFactory.create()
+
+        with buffered_timeline_logs():
+            with buffered_timeline_logs():
+                logevent.submission_start(submission)
+
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_log_entries_saved_on_errors(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertRaises(ZeroDivisionError):
+            with buffered_timeline_logs():
+                logevent.submission_start(submission)
+                1 / 0
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    @override_settings(TIMELINE_LOG_BUFFER_SIZE=2)
+    def test_full_buffer_is_flushed(self):
+        submission = SubmissionFactory.create()
+
+        with buffered_timeline_logs():
+            for _ in range(3):
+                logevent.submission_start(submission)
+
+            self.assertEqual(TimelineLogProxy.objects.count(), 2)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 3)
+
+    @override_settings(
+        TIMELINE_LOG_BUFFER_SIZE=2, TIMELINE_LOG_BUFFER_OVERFLOW_TASK=True
+    )
+    def test_full_buffer_handed_off_to_task(self):
+        submission = SubmissionFactory.create()
+
+        with patch(
+            "openforms.logging.tasks.create_timeline_logs.delay",
+            side_effect=lambda **kwargs: create_timeline_logs(**kwargs),
+        ) as mock_delay:
+            with buffered_timeline_logs():
+                logevent.submission_start(submission)
+                logevent.submission_auth(submission, delegated=True)
+
+                mock_delay.assert_called_once()
+
+        log_entry = TimelineLogProxy.objects.order_by("timestamp").last()
+        self.assertEqual(log_entry.content_object, submission)
+        self.assertEqual(log_entry.template, "logging/events/submission_auth.txt")
+        self.assertEqual(
+            log_entry.extra_data, {"log_event": "submission_auth", "delegated": True}
+        )
+
+    def test_middleware(self):
+        submission = SubmissionFactory.create()
+
+        def get_response(request):
+            logevent.submission_start(submission)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+            return HttpResponse()
+
+        middleware = TimelineLogBufferMiddleware(get_response)
+        request = RequestFactory().get("/")
+
+        with self.subTest("buffering disabled"):
+            with override_settings(TIMELINE_LOG_BUFFERED=False):
+                with self.assertRaises(AssertionError):
+                    middleware(request)
+
+        TimelineLogProxy.objects.all().delete()
+
+        with self.subTest("buffering enabled"):
+            with override_settings(TIMELINE_LOG_BUFFERED=True):
+                middleware(request)
+
+            self.assertEqual(TimelineLogProxy.objects.count(), 1)
@@ -40,6 +40,8 @@ from zgw_consumers.concurrent import parallel
 from openforms.plugins.exceptions import PluginNotEnabled
 from openforms.variables.constants import FormVariableSources
 
+from .cache import get_or_fetch
+
 if TYPE_CHECKING:  # pragma: nocover
     from openforms.formio.service import FormioConfigurationWrapper
     from openforms.submissions.models import Submission
@@ -66,7 +68,13 @@ def _fetch_prefill_values(
             raise PluginNotEnabled()
 
         try:
-            values = plugin.get_prefill_values(submission, fields, identifier_role)
+            identifier = plugin.get_identifier_value(submission, identifier_role)
+            values = get_or_fetch(
+                plugin_id,
+                identifier and f"{identifier_role}:{identifier}",
+                fields,
+                lambda: plugin.get_prefill_values(submission, fields, identifier_role),
+            )
         except Exception as e:
             logger.exception(f"exception in prefill plugin '{plugin_id}'")
             logevent.prefill_retrieve_failure(submission, plugin, e)
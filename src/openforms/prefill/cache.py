@@ -0,0 +1,170 @@
+"""
+Short-lived cache for the values retrieved by the prefill plugins.
+
+Users restarting a form (or multiple components/forms requiring the same data) cause
+the same BSN or KvK number to be looked up over and over again in the (slow) prefill
+backends. The retrieved values can be cached for
+``settings.PREFILL_CACHE_TIMEOUT`` seconds, which can be overridden per plugin with
+``settings.PREFILL_CACHE_PLUGIN_TIMEOUTS``. Caching is disabled by default.
+
+The retrieved values are personal data:
+
+* the cache keys are derived from the identifier with a keyed hash, so the identifier
+  itself never ends up in the cache (keys), and
+* the cached values are encrypted with a key derived from ``settings.SECRET_KEY``.
+
+Concurrent look-ups of the same values in a process (e.g. multiple threads handling
+requests of the same user) are coalesced into a single call to the backend.
+
+The number of cache hits and misses is counted per plugin, see :func:`get_stats`.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Iterable, TypedDict, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.encoding import force_bytes
+
+import elasticapm
+from cryptography.fernet import Fernet, InvalidToken
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_PREFIX = "prefill"
+
+_in_flight: dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+
+
+def get_timeout(plugin_id: str) -> int:
+    return settings.PREFILL_CACHE_PLUGIN_TIMEOUTS.get(
+        plugin_id, settings.PREFILL_CACHE_TIMEOUT
+    )
+
+
+def _get_fernet() -> Fernet:
+    digest = hashlib.sha256(force_bytes(f"prefill-cache:{settings.SECRET_KEY}"))
+    return Fernet(base64.urlsafe_b64encode(digest.digest()))
+
+
+def _get_key(plugin_id: str, identifier: str, attributes: Iterable[str]) -> str:
+    message = json.dumps([plugin_id, identifier, sorted(attributes)])
+    digest = hmac.new(
+        force_bytes(settings.SECRET_KEY), message.encode(), hashlib.sha256
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:{plugin_id}:{digest}"
+
+
+def _get_stats_key(plugin_id: str, stat: str) -> str:
+    return f"{CACHE_PREFIX}:stats:{plugin_id}:{stat}"
+
+
+def _count(plugin_id: str, stat: str) -> None:
+    elasticapm.label(prefill_cache=stat)
+    key = _get_stats_key(plugin_id, stat)
+    # the counters never expire, ``add`` only initializes them
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:  # evicted in the meantime
+        cache.add(key, 1, timeout=None)
+
+
+def get_stats(plugin_id: str) -> CacheStats:
+    """
+    Return the number of cache hits and misses of a plugin.
+    """
+    return {
+        "hits": cache.get(_get_stats_key(plugin_id, "hits"), 0),
+        "misses": cache.get(_get_stats_key(plugin_id, "misses"), 0),
+    }
+
+
+def reset_stats(plugin_id: str) -> None:
+    cache.delete_many(
+        [_get_stats_key(plugin_id, "hits"), _get_stats_key(plugin_id, "misses")]
+    )
+
+
+def _get_cached(key: str):
+    token: bytes | None = cache.get(key)
+    if token is None:
+        return None
+    try:
+        return json.loads(_get_fernet().decrypt(token))
+    except InvalidToken:
+        # e.g. after rotating the secret key
+        logger.info("Could not decrypt cached prefill values, ignoring them.")
+        return None
+
+
+def _set_cached(key: str, value, timeout: int) -> None:
+    token = _get_fernet().encrypt(json.dumps(value, cls=DjangoJSONEncoder).encode())
+    cache.set(key, token, timeout=timeout)
+
+
+def get_or_fetch(
+    plugin_id: str,
+    identifier: str | None,
+    attributes: Iterable[str],
+    fetch: Callable[[], T],
+) -> T:
+    """
+    Get the cached values of a plugin for an identifier, or fetch and cache them.
+
+    :param plugin_id: the plugin retrieving the values.
+    :param identifier: the BSN/KvK number... the values are retrieved for. Without
+      identifier, the values are not cached.
+    :param attributes: the attributes (or other parameters) determining the result.
+    :param fetch: callable retrieving the values from the backend. Empty results and
+      exceptions are not cached.
+    """
+    timeout = get_timeout(plugin_id)
+    if not timeout or not identifier:
+        return fetch()
+
+    key = _get_key(plugin_id, identifier, attributes)
+    if (values := _get_cached(key)) is not None:
+        _count(plugin_id, "hits")
+        return values
+
+    # coalesce concurrent calls - only the first caller fetches the values, the
+    # others wait for the result
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _in_flight[key] = Future()
+
+    if not is_owner:
+        _count(plugin_id, "hits")
+        return future.result()
+
+    _count(plugin_id, "misses")
+    try:
+        values = fetch()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        if values:
+            _set_cached(key, values, timeout)
+        future.set_result(values)
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+    return values
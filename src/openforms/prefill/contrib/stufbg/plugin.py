@@ -5,7 +5,7 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 import requests
-from glom import T as Target, glom
+from glom import Path, T as Target
 from lxml import etree
 
 from openforms.authentication.constants import AuthAttribute
@@ -90,6 +90,12 @@ ATTRIBUTES_TO_STUF_BG_MAPPING = {
     ],
 }
 
+# the (local) element names leading to the value of each attribute
+ATTRIBUTES_TO_STUF_BG_PATHS = {
+    attribute: Path(target).values()
+    for attribute, target in ATTRIBUTES_TO_STUF_BG_MAPPING.items()
+}
+
 
 @register("stufbg")
 class StufBgPrefill(BasePlugin):
@@ -103,21 +109,13 @@ class StufBgPrefill(BasePlugin):
         self, bsn: str, attributes: list[FieldChoices]
     ) -> dict[str, Any]:
         with get_client() as client:
-            data = client.get_values(bsn, [str(attr) for attr in attributes])
-
-        response_dict = {}
-        for attribute in attributes:
-            value = glom(data, ATTRIBUTES_TO_STUF_BG_MAPPING[attribute], default=None)
-            # if the XML element has attributes, we don't get a return value of the content,
-            # but rather an OrderedDict from xmltodict with the #text key for the content
-            # and @<attribute> keys for the attributes.
-            # E.g. <ns:geboortedatum StUF:indOnvolledigeDatum="M">19600701</ns:geboortedatum>,
-            # see #1617 for such a regression.
-            if isinstance(value, dict) and "#text" in value:
-                value = value["#text"]
-
-            if value and "@noValue" not in value:
-                response_dict[attribute] = value
+            response_dict = client.get_attribute_values(
+                bsn,
+                {
+                    str(attribute): ATTRIBUTES_TO_STUF_BG_PATHS[attribute]
+                    for attribute in attributes
+                },
+            )
 
         # postcodes in StUF BG responses have this form "[1-9][0-9]{3}[A-Z]{0,2}"
         # Our prefill tests expect roughly "[1-9][0-9]{3} [A-Z]{0,2}"
@@ -0,0 +1,37 @@
+from django.core.management import BaseCommand
+
+from openforms.formio.components.np_family_members.constants import (
+    FamilyMembersDataAPIChoices,
+)
+
+from ...cache import get_stats, get_timeout, reset_stats
+from ...registry import register
+
+
+class Command(BaseCommand):
+    help = "Output the number of prefill cache hits and misses per plugin"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after outputting them.",
+        )
+
+    def handle(self, **options):
+        plugin_ids = [plugin.identifier for plugin in register] + [
+            f"np_family_members_{data_api}"
+            for data_api in FamilyMembersDataAPIChoices.values
+        ]
+
+        for plugin_id in plugin_ids:
+            stats = get_stats(plugin_id)
+            total = stats["hits"] + stats["misses"]
+            hit_ratio = f"{stats['hits'] / total:.0%}" if total else "-"
+            self.stdout.write(
+                f"{plugin_id} (timeout: {get_timeout(plugin_id)}s): "
+                f"{stats['hits']} hits, {stats['misses']} misses, "
+                f"hit ratio: {hit_ratio}"
+            )
+            if options["reset"]:
+                reset_stats(plugin_id)
@@ -0,0 +1,133 @@
+import threading
+from io import StringIO
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..cache import get_or_fetch, get_stats
+
+
+@override_settings(PREFILL_CACHE_TIMEOUT=60, PREFILL_CACHE_PLUGIN_TIMEOUTS={})
+class PrefillCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_values_cached_per_identifier_and_attributes(self):
+        fetch = MagicMock(return_value={"name": "Jane"})
+
+        get_or_fetch("demo", "111222333", ["name"], fetch)
+        get_or_fetch("demo", "111222333", ["name"], fetch)
+        self.assertEqual(fetch.call_count, 1)
+
+        get_or_fetch("demo", "999990676", ["name"], fetch)
+        get_or_fetch("demo", "111222333", ["name", "address"], fetch)
+        get_or_fetch("other", "111222333", ["name"], fetch)
+        self.assertEqual(fetch.call_count, 4)
+
+        self.assertEqual(get_stats("demo"), {"hits": 1, "misses": 3})
+        self.assertEqual(get_stats("other"), {"hits": 0, "misses": 1})
+
+    def test_cached_values(self):
+        get_or_fetch("demo", "111222333", ["name"], lambda: {"name": "Jane"})
+
+        values = get_or_fetch("demo", "111222333", ["name"], lambda: {})
+
+        self.assertEqual(values, {"name": "Jane"})
+
+    def test_identifier_and_values_are_not_stored_in_plain_text(self):
+        get_or_fetch("demo", "111222333", ["name"], lambda: {"name": "Jane"})
+
+        for key, value in cache._cache.items():
+            with self.subTest(key=key):
+                self.assertNotIn("111222333", key)
+                self.assertNotIn(b"Jane", value)
+
+    @override_settings(PREFILL_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        fetch = MagicMock(return_value={"name": "Jane"})
+
+        get_or_fetch("demo", "111222333", ["name"], fetch)
+        get_or_fetch("demo", "111222333", ["name"], fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(get_stats("demo"), {"hits": 0, "misses": 0})
+
+    @override_settings(
+        PREFILL_CACHE_TIMEOUT=0, PREFILL_CACHE_PLUGIN_TIMEOUTS={"demo": 60}
+    )
+    def test_timeout_per_plugin(self):
+        fetch = MagicMock(return_value={"name": "Jane"})
+
+        for plugin_id in ("demo", "demo", "other", "other"):
+            get_or_fetch(plugin_id, "111222333", ["name"], fetch)
+
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_not_cached_without_identifier(self):
+        fetch = MagicMock(return_value={"name": "Jane"})
+
+        get_or_fetch("demo", None, ["name"], fetch)
+        get_or_fetch("demo", None, ["name"], fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_empty_results_and_errors_not_cached(self):
+        fetch = MagicMock(side_effect=[{}, ValueError("Boom"), {"name": "Jane"}])
+
+        get_or_fetch("demo", "111222333", ["name"], fetch)
+        with self.assertRaises(ValueError):
+            get_or_fetch("demo", "111222333", ["name"], fetch)
+        values = get_or_fetch("demo", "111222333", ["name"], fetch)
+
+        self.assertEqual(values, {"name": "Jane"})
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_concurrent_calls_are_coalesced(self):
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+        fetch = MagicMock(return_value={"name": "Jane"})
+
+        def slow_fetch():
+            fetch_started.set()
+            release_fetch.wait(timeout=5)
+            return fetch()
+
+        results = []
+        first = threading.Thread(
+            target=lambda: results.append(
+                get_or_fetch("demo", "111222333", ["name"], slow_fetch)
+            )
+        )
+        first.start()
+        fetch_started.wait(timeout=5)
+        second = threading.Thread(
+            target=lambda: results.append(
+                get_or_fetch("demo", "111222333", ["name"], slow_fetch)
+            )
+        )
+        second.start()
+        release_fetch.set()
+        first.join()
+        second.join()
+
+        self.assertEqual(results, [{"name": "Jane"}, {"name": "Jane"}])
+        fetch.assert_called_once()
+
+    def test_stats_command(self):
+        get_or_fetch("demo", "111222333", ["name"], lambda: {"name": "Jane"})
+        get_or_fetch("demo", "111222333", ["name"], lambda: {"name": "Jane"})
+        stdout = StringIO()
+
+        call_command("prefill_cache_stats", reset=True, stdout=stdout, no_color=True)
+
+        self.assertIn(
+            "demo (timeout: 60s): 1 hits, 1 misses, hit ratio: 50%", stdout.getvalue()
+        )
+        self.assertEqual(get_stats("demo"), {"hits": 0, "misses": 0})
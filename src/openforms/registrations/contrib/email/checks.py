@@ -4,11 +4,12 @@ from django.utils.translation import gettext_lazy as _
 
 from django_yubin import settings as yubin_settings
 
+from openforms.emails.connection_check import uses_yubin
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 
 
 def check_config():
-    if settings.EMAIL_BACKEND == "django_yubin.backends.QueuedEmailBackend":
+    if uses_yubin(settings.EMAIL_BACKEND):
         backend = yubin_settings.USE_BACKEND
     else:
         backend = settings.EMAIL_BACKEND
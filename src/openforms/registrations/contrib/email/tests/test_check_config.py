@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from openforms.plugins.exceptions import InvalidPluginConfiguration
+
+from ..checks import check_config
+
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+
+@patch("django_yubin.settings.USE_BACKEND", SMTP_BACKEND)
+class CheckConfigTests(SimpleTestCase):
+    def test_queued_backends_check_the_mailer_backend(self):
+        for backend in (
+            "django_yubin.backends.QueuedEmailBackend",
+            "openforms.emails.backends.BatchedQueuedEmailBackend",
+        ):
+            with (
+                self.subTest(backend=backend),
+                override_settings(EMAIL_BACKEND=backend),
+                patch(
+                    f"{SMTP_BACKEND}.open", side_effect=ConnectionRefusedError
+                ) as mock_open,
+            ):
+                with self.assertRaises(InvalidPluginConfiguration):
+                    check_config()
+
+                mock_open.assert_called_once_with()
+
+    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    def test_other_backends_checked_directly(self):
+        with patch(f"{SMTP_BACKEND}.open") as mock_open:
+            check_config()
+
+        mock_open.assert_not_called()
@@ -11,7 +11,10 @@ from openforms.contrib.zgw.service import (
     create_csv_document,
     create_report_document,
 )
-from openforms.registrations.utils import execute_unless_result_exists
+from openforms.registrations.utils import (
+    execute_unless_result_exists,
+    execute_unless_results_exist,
+)
 from openforms.submissions.exports import create_submission_export
 from openforms.submissions.mapping import SKIP, FieldConf
 from openforms.submissions.models import Submission, SubmissionReport
@@ -98,8 +101,12 @@ class ObjectsAPIRegistration(BasePlugin):
             # Register the attachments
             # TODO turn attachments into dictionary when giving users more options then
             # just urls.
-            attachments = []
-            for attachment in submission.attachments:
+            # the attachments are registered concurrently, the callbacks may not
+            # perform any database queries
+            document_callbacks = []
+            for attachment in submission.attachments.select_related(
+                "submission_step__submission"
+            ):
                 attachment_options = build_options(
                     options,
                     {
@@ -120,13 +127,25 @@ class ObjectsAPIRegistration(BasePlugin):
                     if value:
                         attachment_options[key] = value
 
-                attachment_document = create_attachment_document(
-                    client=documents_client,
-                    name=submission.form.admin_name,
-                    submission_attachment=attachment,
-                    options=attachment_options,
+                document_callbacks.append(
+                    (
+                        partial(
+                            create_attachment_document,
+                            client=documents_client,
+                            name=submission.form.admin_name,
+                            submission_attachment=attachment,
+                            options=attachment_options,
+                        ),
+                        f"intermediate.documents.{attachment.id}.document",
+                    )
+                )
+
+            attachments = [
+                attachment_document["url"]
+                for attachment_document in execute_unless_results_exist(
+                    document_callbacks, submission
                 )
-                attachments.append(attachment_document["url"])
+            ]
 
             # Create the CSV submission export, if requested.
             # If no CSV is being uploaded, then `assert csv_url == ""` applies.
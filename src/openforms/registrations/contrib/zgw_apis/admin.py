@@ -1,9 +1,11 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.utils.translation import gettext_lazy as _, ngettext
 
 from solo.admin import SingletonModelAdmin
 from zgw_consumers.admin import ListZaaktypenMixin
 
 from openforms.admin.decorators import suppress_requests_errors
+from openforms.contrib.zgw.cache import flush_catalogi_cache
 
 from .models import ZGWApiGroupConfig, ZgwConfig
 
@@ -20,3 +22,24 @@ class ZGWApiGroupConfigAdmin(ListZaaktypenMixin, admin.ModelAdmin):
         "zaaktype",
     ]
     # TODO implement informatieobjecttype suggestions similar to zaaktype
+
+    actions = ["flush_catalogi_cache"]
+
+    @admin.action(description=_("Flush the Catalogi API cache"))
+    def flush_catalogi_cache(self, request, queryset):
+        api_roots = {
+            group.ztc_service.api_root
+            for group in queryset.select_related("ztc_service")
+            if group.ztc_service
+        }
+        for api_root in api_roots:
+            flush_catalogi_cache(api_root)
+
+        messages.success(
+            request,
+            ngettext(
+                "Flushed the cache of {count} Catalogi API",
+                "Flushed the cache of {count} Catalogi APIs",
+                len(api_roots),
+            ).format(count=len(api_roots)),
+        )
@@ -0,0 +1,54 @@
+from django.core.management import BaseCommand
+
+import requests
+
+from openforms.forms.models import FormRegistrationBackend
+
+from ...client import get_catalogi_client
+from ...models import ZGWApiGroupConfig
+from ...plugin import ZGWRegistration
+
+
+class Command(BaseCommand):
+    help = (
+        "Populate the Catalogi API cache with the resources used for the "
+        "registration of submissions with the ZGW APIs."
+    )
+
+    def handle(self, **options):
+        zaaktypen: dict[ZGWApiGroupConfig, set[str]] = {
+            group: {group.zaaktype} if group.zaaktype else set()
+            for group in ZGWApiGroupConfig.objects.exclude(ztc_service=None)
+        }
+
+        backends = FormRegistrationBackend.objects.filter(backend="zgw-create-zaak")
+        for backend in backends:
+            serializer = ZGWRegistration.configuration_options(data=backend.options)
+            if not serializer.is_valid():
+                continue
+            backend_options = serializer.validated_data
+            group = ZGWRegistration.get_zgw_config(backend_options)
+            if group is None or group.ztc_service is None:
+                continue
+            group_zaaktypen = zaaktypen.setdefault(group, set())
+            if zaaktype := backend_options.get("zaaktype"):
+                group_zaaktypen.add(zaaktype)
+
+        for group, group_zaaktypen in zaaktypen.items():
+            try:
+                with get_catalogi_client(group) as client:
+                    client.get_all_catalogi()
+                    client.get_all_informatieobjecttypen()
+                    for zaaktype in sorted(group_zaaktypen):
+                        client.list_statustypen(zaaktype)
+                        client.list_roltypen(zaaktype)
+                        client.list_roltypen(
+                            zaaktype, omschrijving_generiek="initiator"
+                        )
+            except requests.RequestException as exc:
+                self.stderr.write(f"Could not warm the cache for '{group}': {exc}")
+                continue
+
+            self.stdout.write(
+                f"Warmed the cache for '{group}' ({len(group_zaaktypen)} zaaktypen)"
+            )
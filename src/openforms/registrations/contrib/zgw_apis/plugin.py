@@ -30,7 +30,7 @@ from ...base import BasePlugin
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
 from ...exceptions import RegistrationFailed
 from ...registry import register
-from ...utils import execute_unless_result_exists
+from ...utils import execute_unless_result_exists, execute_unless_results_exist
 from .checks import check_config
 from .client import get_catalogi_client, get_documents_client, get_zaken_client
 from .models import ZGWApiGroupConfig, ZgwConfig
@@ -376,8 +376,13 @@ class ZGWRegistration(BasePlugin):
                 "intermediate.status",
             )
 
-            # TODO: threading? asyncio?
-            for attachment in submission.attachments:
+            # the attachments are registered concurrently, the callbacks may not
+            # perform any database queries
+            attachments = list(
+                submission.attachments.select_related("submission_step__submission")
+            )
+            document_callbacks = []
+            for attachment in attachments:
                 # collect attributes of the attachment and add them to the configuration
                 # attribute names conform to the Documenten API specification
                 iot = attachment.informatieobjecttype or options["informatieobjecttype"]
@@ -404,27 +409,39 @@ class ZGWRegistration(BasePlugin):
                         "doc_vertrouwelijkheidaanduiding"
                     ] = vertrouwelijkheidaanduiding
 
-                attachment_document = execute_unless_result_exists(
-                    partial(
-                        create_attachment_document,
-                        client=documents_client,
-                        name=submission.form.admin_name,
-                        submission_attachment=attachment,
-                        options=doc_options,
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.document",
-                )
-                execute_unless_result_exists(
-                    partial(
-                        zaken_client.relate_document,
-                        zaak=zaak,
-                        document=attachment_document,
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.relation",
+                document_callbacks.append(
+                    (
+                        partial(
+                            create_attachment_document,
+                            client=documents_client,
+                            name=submission.form.admin_name,
+                            submission_attachment=attachment,
+                            options=doc_options,
+                        ),
+                        f"intermediate.documents.{attachment.id}.document",
+                    )
                 )
 
+            attachment_documents = execute_unless_results_exist(
+                document_callbacks, submission
+            )
+            execute_unless_results_exist(
+                [
+                    (
+                        partial(
+                            zaken_client.relate_document,
+                            zaak=zaak,
+                            document=attachment_document,
+                        ),
+                        f"intermediate.documents.{attachment.id}.relation",
+                    )
+                    for attachment, attachment_document in zip(
+                        attachments, attachment_documents
+                    )
+                ],
+                submission,
+            )
+
             result.update(
                 {
                     "document": summary_pdf_document,
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
@@ -61,3 +63,30 @@ class ZGWApiGroupConfigAdminTests(WebTest):
             self.assertEqual(
                 zgw_group.zaaktype, "https://catalogi-1.nl/api/v1/zaaktypen/1"
             )
+
+    @patch("openforms.registrations.contrib.zgw_apis.admin.flush_catalogi_cache")
+    def test_flush_catalogi_cache_action(self, m_flush):
+        zgw_group1 = ZGWApiGroupConfigFactory.create(
+            ztc_service__api_root="https://catalogus-1.nl/api/v1/",
+        )
+        zgw_group2 = ZGWApiGroupConfigFactory.create(
+            ztc_service__api_root="https://catalogus-2.nl/api/v1/",
+        )
+        ZGWApiGroupConfigFactory.create(
+            ztc_service__api_root="https://catalogus-3.nl/api/v1/",
+        )
+        superuser = SuperUserFactory.create()
+
+        changelist = self.app.get(
+            reverse("admin:zgw_apis_zgwapigroupconfig_changelist"), user=superuser
+        )
+        form = changelist.forms["changelist-form"]
+        form["action"] = "flush_catalogi_cache"
+        form["_selected_action"] = [zgw_group1.pk, zgw_group2.pk]
+        form.submit()
+
+        flushed_api_roots = {call.args[0] for call in m_flush.call_args_list}
+        self.assertEqual(
+            flushed_api_roots,
+            {"https://catalogus-1.nl/api/v1/", "https://catalogus-2.nl/api/v1/"},
+        )
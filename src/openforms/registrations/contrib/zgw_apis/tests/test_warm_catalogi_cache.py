@@ -0,0 +1,51 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from openforms.forms.tests.factories import FormRegistrationBackendFactory
+from openforms.utils.tests.cache import clear_caches
+
+from .factories import ZGWApiGroupConfigFactory
+
+
+@override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=60)
+class WarmCatalogiCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    @requests_mock.Mocker()
+    def test_warm_cache(self, m):
+        group = ZGWApiGroupConfigFactory.create(
+            ztc_service__api_root="https://catalogi.nl/api/v1/",
+            zaaktype="https://catalogi.nl/api/v1/zaaktypen/1",
+        )
+        FormRegistrationBackendFactory.create(
+            backend="zgw-create-zaak",
+            options={
+                "zgw_api_group": group.pk,
+                "zaaktype": "https://catalogi.nl/api/v1/zaaktypen/2",
+            },
+        )
+        for resource in ("catalogussen", "informatieobjecttypen"):
+            m.get(
+                f"https://catalogi.nl/api/v1/{resource}",
+                json={"count": 0, "next": None, "previous": None, "results": []},
+            )
+        for resource in ("statustypen", "roltypen"):
+            m.get(f"https://catalogi.nl/api/v1/{resource}", json={"results": []})
+
+        call_command("warm_catalogi_cache", stdout=StringIO(), stderr=StringIO())
+
+        # catalogi + informatieobjecttypen + 2 * (statustypen + 2 * roltypen)
+        self.assertEqual(len(m.request_history), 8)
+
+        with self.subTest("resources are cached"):
+            call_command("warm_catalogi_cache", stdout=StringIO(), stderr=StringIO())
+
+            self.assertEqual(len(m.request_history), 8)
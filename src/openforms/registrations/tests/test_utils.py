@@ -0,0 +1,52 @@
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..utils import execute_unless_results_exist
+
+
+class ExecuteUnlessResultsExistTests(TestCase):
+    def test_results_stored_in_order(self):
+        submission = SubmissionFactory.create(
+            registration_result={"intermediate": {"documents": {"1": "existing"}}}
+        )
+        callback1 = Mock(return_value="first")
+        callback2 = Mock(return_value="second")
+
+        results = execute_unless_results_exist(
+            [
+                (callback1, "intermediate.documents.1"),
+                (callback2, "intermediate.documents.2"),
+            ],
+            submission,
+        )
+
+        self.assertEqual(results, ["existing", "second"])
+        callback1.assert_not_called()
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result,
+            {"intermediate": {"documents": {"1": "existing", "2": "second"}}},
+        )
+
+    def test_successful_results_stored_on_failure(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertRaises(ZeroDivisionError):
+            execute_unless_results_exist(
+                [
+                    (lambda: "first", "intermediate.documents.1"),
+                    (lambda: 1 / 0, "intermediate.documents.2"),
+                    (lambda: "third", "intermediate.documents.3"),
+                ],
+                submission,
+                max_workers=2,
+            )
+
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result,
+            {"intermediate": {"documents": {"1": "first", "3": "third"}}},
+        )
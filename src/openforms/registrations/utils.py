@@ -1,11 +1,16 @@
-from typing import Any, Callable
+from concurrent.futures import as_completed
+from typing import Any, Callable, Sequence
 
 from glom import assign, glom
+from zgw_consumers.concurrent import parallel
 
 from openforms.submissions.models import Submission
 
 unset = object()
 
+# upper bound of concurrent requests to an external service during a registration
+MAX_CONCURRENT_REQUESTS = 4
+
 
 def execute_unless_result_exists(
     callback: Callable,
@@ -30,3 +35,55 @@ def execute_unless_result_exists(
     assign(submission.registration_result, spec, result, missing=dict)
     submission.save(update_fields=["registration_result"])
     return callback_result
+
+
+def execute_unless_results_exist(
+    callbacks: Sequence[tuple[Callable, str]],
+    submission: Submission,
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> list[Any]:
+    """
+    Concurrent variant of :func:`execute_unless_result_exists`.
+
+    The callbacks without an existing result are executed in a (bounded) thread pool.
+    The callbacks may only perform calls to external services and no database
+    queries - the results are stored from the calling thread as soon as a callback
+    completes. If any of the callbacks fail, the results of the others are still
+    stored before the (first) error is re-raised, so that retries skip them.
+
+    :param callbacks: pairs of the callback and the spec to store its result under.
+    :returns: the results, in the order of the callbacks.
+    """
+    if submission.registration_result is None:
+        submission.registration_result = {}
+
+    results = [
+        glom(submission.registration_result, spec, default=None)
+        for _, spec in callbacks
+    ]
+    pending = [index for index, result in enumerate(results) if not result]
+    if not pending:
+        return results
+
+    error = None
+    with parallel(max_workers=max_workers) as executor:
+        futures = {executor.submit(callbacks[index][0]): index for index in pending}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                error = error or exc
+                continue
+
+            assign(
+                submission.registration_result,
+                callbacks[index][1],
+                results[index],
+                missing=dict,
+            )
+            submission.save(update_fields=["registration_result"])
+
+    if error is not None:
+        raise error
+    return results
@@ -1,11 +1,17 @@
+import csv
 import dataclasses
-from typing import Iterator
+import json
+from tempfile import TemporaryFile
+from typing import IO, Iterable, Iterator, List, Tuple
 
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
 from tablib.formats._json import serialize_objects_handler
 
 from .models import Submission
@@ -30,6 +36,9 @@ class ExportFileTypes:
     XML = FileType("xml", "text/xml")
 
 
+EXPORT_BATCH_SIZE = 100
+
+
 def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
     renderer = Renderer(submission, mode=RenderModes.export, as_html=False)
     for data_nodes in renderer.get_children():
@@ -39,54 +48,225 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
-def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
+def iter_submissions(
+    queryset: SubmissionQuerySet, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[Submission]:
     """
-    Turn a submissions queryset into a tablib dataset for export.
+    Iterate over the submissions in the queryset, in batches of ``batch_size``.
 
-    .. note:: the queryset of submissions must all be of the same form!
+    The submission steps and value variables are prefetched for each batch rather than
+    queried for every submission, while only a single batch is held in memory at any
+    given time. The ordering of the queryset is preserved.
     """
-    # queryset *could* be empty
-    if not queryset:
-        return tablib.Dataset()
+    pks = list(queryset.values_list("pk", flat=True))
+    for start in range(0, len(pks), batch_size):
+        batch_pks = pks[start : start + batch_size]
+        batch = (
+            Submission.objects.filter(pk__in=batch_pks)
+            .select_related("form")
+            .prefetch_related("submissionstep_set", "submissionvaluevariable_set")
+        )
+        submissions = {submission.pk: submission for submission in batch}
+        for pk in batch_pks:
+            yield submissions[pk]
+
 
-    first_submission = queryset[0]
+def get_export_headers(submission: Submission) -> List[str]:
+    """
+    Determine the column headers of the export from a single submission.
+
+    .. note:: the headers are derived from the form configuration, so they apply to all
+       submissions of the same form.
+    """
     headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
+    if submission.form.translation_enabled:
         headers.append("Taalcode")
 
-    for data_node in iter_submission_data_nodes(first_submission):
+    for data_node in iter_submission_data_nodes(submission):
         if hasattr(data_node, "component"):
             headers.append(data_node.component["key"])
         elif hasattr(data_node, "variable"):
             headers.append(data_node.variable.key)
+    return headers
+
+
+def get_export_row(submission: Submission, translation_enabled: bool) -> list:
+    inzending_datum = (
+        make_naive(submission.completed_on) if submission.completed_on else None
+    )
+    submission_data = [
+        submission.form.admin_name,
+        inzending_datum,
+    ]
+    if translation_enabled:
+        submission_data.append(submission.language_code)
+    submission_data += [
+        data_node.value for data_node in iter_submission_data_nodes(submission)
+    ]
+    return submission_data
+
+
+def iter_submission_export(
+    queryset: SubmissionQuerySet, batch_size: int = EXPORT_BATCH_SIZE
+) -> Tuple[List[str], Iterator[list]]:
+    """
+    Turn a submissions queryset into the export headers and a lazy iterator of rows.
+
+    The header/column plan is computed once from the first submission, after which the
+    rows are produced one submission at a time.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    first_submission = queryset.first()
+    # queryset *could* be empty
+    if first_submission is None:
+        return [], iter([])
+
+    headers = get_export_headers(first_submission)
+    translation_enabled = first_submission.form.translation_enabled
+    rows = (
+        get_export_row(submission, translation_enabled)
+        for submission in iter_submissions(queryset, batch_size=batch_size)
+    )
+    return headers, rows
+
+
+def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
+    """
+    Turn a submissions queryset into a tablib dataset for export.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    headers, rows = iter_submission_export(queryset)
+    if not headers:
+        return tablib.Dataset()
 
     data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
+    return data
+
+
+class _Echo:
+    """
+    File-like object that hands back what is written to it, for streaming writers.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _stream_csv(headers: List[str], rows: Iterable[list]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    if headers:
+        yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
 
-    for submission in queryset:
-        inzending_datum = (
-            make_naive(submission.completed_on) if submission.completed_on else None
+
+def _stream_json(headers: List[str], rows: Iterable[list]) -> Iterator[str]:
+    # same output as the tablib JSON format, a list of objects
+    yield "["
+    for index, row in enumerate(rows):
+        serialized = json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
-        ]
-        if first_submission.form.translation_enabled:
-            submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
-    return data
+        yield f", {serialized}" if index else serialized
+    yield "]"
+
+
+def _stream_xml(headers: List[str], rows: Iterable[list]) -> Iterator[bytes]:
+    yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+    for row in rows:
+        elem = _xml_submission(dict(zip(headers, row)))
+        etree.indent(elem, level=1)
+        yield b"  " + etree.tostring(elem, encoding="utf8") + b"\n"
+    yield b"</submissions>\n"
+
+
+def _write_xlsx(headers: List[str], rows: Iterable[list], file: IO[bytes]) -> None:
+    """
+    Write the XLSX file in write-only mode, which streams the rows to disk.
+
+    The layout mimics the tablib XLSX format.
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Tablib Dataset")
+    worksheet.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.font = bold
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+
+    wrap_text = Alignment(wrap_text=True)
+    for row in rows:
+        cells = []
+        for value in row:
+            try:
+                cell = WriteOnlyCell(worksheet, value=value)
+            except (ValueError, TypeError):
+                cell = WriteOnlyCell(worksheet, value=str(value))
+            if isinstance(cell.value, str) and "\n" in cell.value:
+                cell.alignment = wrap_text
+            cells.append(cell)
+        worksheet.append(cells)
+
+    workbook.save(file)
+
+
+_STREAM_WRITERS = {
+    ExportFileTypes.CSV.extension: _stream_csv,
+    ExportFileTypes.JSON.extension: _stream_json,
+    ExportFileTypes.XML.extension: _stream_xml,
+}
+
+
+def write_submission_export(
+    queryset: SubmissionQuerySet, file_type: FileType, file: IO[bytes]
+) -> None:
+    """
+    Write the export of the submissions queryset to a (binary) file object.
+
+    The submissions are processed in batches and written incrementally, so that the
+    complete export never needs to be held in memory. The file may be a (temporary)
+    file on disk or a file that is subsequently saved to storage.
+    """
+    headers, rows = iter_submission_export(queryset)
+    if file_type.extension == ExportFileTypes.XLSX.extension:
+        _write_xlsx(headers, rows, file)
+        return
+
+    for chunk in _STREAM_WRITERS[file_type.extension](headers, rows):
+        file.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
 
 
 def export_submissions(
     queryset: SubmissionQuerySet, file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> StreamingHttpResponse:
     filename = f"submissions_export.{file_type.extension}"
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
+    # XLSX files are zip archives which can only be finalized once all rows are
+    # written, so spool them to a temporary file first.
+    if file_type.extension == ExportFileTypes.XLSX.extension:
+        file = TemporaryFile()
+        write_submission_export(queryset, file_type, file)
+        file.seek(0)
+        return FileResponse(
+            file,
+            as_attachment=True,
+            filename=filename,
+            content_type=file_type.content_type,
+        )
+
+    headers, rows = iter_submission_export(queryset)
+    response = StreamingHttpResponse(
+        _STREAM_WRITERS[file_type.extension](headers, rows),
         content_type=file_type.content_type,
     )
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
@@ -99,6 +279,14 @@ def _xml_basic_value(value) -> str:
     return str(serialize_objects_handler(value))
 
 
+def _xml_submission(row: dict) -> etree._Element:
+    elem = etree.Element("submission")
+    for key, value in row.items():
+        field = etree.SubElement(elem, "field", name=key)
+        _xml_value(field, value, wrap_single=True)
+    return elem
+
+
 def _xml_value(parent, value, wrap_single=False):
     if isinstance(value, list):
         for v in value:
@@ -141,10 +329,7 @@ class XMLKeyValueExport:
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            root.append(_xml_submission(row))
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
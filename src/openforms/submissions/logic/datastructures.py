@@ -1,5 +1,5 @@
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Tuple
 
 from openforms.formio.service import FormioData
 from openforms.typing import DataMapping
@@ -16,11 +16,11 @@ class DataContainer:
 
     state: SubmissionValueVariablesState
 
-    _initial_data: Tuple[Tuple[str, Any]] = field(init=False, default_factory=tuple)
+    _initial_data: DataMapping = field(init=False, default_factory=dict)
 
     def __post_init__(self):
-        # ensure the initial data is immutable
-        self._initial_data = tuple(self.data.items())  # record for logging purposes
+        # ensure the initial data is immutable - the state updates the data in place
+        self._initial_data = deepcopy(self.data)  # record for logging purposes
 
     @property
     def initial_data(self) -> DataMapping:
@@ -35,14 +35,10 @@ class DataContainer:
         the static variables.
 
         :return: A datamapping (key: variable key, value: variable value) ready for
-          (template context) evaluation.
+          (template context) evaluation. The mapping is kept up to date by the state and
+          must not be mutated.
         """
-        dynamic_values = {
-            key: variable.to_python() for key, variable in self.state.variables.items()
-        }
-        static_values = self.state.static_data()
-        nested_data = FormioData({**dynamic_values, **static_values})
-        return nested_data.data
+        return self.state.get_python_data()
 
     def update(self, updates: DataMapping) -> None:
         """
@@ -1,13 +1,24 @@
+import hashlib
+import json
 import operator
+from collections import defaultdict
+from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Callable, Iterable, Iterator, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from django.core.cache import cache
 
 import elasticapm
-from json_logic import jsonLogic
+from json_logic import get_var
 
 from openforms.forms.models import FormLogic, FormStep
-from openforms.typing import JSONValue
+from openforms.typing import DataMapping, JSONValue
+from openforms.utils.json_logic import introspect_json_logic
+from openforms.utils.json_logic.compilation import (
+    CompiledExpression,
+    compile_expression,
+)
 
 from ..models import Submission, SubmissionStep
 from .actions import ActionOperation
@@ -110,6 +121,184 @@ def get_current_step(submission: Submission) -> Optional[SubmissionStep]:
     return step
 
 
+# upper bound for the number of compiled rule triggers kept in memory per process
+MAX_COMPILED_RULES = 5000
+
+TRIGGER_STATE_CACHE_KEY = "submissions:logic-trigger-state:{uuid}"
+TRIGGER_STATE_TIMEOUT = 60 * 60  # seconds
+
+RuleKey = tuple[int, str]
+"""
+The primary key of a rule and the hash of its trigger expression, identifying the
+version of a (saved) rule.
+"""
+
+_compiled_rules: dict[RuleKey, "CompiledRule"] = {}
+_rule_set_indices: dict[tuple[RuleKey, ...], "RuleSetIndex"] = {}
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    The trigger of a logic rule, prepared for (repeated) evaluation.
+    """
+
+    trigger: CompiledExpression
+    input_keys: frozenset[str] | None
+    """
+    The variable keys that the trigger reads. ``None`` if the trigger outcome cannot
+    be derived from its inputs alone, e.g. when it depends on the current date.
+    """
+
+
+def get_rule_key(rule: FormLogic) -> RuleKey | None:
+    """
+    Get the key identifying the version of a saved rule.
+
+    The hash is computed once per rule instance - the rules are loaded (and cached on
+    the form) once per request, see :func:`get_rules_to_evaluate`.
+    """
+    if not rule.pk:
+        return None
+    if (digest := getattr(rule, "_trigger_hash", None)) is None:
+        digest = rule._trigger_hash = hashlib.md5(
+            json.dumps(rule.json_logic_trigger, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+    return (rule.pk, digest)
+
+
+def _compile_rule(rule: FormLogic) -> CompiledRule:
+    expression = deepcopy(rule.json_logic_trigger)
+    try:
+        input_keys = introspect_json_logic(expression).get_input_keys()
+    except Exception:  # invalid expressions are reported during evaluation
+        input_keys = None
+    return CompiledRule(
+        trigger=compile_expression(expression),
+        input_keys=frozenset(input_keys) if input_keys is not None else None,
+    )
+
+
+def get_compiled_rule(rule: FormLogic) -> CompiledRule:
+    """
+    Get the compiled trigger of a logic rule.
+
+    Compiled triggers are cached in memory per version of the rule (see
+    :func:`get_rule_key`), so every version of a rule is compiled only once.
+    """
+    if (key := get_rule_key(rule)) is None:
+        return _compile_rule(rule)
+
+    if (compiled := _compiled_rules.get(key)) is None:
+        compiled = _compile_rule(rule)
+        if len(_compiled_rules) >= MAX_COMPILED_RULES:
+            _compiled_rules.clear()
+        _compiled_rules[key] = compiled
+    return compiled
+
+
+_missing = object()
+
+
+def _is_affected(input_key: str, changed_key: str) -> bool:
+    # a change of a container also changes its nested keys, and vice versa
+    return (
+        input_key == changed_key
+        or input_key.startswith(f"{changed_key}.")
+        or changed_key.startswith(f"{input_key}.")
+    )
+
+
+@dataclass(frozen=True)
+class RuleSetIndex:
+    """
+    Dependency index of a set of rules, mapping the variable keys to the rules whose
+    trigger reads them.
+    """
+
+    rules_by_variable: dict[str, frozenset[RuleKey]]
+    always_evaluated: frozenset[RuleKey]
+    """
+    The rules of which the trigger outcome does not only depend on their inputs.
+    """
+
+    def get_input_values(self, data: DataMapping) -> dict[str, JSONValue]:
+        return {key: deepcopy(get_var(data, key)) for key in self.rules_by_variable}
+
+    def get_affected_rules(self, changed_keys: Iterable[str]) -> set[RuleKey]:
+        affected = set(self.always_evaluated)
+        for changed_key in changed_keys:
+            for input_key, rule_keys in self.rules_by_variable.items():
+                if _is_affected(input_key, changed_key):
+                    affected.update(rule_keys)
+        return affected
+
+
+def get_rule_set_index(rules: Sequence[FormLogic]) -> RuleSetIndex:
+    """
+    Get the dependency index of the given rules, cached per version of the rules.
+    """
+    rule_keys = tuple(key for rule in rules if (key := get_rule_key(rule)))
+    if (index := _rule_set_indices.get(rule_keys)) is not None:
+        return index
+
+    rules_by_variable: dict[str, set[RuleKey]] = defaultdict(set)
+    always_evaluated = set()
+    for rule in rules:
+        if (key := get_rule_key(rule)) is None:
+            continue
+        input_keys = get_compiled_rule(rule).input_keys
+        if input_keys is None:
+            always_evaluated.add(key)
+            continue
+        for input_key in input_keys:
+            rules_by_variable[input_key].add(key)
+
+    index = RuleSetIndex(
+        rules_by_variable={
+            input_key: frozenset(keys) for input_key, keys in rules_by_variable.items()
+        },
+        always_evaluated=frozenset(always_evaluated),
+    )
+    if len(_rule_set_indices) >= MAX_COMPILED_RULES:
+        _rule_set_indices.clear()
+    _rule_set_indices[rule_keys] = index
+    return index
+
+
+@dataclass
+class TriggerState:
+    """
+    The trigger outcomes of the last logic evaluation of a submission.
+    """
+
+    input_values: dict[str, JSONValue]
+    """
+    The values of the input variables at the start of the evaluation.
+    """
+    mutated_keys: set[str] = field(default_factory=set)
+    """
+    The variables updated by the actions during the evaluation - the rules reading
+    them may have seen other values than the input values.
+    """
+    outcomes: dict[RuleKey, bool] = field(default_factory=dict)
+
+
+def _get_trigger_state_cache_key(submission: Submission) -> str:
+    return TRIGGER_STATE_CACHE_KEY.format(uuid=submission.uuid)
+
+
+def _evaluate_trigger(rule: FormLogic, data: DataMapping) -> tuple[bool, bool]:
+    """
+    :returns: the trigger outcome, and whether it was evaluated without errors.
+    """
+    triggered = succeeded = False
+    with log_errors(rule.json_logic_trigger, rule):
+        triggered = bool(get_compiled_rule(rule).trigger(data))
+        succeeded = True
+    return triggered, succeeded
+
+
 @dataclass()
 class EvaluatedRule:
     rule: FormLogic
@@ -133,6 +322,13 @@ def iter_evaluate_rules(
     action operator that updates a variable is processed immediately. The caller is
     responsible for processing (all other) actions accordingly.
 
+    Rule triggers are evaluated from their compiled form, see
+    :func:`get_compiled_rule`. The trigger outcomes are remembered per submission
+    (in the cache) together with the values of the variables they read, so that on
+    the next evaluation only the triggers of which an input variable changed are
+    evaluated again, see :class:`RuleSetIndex`. Triggers that don't only depend on
+    their inputs (e.g. on the current date) are always evaluated.
+
     :arg rules: An iterable of form logic rules to evaluate.
     :arg data_container: The :class:`DataContainer` instance wrapping the
       submission/step data and everything contained within. Note that the internal state
@@ -142,18 +338,45 @@ def iter_evaluate_rules(
       sole argument. Useful to gather metadata about rule evaluation.
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
+    rules = list(rules)
+    index = get_rule_set_index(rules)
+    cache_key = _get_trigger_state_cache_key(submission)
+    previous_state: TriggerState | None = (
+        cache.get(cache_key) if submission.pk else None
+    )
+    state = TriggerState(input_values=index.get_input_values(data_container.data))
+
+    if previous_state is None:
+        changed_rules = None  # everything needs to be evaluated
+    else:
+        changed_keys = {
+            key
+            for key, value in state.input_values.items()
+            if previous_state.input_values.get(key, _missing) != value
+        }
+        changed_rules = index.get_affected_rules(
+            changed_keys | previous_state.mutated_keys
+        )
+
     for rule in rules:
         with elasticapm.capture_span(
             "evaluate_rule",
             span_type="app.submissions.logic",
             labels={"ruleId": rule.pk},
         ):
-            triggered = False
-            with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(
-                    jsonLogic(rule.json_logic_trigger, data_container.data)
-                )
-
+            rule_key = get_rule_key(rule)
+            if (
+                changed_rules is not None
+                and rule_key not in changed_rules
+                and rule_key in previous_state.outcomes
+            ):
+                triggered = previous_state.outcomes[rule_key]
+            else:
+                triggered, succeeded = _evaluate_trigger(rule, data_container.data)
+                if not succeeded:
+                    rule_key = None  # log the errors again on the next evaluation
+            if rule_key is not None:
+                state.outcomes[rule_key] = triggered
             evaluated_rule = EvaluatedRule(rule=rule, triggered=triggered)
 
             if not triggered:
@@ -166,5 +389,11 @@ def iter_evaluate_rules(
                     data_container.data, log=log, submission=submission
                 ):
                     data_container.update(mutations)
+                    state.mutated_keys.update(mutations)
+                    if changed_rules is not None:
+                        changed_rules |= index.get_affected_rules(mutations)
                 yield operation
             on_rule_check(evaluated_rule)
+
+    if submission.pk:
+        cache.set(cache_key, state, timeout=TRIGGER_STATE_TIMEOUT)
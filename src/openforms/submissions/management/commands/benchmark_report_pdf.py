@@ -0,0 +1,49 @@
+from django.utils.translation import override
+
+from openforms.config.templatetags.theme import THEME_OVERRIDE_CONTEXT_VAR
+from openforms.utils.management.benchmark import BenchmarkCommand
+from openforms.utils.pdf import get_asset_cache_info, render_to_pdf
+
+from ...models import Submission
+from ...report import Report
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Render the report PDF of a given submission repeatedly and output the "
+        "timings. The generated PDFs are not saved."
+    )
+
+    unit = "s"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "submission_id",
+            type=int,
+            help="Submission ID to render the report for.",
+        )
+
+    def handle(self, **options):
+        def get_submission() -> Submission:
+            # fresh instance every time, like the celery task does
+            return Submission.objects.get(pk=options["submission_id"])
+
+        def render_report(submission: Submission) -> None:
+            with override(submission.language_code):
+                render_to_pdf(
+                    "report/submission_report.html",
+                    context={
+                        "report": Report(submission),
+                        THEME_OVERRIDE_CONTEXT_VAR: submission.form.theme,
+                    },
+                )
+
+        self.benchmark(
+            "Report",
+            render_report,
+            iterations=options["iterations"],
+            setup=get_submission,
+            verbose=True,
+        )
+        self.stdout.write(f"Asset cache: {get_asset_cache_info()}")
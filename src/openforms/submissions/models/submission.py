@@ -18,6 +18,7 @@ from glom import glom
 from openforms.config.models import GlobalConfiguration
 from openforms.formio.datastructures import FormioConfigurationWrapper
 from openforms.forms.models import FormRegistrationBackend, FormStep
+from openforms.forms.structure import get_form_structure
 from openforms.logging.logevent import registration_debug
 from openforms.payments.constants import PaymentStatus
 from openforms.template import openforms_backend, render_from_string
@@ -480,9 +481,18 @@ class Submission(models.Model):
         if hasattr(self, "_execution_state") and not refresh:
             return self._execution_state
 
-        form_steps = list(
-            self.form.formstep_set.select_related("form_definition").order_by("order")
-        )
+        # within a request, the form structure is only queried once for all submission
+        # instances
+        if (form_structure := get_form_structure(self.form)) is not None:
+            form_steps = form_structure.form_steps
+            self.form._cached_form_variables = form_structure.form_variables
+            self.form._cached_logic_rules = form_structure.logic_rules
+        else:
+            form_steps = list(
+                self.form.formstep_set.select_related("form_definition").order_by(
+                    "order"
+                )
+            )
         # ⚡️ no select_related/prefetch ON PURPOSE - while processing the form steps,
         # we're doing this in python as we have the objects already from the query
         # above.
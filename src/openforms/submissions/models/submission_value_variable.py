@@ -1,12 +1,14 @@
+from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import DEFERRED
 from django.utils import timezone
 from django.utils.dateparse import parse_date
-from django.utils.functional import empty
 from django.utils.translation import gettext_lazy as _
 
 from openforms.formio.service import FormioData
@@ -23,12 +25,33 @@ if TYPE_CHECKING:  # pragma: nocover
     from .submission_step import SubmissionStep
 
 
+# fields of which the persisted values are tracked to skip updating unchanged variables
+TRACKED_FIELDS = ("value", "source")
+
+
 class ValueEncoder(DjangoJSONEncoder):
     def default(self, obj: JSONEncodable | JSONSerializable) -> JSONEncodable:
         to_json = getattr(obj, "__json__", None)
         return to_json() if callable(to_json) else super().default(obj)
 
 
+def _get_overlapping_keys(keys: Iterable[str]) -> frozenset[str]:
+    """
+    Find the keys that are (nested) inside the value of another key.
+
+    Assigning the values of these keys depends on the order of assignment, e.g.
+    ``{"a": {}, "a.b": 1}``.
+    """
+    all_keys = set(keys)
+    overlapping = set()
+    for key in all_keys:
+        bits = key.split(".")
+        for depth in range(1, len(bits)):
+            if (prefix := ".".join(bits[:depth])) in all_keys:
+                overlapping.update({prefix, key})
+    return frozenset(overlapping)
+
+
 @dataclass
 class SubmissionValueVariablesState:
     submission: "Submission"
@@ -36,11 +59,14 @@ class SubmissionValueVariablesState:
         init=False, default=None
     )
     _static_data: Optional[Dict[str, Any]] = field(init=False, default=None)
+    _python_data: Optional[FormioData] = field(init=False, default=None)
+    _overlapping_keys: frozenset[str] = field(init=False, default=frozenset())
 
     @property
     def variables(self) -> Dict[str, "SubmissionValueVariable"]:
         if not self._variables:
             self._variables = self.collect_variables()
+            self._python_data = None
         return self._variables
 
     @property
@@ -87,7 +113,8 @@ class SubmissionValueVariablesState:
         configuration_wrapper = (
             submission_step.form_step.form_definition.configuration_wrapper
         )
-        keys_in_step = list(configuration_wrapper.component_map.keys())
+        # mapping of component key to path, used for O(1) membership tests
+        keys_in_step = configuration_wrapper.component_index.paths
 
         variables = self.variables
         if not include_unsaved:
@@ -108,10 +135,13 @@ class SubmissionValueVariablesState:
             for form_step in submission_state.form_steps
         }
 
-        # Build a collection of all form variables
+        # Build a collection of all form variables - the form variables may be provided
+        # by the (request-scoped) form structure cache
+        form_variables = getattr(self.submission.form, "_cached_form_variables", None)
+        if form_variables is None:
+            form_variables = self.submission.form.formvariable_set.all()
         all_form_variables = {
-            form_variable.key: form_variable
-            for form_variable in self.submission.form.formvariable_set.all()
+            form_variable.key: form_variable for form_variable in form_variables
         }
         # optimize the access from form_variable.form_definition using the already
         # existing map, saving a `select_related` call on data we (probably) already
@@ -154,6 +184,38 @@ class SubmissionValueVariablesState:
         for key in keys:
             if key in self._variables:
                 del self._variables[key]
+        self._python_data = None
+
+    def get_python_data(self) -> DataMapping:
+        """
+        Get the (nested) data of all variable values, converted to Python objects.
+
+        The values of the static variables are included too. The data is built once and
+        kept up to date by :meth:`set_values`, so it must be treated as read-only.
+        """
+        if self._python_data is None:
+            dynamic_values = {
+                key: variable.to_python() for key, variable in self.variables.items()
+            }
+            flat_data = {**dynamic_values, **self.static_data()}
+            self._python_data = FormioData(flat_data)
+            self._overlapping_keys = _get_overlapping_keys(flat_data)
+        return self._python_data.data
+
+    def _update_python_data(self, keys: Iterable[str]) -> None:
+        if self._python_data is None:
+            return
+
+        static_data = self.static_data()
+        for key in keys:
+            # static variables take precedence
+            if key in static_data:
+                continue
+            # the result depends on the order of assignments - rebuild everything
+            if key in self._overlapping_keys:
+                self._python_data = None
+                return
+            self._python_data[key] = self.variables[key].to_python()
 
     def static_data(self) -> dict:
         if self._static_data is None:
@@ -179,8 +241,11 @@ class SubmissionValueVariablesState:
 
             variable.value = data[variable.key]
             variable.source = SubmissionValueVariableSources.prefill
+        self._python_data = None
 
-        SubmissionValueVariable.objects.bulk_create(variables_to_prefill)
+        SubmissionValueVariable.objects.bulk_persist(
+            variables_to_prefill, fields=("value", "source")
+        )
 
     def set_values(self, data: DataMapping) -> None:
         """
@@ -195,15 +260,38 @@ class SubmissionValueVariablesState:
         .. todo:: apply variable.datatype/format to obtain python objects? This also
            needs to properly serialize back to JSON though!
         """
-        formio_data = FormioData(data)
-        for key, variable in self.variables.items():
-            new_value = formio_data.get(key, default=empty)
-            if new_value is empty:
-                continue
-            variable.value = new_value
+        new_values = FormioData(data).to_flat(self.variables)
+        for key, new_value in new_values.items():
+            self.variables[key].value = new_value
+        self._update_python_data(new_values)
 
 
 class SubmissionValueVariableManager(models.Manager):
+    def bulk_persist(
+        self,
+        variables: Iterable["SubmissionValueVariable"],
+        fields: Sequence[str] = ("value",),
+    ) -> None:
+        """
+        Persist the new and changed variables in (at most) two queries.
+
+        Variables that were saved before are only updated if any of ``fields`` changed
+        since they were loaded from (or saved to) the database.
+        """
+        variables_to_create = []
+        variables_to_update = []
+        for variable in variables:
+            if not variable.pk:
+                variables_to_create.append(variable)
+            elif variable.has_changed(fields):
+                variables_to_update.append(variable)
+
+        self.bulk_create(variables_to_create)
+        self.bulk_update(variables_to_update, fields=fields)
+
+        for variable in chain(variables_to_create, variables_to_update):
+            variable.track_persisted_state()
+
     def bulk_create_or_update_from_data(
         self,
         data: DataMapping,
@@ -222,28 +310,25 @@ class SubmissionValueVariableManager(models.Manager):
                 )
             )
 
-        variables_to_create = []
-        variables_to_update = []
+        variables_to_persist = []
         variables_keys_to_delete = []
-        formio_data = FormioData(data)
+        new_values = FormioData(data).to_flat(submission_variables)
         for key, variable in submission_variables.items():
-            try:
-                variable.value = formio_data[key]
-            except KeyError:
-                if update_missing_variables:
-                    if variable.pk:
-                        variables_keys_to_delete.append(variable.key)
-                    else:
-                        variable.value = variable.form_variable.get_initial_value()
-                    continue
+            if key in new_values:
+                variable.value = new_values[key]
+            elif update_missing_variables:
+                if variable.pk:
+                    variables_keys_to_delete.append(variable.key)
+                else:
+                    variable.value = variable.form_variable.get_initial_value()
+                continue
 
-            if not variable.pk:
-                variables_to_create.append(variable)
-            else:
-                variables_to_update.append(variable)
+            variables_to_persist.append(variable)
 
-        self.bulk_create(variables_to_create)
-        self.bulk_update(variables_to_update, fields=["value"])
+        # the values were updated outside of ``set_values``
+        submission_value_variables_state._python_data = None
+
+        self.bulk_persist(variables_to_persist)
         self.filter(submission=submission, key__in=variables_keys_to_delete).delete()
 
         # Variables that are deleted are not automatically updated in the state
@@ -314,6 +399,38 @@ class SubmissionValueVariable(models.Model):
         verbose_name_plural = _("Submission values variables")
         unique_together = [["submission", "key"], ["submission", "form_variable"]]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.track_persisted_state()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.track_persisted_state()
+
+    def track_persisted_state(self) -> None:
+        # deferred fields are absent from the instance ``__dict__``. Containers are
+        # copied, as they may be mutated in place.
+        self._persisted_state = {
+            field: deepcopy(value) if isinstance(value, (dict, list)) else value
+            for field in TRACKED_FIELDS
+            if (value := self.__dict__.get(field, DEFERRED)) is not DEFERRED
+        }
+
+    def has_changed(self, fields: Iterable[str]) -> bool:
+        """
+        Check if any of the fields changed since the instance was loaded or saved.
+
+        Instances whose persisted state is unknown are considered changed.
+        """
+        persisted_state = getattr(self, "_persisted_state", {})
+        return any(
+            field not in persisted_state
+            or persisted_state[field] != getattr(self, field)
+            for field in fields
+        )
+
     def __str__(self):
         if self.form_variable:
             return _("Submission value variable {name}").format(
@@ -57,6 +57,37 @@ class SubmissionQuerySet(models.QuerySet):
 
         return annotation
 
+    def remove_sensitive_data(self) -> None:
+        """
+        Bulk version of :meth:`openforms.submissions.models.Submission.remove_sensitive_data`.
+        """
+        from openforms.authentication.models import AuthInfo
+
+        from .constants import SubmissionValueVariableSources
+        from .models import SubmissionFileAttachment, SubmissionValueVariable
+
+        AuthInfo.objects.filter(submission__in=self).update(value="")
+
+        SubmissionValueVariable.objects.filter(
+            submission__in=self, form_variable__is_sensitive_data=True
+        ).update(value="", source=SubmissionValueVariableSources.sensitive_data_cleaner)
+
+        SubmissionFileAttachment.objects.filter(
+            submission_step__submission__in=self,
+            submission_variable__form_variable__is_sensitive_data=True,
+        ).delete()
+
+        # We do keep the representation, as that is used in PDF and confirmation e-mail
+        # generation and is usually a label derived from the source fields.
+        co_signed_submissions = list(
+            self.exclude(co_sign_data={}).only("pk", "co_sign_data")
+        )
+        for submission in co_signed_submissions:
+            submission.co_sign_data.update({"identifier": "", "fields": {}})
+        self.model.objects.bulk_update(co_signed_submissions, fields=["co_sign_data"])
+
+        self.update(_is_cleaned=True)
+
 
 class BaseSubmissionManager(models.Manager):
     @transaction.atomic
@@ -5,8 +5,8 @@ The renderer is the public interface to rendering submissions in particular rend
 modes. It is aware of the intrinsic tree-like structure of a submission and associated
 printable data.
 """
-from dataclasses import dataclass
-from typing import Iterator, Union
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Union
 
 from openforms.forms.models import Form
 from openforms.variables.rendering.nodes import VariablesNode
@@ -33,6 +33,9 @@ class Renderer:
     submission: Submission
     mode: RenderModes
     as_html: bool
+    _step_nodes: Optional[List["SubmissionStepNode"]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self.dummy_request = get_request()
@@ -62,10 +65,30 @@ class Renderer:
         else:
             return True
 
-    def get_children(self) -> Iterator[Union["SubmissionStepNode", "VariablesNode"]]:
+    def load_data(self) -> None:
         """
-        Produce only the direct child nodes.
+        Load all the data required for rendering upfront.
+
+        The execution state, submission variables and (if relevant) attachments are
+        loaded with a fixed number of queries and the form logic is evaluated exactly once for
+        every step. The resulting (in-memory) snapshot is used by all the nodes,
+        no matter how often the node tree is walked (e.g. checking for children in
+        a template before iterating over them).
         """
+        if self._step_nodes is not None:
+            return
+
+        execution_state = self.submission.load_execution_state()
+        self.submission.load_submission_value_variables_state().variables
+        has_file_components = any(
+            form_step.form_definition.configuration_wrapper.get_keys_of_type("file")
+            for form_step in execution_state.form_steps
+        )
+        if has_file_components:
+            self.submission.get_merged_attachments()
+        self._step_nodes = list(self._get_step_nodes())
+
+    def _get_step_nodes(self) -> Iterator["SubmissionStepNode"]:
         submission_data = self.submission.data
         for step in self.steps:
             new_configuration = evaluate_form_logic(
@@ -93,6 +116,13 @@ class Renderer:
             #     continue
             yield submission_step_node
 
+    def get_children(self) -> Iterator[Union["SubmissionStepNode", "VariablesNode"]]:
+        """
+        Produce only the direct child nodes.
+        """
+        self.load_data()
+        yield from self._step_nodes
+
         variables_node = VariablesNode(renderer=self, submission=self.submission)
         yield variables_node
 
@@ -1,14 +1,22 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
+from openforms.forms.models import FormLogic
 from openforms.forms.tests.factories import (
     FormFactory,
     FormLogicFactory,
     FormStepFactory,
     FormVariableFactory,
 )
+from openforms.utils.json_logic.compilation import compile_expression
+from openforms.utils.tests.cache import clear_caches
 from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
 
 from ...form_logic import evaluate_form_logic
+from ...logic.datastructures import DataContainer
+from ...logic.rules import _compiled_rules, _evaluate_trigger, iter_evaluate_rules
+from ...models import Submission
 from ..factories import SubmissionFactory, SubmissionStepFactory
 
 
@@ -164,3 +172,146 @@ class DeterministicEvaluationTests(TestCase):
 
             state = submission.load_submission_value_variables_state()
             self.assertEqual(ss3.data, {"d": 6})
+
+    @patch.dict(_compiled_rules, clear=True)
+    def test_triggers_compiled_once_per_rule_version(self):
+        form = FormFactory.create()
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"type": "textfield", "key": "a"}]
+            },
+        )
+        rule = FormLogicFactory.create(
+            form=form, json_logic_trigger={"==": [{"var": "a"}, "x"]}
+        )
+        submission = SubmissionFactory.create(form=form)
+        state = submission.load_submission_value_variables_state()
+        state.set_values({"a": "x"})
+        data_container = DataContainer(state=state)
+
+        with patch(
+            "openforms.submissions.logic.rules.compile_expression",
+            side_effect=compile_expression,
+        ) as mock_compile:
+            list(iter_evaluate_rules([rule], data_container, submission))
+            list(iter_evaluate_rules([rule], data_container, submission))
+
+            self.assertEqual(mock_compile.call_count, 1)
+
+            rule.json_logic_trigger = {"==": [{"var": "a"}, "y"]}
+            rule.save()
+            rule = FormLogic.objects.get(pk=rule.pk)
+            list(iter_evaluate_rules([rule], data_container, submission))
+
+            self.assertEqual(mock_compile.call_count, 2)
+
+
+class TriggerDependencyTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.form = FormFactory.create()
+        FormStepFactory.create(
+            form=self.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "a"},
+                    {"type": "textfield", "key": "b"},
+                ]
+            },
+        )
+        self.submission = SubmissionFactory.create(form=self.form)
+
+    def _evaluate(self, data) -> list[tuple[int, bool]]:
+        # fresh instances, like in every logic check request
+        submission = Submission.objects.get(pk=self.submission.pk)
+        rules = list(FormLogic.objects.filter(form=self.form).order_by("order"))
+        state = submission.load_submission_value_variables_state()
+        state.set_values(data)
+        evaluated_rules = []
+
+        with patch(
+            "openforms.submissions.logic.rules._evaluate_trigger",
+            side_effect=_evaluate_trigger,
+        ) as mock_evaluate:
+            list(
+                iter_evaluate_rules(
+                    rules,
+                    DataContainer(state=state),
+                    submission,
+                    on_rule_check=evaluated_rules.append,
+                )
+            )
+
+        self.evaluated = [call.args[0].pk for call in mock_evaluate.call_args_list]
+        return [
+            (evaluated.rule.pk, evaluated.triggered) for evaluated in evaluated_rules
+        ]
+
+    def test_only_triggers_with_changed_inputs_evaluated(self):
+        rule_a = FormLogicFactory.create(
+            form=self.form, order=0, json_logic_trigger={"==": [{"var": "a"}, "x"]}
+        )
+        rule_b = FormLogicFactory.create(
+            form=self.form, order=1, json_logic_trigger={"==": [{"var": "b"}, "y"]}
+        )
+        rule_today = FormLogicFactory.create(
+            form=self.form,
+            order=2,
+            json_logic_trigger={">": [{"today": []}, {"date": "2000-01-01"}]},
+        )
+
+        with self.subTest("first evaluation"):
+            outcomes = self._evaluate({"a": "x", "b": ""})
+
+            self.assertEqual(self.evaluated, [rule_a.pk, rule_b.pk, rule_today.pk])
+            self.assertEqual(
+                outcomes, [(rule_a.pk, True), (rule_b.pk, False), (rule_today.pk, True)]
+            )
+
+        with self.subTest("unchanged inputs"):
+            outcomes = self._evaluate({"a": "x", "b": ""})
+
+            self.assertEqual(self.evaluated, [rule_today.pk])
+            self.assertEqual(
+                outcomes, [(rule_a.pk, True), (rule_b.pk, False), (rule_today.pk, True)]
+            )
+
+        with self.subTest("changed input"):
+            outcomes = self._evaluate({"a": "x", "b": "y"})
+
+            self.assertEqual(self.evaluated, [rule_b.pk, rule_today.pk])
+            self.assertEqual(
+                outcomes, [(rule_a.pk, True), (rule_b.pk, True), (rule_today.pk, True)]
+            )
+
+    def test_triggers_reading_updated_variables_evaluated(self):
+        setter = FormLogicFactory.create(
+            form=self.form,
+            order=0,
+            json_logic_trigger={"==": [{"var": "a"}, "x"]},
+            actions=[
+                {
+                    "variable": "b",
+                    "action": {"type": "variable", "value": "y"},
+                }
+            ],
+        )
+        reader = FormLogicFactory.create(
+            form=self.form, order=1, json_logic_trigger={"==": [{"var": "b"}, "y"]}
+        )
+
+        with self.subTest("variable updated"):
+            outcomes = self._evaluate({"a": "x", "b": ""})
+
+            self.assertEqual(outcomes, [(setter.pk, True), (reader.pk, True)])
+
+        with self.subTest("variable no longer updated"):
+            outcomes = self._evaluate({"a": "", "b": ""})
+
+            self.assertEqual(self.evaluated, [setter.pk, reader.pk])
+            self.assertEqual(outcomes, [(setter.pk, False), (reader.pk, False)])
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from openforms.forms.tests.factories import (
@@ -7,6 +9,7 @@ from openforms.forms.tests.factories import (
 )
 from openforms.variables.constants import FormVariableSources
 
+from ...form_logic import evaluate_form_logic
 from ...rendering import Renderer, RenderModes
 from ...rendering.nodes import FormNode, SubmissionStepNode
 from ..factories import (
@@ -140,3 +143,25 @@ class FormNodeTests(TestCase):
         # 3. Query the form logic rules for the submission form (and this is cached)
         with self.assertNumQueries(3):
             list(renderer)
+
+    def test_node_tree_walked_multiple_times(self):
+        renderer = Renderer(
+            submission=self.submission, mode=RenderModes.pdf, as_html=True
+        )
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate:
+            self.assertTrue(renderer.has_children)
+            nodes = list(renderer)
+
+            with self.assertNumQueries(0):
+                nodes_again = list(renderer)
+
+        # the logic is evaluated once for every step
+        self.assertEqual(mock_evaluate.call_count, 2)
+        self.assertEqual(
+            [node.render() for node in nodes],
+            [node.render() for node in nodes_again],
+        )
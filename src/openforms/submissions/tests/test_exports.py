@@ -1,14 +1,22 @@
 from datetime import datetime
+from io import BytesIO
 
 from django.test import TestCase, tag
 from django.utils import timezone
 
 from freezegun import freeze_time
+from lxml import etree
+from openpyxl import load_workbook
 
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.variables.constants import FormVariableSources
 
-from ..exports import create_submission_export
+from ..exports import (
+    ExportFileTypes,
+    create_submission_export,
+    export_submissions,
+    iter_submissions,
+)
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -266,3 +274,107 @@ class ExportTests(TestCase):
         export = create_submission_export(Submission.objects.all())
 
         self.assertIn(("Taalcode", "en"), zip(export.headers, export[0]))
+
+
+@freeze_time("2022-05-09T13:00:00Z")
+class StreamingExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(name="Export test")
+        form_step = FormStepFactory.create(
+            form=cls.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "input1"},
+                    {"type": "textfield", "key": "input2", "multiple": True},
+                ]
+            },
+        )
+        for index in range(3):
+            submission = SubmissionFactory.create(
+                form=cls.form, completed=True, completed_on=timezone.now()
+            )
+            SubmissionStepFactory.create(
+                submission=submission,
+                form_step=form_step,
+                data={"input1": f"sub{index}\nünicode", "input2": ["a", "b"]},
+            )
+
+    def _get_content(self, file_type) -> bytes:
+        response = export_submissions(Submission.objects.order_by("pk"), file_type)
+        self.assertEqual(response["Content-Type"], file_type.content_type)
+        self.assertIn(
+            f"submissions_export.{file_type.extension}",
+            response["Content-Disposition"],
+        )
+        return b"".join(response.streaming_content)
+
+    def test_iter_submissions_in_batches(self):
+        queryset = Submission.objects.order_by("-pk")
+
+        # one query for the primary keys, and per batch one query for the submissions
+        # and the prefetched steps and variables each
+        with self.assertNumQueries(7):
+            submissions = list(iter_submissions(queryset, batch_size=2))
+            for submission in submissions:
+                list(submission.submissionstep_set.all())
+                list(submission.submissionvaluevariable_set.all())
+
+        self.assertEqual(submissions, list(queryset))
+
+    def test_streamed_csv_and_json_identical_to_dataset(self):
+        dataset = create_submission_export(Submission.objects.order_by("pk"))
+
+        for file_type in (ExportFileTypes.CSV, ExportFileTypes.JSON):
+            with self.subTest(file_type=file_type.extension):
+                content = self._get_content(file_type)
+
+                self.assertEqual(
+                    content.decode("utf-8"), dataset.export(file_type.extension)
+                )
+
+    def test_streamed_xml_equivalent_to_dataset(self):
+        dataset = create_submission_export(Submission.objects.order_by("pk"))
+        parser = etree.XMLParser(remove_blank_text=True)
+
+        content = self._get_content(ExportFileTypes.XML)
+
+        self.assertEqual(
+            etree.tostring(etree.fromstring(content, parser=parser)),
+            etree.tostring(etree.fromstring(dataset.export("xml"), parser=parser)),
+        )
+
+    def test_xlsx_export(self):
+        content = self._get_content(ExportFileTypes.XLSX)
+
+        worksheet = load_workbook(BytesIO(content)).active
+        rows = list(worksheet.values)
+        self.assertEqual(
+            rows[0], ("Formuliernaam", "Inzendingdatum", "input1", "input2")
+        )
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(
+            rows[1],
+            (
+                "Export test",
+                datetime(2022, 5, 9, 15, 0, 0),
+                "sub0\nünicode",
+                "['a', 'b']",
+            ),
+        )
+
+    def test_empty_queryset(self):
+        for file_type in (ExportFileTypes.CSV, ExportFileTypes.JSON):
+            with self.subTest(file_type=file_type.extension):
+                content = export_submissions(
+                    Submission.objects.none(), file_type
+                ).streaming_content
+
+                self.assertEqual(
+                    b"".join(content).decode("utf-8"),
+                    create_submission_export(Submission.objects.none()).export(
+                        file_type.extension
+                    ),
+                )
@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from .factories import SubmissionFactory
+
+
+class CommandTests(TestCase):
+    def test_renders_report_repeatedly(self):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "name", "label": "Name"}],
+            submitted_data={"name": "Jane"},
+            completed=True,
+        )
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_report_pdf",
+            submission.pk,
+            iterations=2,
+            stdout=stdout,
+            no_color=True,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("Iteration 1:", output)
+        self.assertIn("Iteration 2:", output)
+        self.assertIn("median:", output)
@@ -4,7 +4,11 @@ from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 
-from openforms.forms.tests.factories import FormFactory, FormStepFactory
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
 from openforms.variables.constants import FormVariableDataTypes
 
 from ...logic.datastructures import DataContainer
@@ -263,6 +267,54 @@ class SubmissionValueVariableModelTests(TestCase):
         self.assertTrue(variables["testPrefilled"].is_initially_prefilled)
         self.assertFalse(variables["testNotPrefilled"].is_initially_prefilled)
 
+    def test_bulk_persist_skips_unchanged_variables(self):
+        variable1 = SubmissionValueVariableFactory.create(key="var1", value="foo")
+        SubmissionValueVariableFactory.create(
+            key="var2", value={"items": [1]}, submission=variable1.submission
+        )
+        variables = {
+            variable.key: variable for variable in SubmissionValueVariable.objects.all()
+        }
+
+        with self.assertNumQueries(0):
+            SubmissionValueVariable.objects.bulk_persist(variables.values())
+
+        # mutated in place
+        variables["var2"].value["items"].append(2)
+        with self.assertNumQueries(1):
+            SubmissionValueVariable.objects.bulk_persist(variables.values())
+
+        variables["var2"].refresh_from_db()
+        self.assertEqual(variables["var2"].value, {"items": [1, 2]})
+
+    def test_save_prefill_data_updates_existing_variables(self):
+        form_step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {
+                        "key": "testPrefilled",
+                        "type": "textfield",
+                        "prefill": {"plugin": "demo", "attribute": "random_string"},
+                    },
+                ]
+            }
+        )
+        submission = SubmissionFactory.create(form=form_step.form)
+        SubmissionValueVariableFactory.create(
+            submission=submission,
+            key="testPrefilled",
+            form_variable=form_step.form.formvariable_set.get(),
+            value="old",
+            is_initially_prefilled=True,
+        )
+        state = submission.load_submission_value_variables_state()
+
+        state.save_prefill_data({"testPrefilled": "new"})
+
+        variable = SubmissionValueVariable.objects.get()
+        self.assertEqual(variable.value, "new")
+        self.assertEqual(variable.source, "prefill")
+
     def test_can_store_any_json_encodable(self):
         # zeep returns objects with a __json__ method that returns a JSONValue
         class Natural:
@@ -278,3 +330,87 @@ class SubmissionValueVariableModelTests(TestCase):
         stored = SubmissionValueVariable.objects.get(key=variable1.key)
 
         self.assertEquals(stored.value, 1337)
+
+
+class SubmissionValueVariablesStateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "textfield"},
+                    {"type": "date", "key": "date"},
+                    {"type": "textfield", "key": "container.nested"},
+                ]
+            },
+        )
+        FormStepFactory.create(
+            form=cls.form,
+            form_definition__configuration={
+                "components": [{"type": "textfield", "key": "otherStep"}]
+            },
+        )
+
+    def test_get_variables_in_submission_step(self):
+        submission = SubmissionFactory.create(form=self.form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission,
+            form_step=self.form.formstep_set.first(),
+            data={"textfield": "foo"},
+        )
+        state = submission.load_submission_value_variables_state()
+
+        variables = state.get_variables_in_submission_step(submission_step)
+
+        self.assertEqual(list(variables), ["textfield", "date", "container.nested"])
+
+    def test_python_data_updated_incrementally(self):
+        submission = SubmissionFactory.create(form=self.form)
+        state = submission.load_submission_value_variables_state()
+        data = state.get_python_data()
+        initial_other_step = data["otherStep"]
+
+        state.set_values(
+            {"textfield": "foo", "date": "2023-01-31", "container": {"nested": "bar"}}
+        )
+
+        # same object, updated in place
+        self.assertIs(state.get_python_data(), data)
+        self.assertEqual(data["textfield"], "foo")
+        self.assertEqual(data["date"], date(2023, 1, 31))
+        self.assertEqual(data["container"], {"nested": "bar"})
+        self.assertEqual(data["otherStep"], initial_other_step)
+        # static variables are included
+        self.assertIn("now", data)
+
+    def test_python_data_rebuilt_for_overlapping_keys(self):
+        FormVariableFactory.create(
+            form=self.form,
+            key="container",
+            user_defined=True,
+            data_type=FormVariableDataTypes.object,
+        )
+        submission = SubmissionFactory.create(form=self.form)
+        state = submission.load_submission_value_variables_state()
+        data = state.get_python_data()
+
+        state.set_values({"textfield": "foo", "container.nested": "bar"})
+
+        self.assertIsNot(state.get_python_data(), data)
+        self.assertEqual(state.get_python_data()["textfield"], "foo")
+
+    def test_data_container_initial_data_not_affected_by_updates(self):
+        submission = SubmissionFactory.create(form=self.form)
+        state = submission.load_submission_value_variables_state()
+        data_container = DataContainer(state=state)
+        initial_textfield = data_container.data["textfield"]
+        initial_container = data_container.data["container"].copy()
+
+        data_container.update({"textfield": "foo", "container": {"nested": "bar"}})
+
+        self.assertEqual(data_container.data["textfield"], "foo")
+        self.assertEqual(data_container.initial_data["textfield"], initial_textfield)
+        self.assertEqual(data_container.initial_data["container"], initial_container)
@@ -184,6 +184,70 @@ class SubmissionVariablesPerformanceTests(APITestCase):
                 "var4": "test4",
             }
 
+    def test_update_step_data_only_changed_values(self):
+        form = FormFactory.create()
+        form_step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"key": "var1", "type": "textfield"},
+                    {"key": "var2", "type": "textfield"},
+                ]
+            },
+        )
+        submission = SubmissionFactory.create(form=form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission,
+            form_step=form_step,
+            data={"var1": "test1", "var2": "test2"},
+        )
+        # typically done in the viewset before the data is accessed
+        submission.load_execution_state()
+
+        # 1. load_variables_state: retrieve form variables
+        # 2. load_variables_state: retrieve submission value variables
+        with self.assertNumQueries(2):
+            submission_step.data = {"var1": "test1", "var2": "test2"}
+
+        # 3. bulk_update var2 submission value variable
+        with self.assertNumQueries(1):
+            submission_step.data = {"var1": "test1", "var2": "test2-modified"}
+
+        self.assertEqual(
+            SubmissionValueVariable.objects.get(key="var2").value, "test2-modified"
+        )
+
+    def test_update_step_data_num_queries_per_step_size(self):
+        for num_components in (10, 100, 500):
+            with self.subTest(num_components=num_components):
+                form_step = FormStepFactory.create(
+                    form_definition__configuration={
+                        "components": [
+                            {"key": f"var{index}", "type": "textfield"}
+                            for index in range(num_components)
+                        ]
+                    },
+                )
+                submission = SubmissionFactory.create(form=form_step.form)
+                half = num_components // 2
+                submission_step = SubmissionStepFactory.create(
+                    submission=submission,
+                    form_step=form_step,
+                    data={f"var{index}": "initial" for index in range(half)},
+                )
+                submission.load_execution_state()
+                data = {
+                    f"var{index}": "changed" if index % 2 else "initial"
+                    for index in range(num_components)
+                }
+
+                # 1. load_variables_state: retrieve form variables
+                # 2. load_variables_state: retrieve submission value variables
+                # 3. bulk_create the new submission value variables
+                # 4. bulk_update the changed submission value variables
+                with self.assertNumQueries(4):
+                    submission_step.data = data
+
     def test_get_step_data(self):
         form = FormFactory.create()
         form_step = FormStepFactory.create(
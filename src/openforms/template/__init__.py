@@ -6,26 +6,63 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
+* Caching of the compiled string-based templates.
 
 Possible future features:
 
-* Caching for string-based templates
 * ...
 """
+from functools import _CacheInfo, lru_cache
+
+from django.utils.safestring import SafeString, mark_safe
+
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
 
-__all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
+__all__ = [
+    "render_from_string",
+    "parse",
+    "get_template_cache_info",
+    "sandbox_backend",
+    "openforms_backend",
+]
+
+TEMPLATE_CACHE_SIZE = 1024
+"""
+The maximum number of compiled templates to keep in the (process-local) cache.
+"""
+
+_TEMPLATE_TOKENS = ("{{", "{%", "{#")
+
+
+def _has_template_syntax(source: str) -> bool:
+    return any(token in source for token in _TEMPLATE_TOKENS)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _get_template(source: str, backend, disable_autoescape: bool):
+    if disable_autoescape:
+        source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
+    return backend.from_string(source)
+
+
+def get_template_cache_info() -> _CacheInfo:
+    """
+    Return the hits, misses and size of the compiled templates cache.
+    """
+    return _get_template.cache_info()
 
 
 def parse(source: str, backend=sandbox_backend):
     """
     Parse the template fragment using the specified backend.
 
+    Compiled templates are cached, so parsing the same source again is cheap.
+
     :returns: A template instance of the specified backend
     :raises: :class:`django.template.TemplateSyntaxError` if there are any
       syntax errors
     """
-    return backend.from_string(source)
+    return _get_template(source, backend, False)
 
 
 def render_from_string(
@@ -45,8 +82,10 @@ def render_from_string(
     :raises: :class:`django.template.TemplateSyntaxError` if the template source is
       invalid
     """
-    if disable_autoescape:
-        source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
-    template = parse(source, backend=backend)
+    # plain text renders to itself, there's no need to involve the template engine
+    if not _has_template_syntax(source):
+        return source if isinstance(source, SafeString) else mark_safe(source)
+
+    template = _get_template(source, backend, disable_autoescape)
     res = template.render(context)
     return res
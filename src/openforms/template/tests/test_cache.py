@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase
+from django.utils.safestring import SafeString
+
+from .. import (
+    _get_template,
+    get_template_cache_info,
+    parse,
+    render_from_string,
+    sandbox_backend,
+)
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _get_template.cache_clear()
+        self.addCleanup(_get_template.cache_clear)
+
+    def test_compiled_template_is_reused(self):
+        with patch.object(
+            sandbox_backend, "from_string", wraps=sandbox_backend.from_string
+        ) as mock_from_string:
+            first = render_from_string("Hello {{ name }}", {"name": "Alice"})
+            second = render_from_string("Hello {{ name }}", {"name": "Bob"})
+
+        self.assertEqual(first, "Hello Alice")
+        self.assertEqual(second, "Hello Bob")
+        mock_from_string.assert_called_once()
+        cache_info = get_template_cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
+    def test_autoescape_part_of_cache_key(self):
+        context = {"foo": "<b>bar</b>"}
+
+        escaped = render_from_string("{{ foo }}", context)
+        unescaped = render_from_string("{{ foo }}", context, disable_autoescape=True)
+
+        self.assertEqual(escaped, "&lt;b&gt;bar&lt;/b&gt;")
+        self.assertEqual(unescaped, "<b>bar</b>")
+
+    def test_parse_uses_cache(self):
+        self.assertIs(parse("{{ foo }}"), parse("{{ foo }}"))
+
+    def test_syntax_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.subTest():
+                with self.assertRaises(TemplateSyntaxError):
+                    render_from_string("{% invalid %}", {})
+
+    def test_plain_text_skips_template_engine(self):
+        with patch.object(sandbox_backend, "from_string") as mock_from_string:
+            result = render_from_string("No <b>variables</b> { here }", {"foo": "bar"})
+
+        self.assertEqual(result, "No <b>variables</b> { here }")
+        self.assertIsInstance(result, SafeString)
+        mock_from_string.assert_not_called()
+
+    def test_comments_are_not_plain_text(self):
+        result = render_from_string("foo{# comment #}", {})
+
+        self.assertEqual(result, "foo")
@@ -1,5 +1,6 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
 
 from django_sendfile.utils import _get_sendfile
 
@@ -10,11 +11,21 @@ class UtilsConfig(AppConfig):
     name = "openforms.utils"
 
     def ready(self):
+        from solo.models import SingletonModel
+
         from . import cache  # noqa
         from . import checks  # noqa
 
         setting_changed.connect(clear_lru_cache_on_settings_changed)
 
+        # only for the singleton models - a post_delete receiver for all models would
+        # disable the fast deletes of Django
+        for model in apps.get_models():
+            if not issubclass(model, SingletonModel):
+                continue
+            post_save.connect(cache.bump_solo_cache_version, sender=model)
+            post_delete.connect(cache.bump_solo_cache_version, sender=model)
+
         mute_deprecation_warnings()
 
         from openforms.utils.admin import replace_cookie_log_admin  # noqa
@@ -1,5 +1,9 @@
+import pickle
 import threading
+import time
+from dataclasses import dataclass, field
 
+from django.conf import settings
 from django.core import signals
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
@@ -91,6 +95,135 @@ class RequestProxyCache(BaseCache):
         self._reset()
 
 
+@dataclass
+class _LocalStore:
+    entries: dict[str, tuple[bytes, float | None]] = field(default_factory=dict)
+    version: object = None
+    checked_at: float | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# the cache instances are thread-local, the store is shared by all threads (per
+# upstream cache)
+_local_stores: dict[str, _LocalStore] = {}
+_local_stores_lock = threading.Lock()
+
+
+class ProcessLocalProxyCache(BaseCache):
+    """
+    Keep cache items in process memory, in front of the configured upstream cache.
+
+    Cache misses are looked up in the upstream cache, and all operations that change
+    the cache are proxied to the upstream cache. Changing an item does not affect the
+    local items of the other processes - the owner of the data calls
+    :meth:`bump_version` when it actually changed, which bumps a version key in the
+    upstream cache (see :func:`bump_solo_cache_version`). Processes compare the
+    version key with the version of their local items at most every
+    ``OPTIONS["CHECK_INTERVAL"]`` seconds, and discard all local items if it changed.
+    Processes may therefore use outdated items for up to this interval. With an
+    interval of ``0``, the version is checked on every read.
+
+    Local items expire after the timeout they were set with, or the default timeout
+    for items retrieved from the upstream cache. Like the local memory cache of
+    Django, the items are stored pickled, so that modifications do not leak between
+    requests and threads.
+    """
+
+    VERSION_KEY = "process-local-proxy-cache:version"
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, upstream: str, params):
+        super().__init__(params)
+        self.upstream = upstream or DEFAULT_CACHE_ALIAS
+        self.upstream_cache = caches[self.upstream]
+        self.check_interval: float = params.get("OPTIONS", {}).get("CHECK_INTERVAL", 5)
+        with _local_stores_lock:
+            self._store = _local_stores.setdefault(self.upstream, _LocalStore())
+
+    def _check_version(self) -> None:
+        store = self._store
+        now = time.monotonic()
+        if (
+            store.checked_at is not None
+            and now - store.checked_at < self.check_interval
+        ):
+            return
+
+        version = self.upstream_cache.get(self.VERSION_KEY)
+        if version is None:
+            self.upstream_cache.add(self.VERSION_KEY, time.time_ns(), timeout=None)
+            version = self.upstream_cache.get(self.VERSION_KEY)
+        with store.lock:
+            if version != store.version:
+                store.entries.clear()
+                store.version = version
+            store.checked_at = now
+
+    def bump_version(self) -> None:
+        """
+        Discard the local items of all processes.
+        """
+        version = time.time_ns()
+        self.upstream_cache.set(self.VERSION_KEY, version, timeout=None)
+        with self._store.lock:
+            self._store.entries.clear()
+            self._store.version = version
+            self._store.checked_at = time.monotonic()
+
+    def _set_local(self, key: str, value, timeout=DEFAULT_TIMEOUT) -> None:
+        expiries = [
+            expiry
+            for expiry in (
+                self.get_backend_timeout(timeout),
+                self.get_backend_timeout(self.default_timeout),
+            )
+            if expiry is not None
+        ]
+        self._store.entries[key] = (
+            pickle.dumps(value, self.pickle_protocol),
+            min(expiries, default=None),
+        )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.upstream_cache.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._set_local(self.make_key(key, version=version), value, timeout)
+        return added
+
+    def get(self, key, default=None, version=None):
+        self._check_version()
+        _key = self.make_key(key, version=version)
+        pickled, expires_at = self._store.entries.get(_key, (None, None))
+        if pickled is not None and (expires_at is None or expires_at > time.time()):
+            return pickle.loads(pickled)
+
+        value = self.upstream_cache.get(key, default=default, version=version)
+        if value != default:
+            self._set_local(_key, value)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.upstream_cache.set(key, value, timeout=timeout, version=version)
+        self._set_local(self.make_key(key, version=version), value, timeout)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.upstream_cache.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        deleted = self.upstream_cache.delete(key, version=version)
+        self._store.entries.pop(self.make_key(key, version=version), None)
+        return deleted
+
+    def clear(self):
+        with self._store.lock:
+            self._store.entries.clear()
+            self._store.version = self._store.checked_at = None
+        return self.upstream_cache.clear()
+
+    def close(self):
+        self.upstream_cache.close()
+
+
 def mark_request_proxy_caches(**kwargs):
     for cache in caches.all():
         if not isinstance(cache, RequestProxyCache):
@@ -102,3 +235,20 @@ signals.request_started.connect(
     mark_request_proxy_caches,
     dispatch_uid="openforms.cache.mark_request_start",
 )
+
+
+def bump_solo_cache_version(sender, **kwargs):
+    """
+    Discard the configuration models kept in memory by the other processes when a
+    configuration model is saved or deleted.
+
+    django-solo also sets the configuration models in the cache when they are
+    (re)loaded from the database, so the cache version can't be bumped on set. The
+    receiver is only connected for the singleton models, see
+    :meth:`openforms.utils.apps.UtilsConfig.ready`.
+    """
+    if not (cache_name := getattr(settings, "SOLO_CACHE", None)):
+        return
+    cache = caches[cache_name]
+    if isinstance(cache, ProcessLocalProxyCache):
+        cache.bump_version()
@@ -0,0 +1,111 @@
+"""
+Compile jsonLogic expressions into (nested) Python callables.
+
+:func:`json_logic.jsonLogic` interprets the expression tree on every call - it has to
+destructure every node, look up the operation and check for the special-cased
+operators again and again. Compiling an expression resolves all of that once, so that
+repeated evaluation against different data only calls the operations themselves.
+
+The compiled callables produce exactly the same results (and raise the same errors)
+as :func:`json_logic.jsonLogic`, as they re-use the operations of the library.
+"""
+from typing import Callable, Sequence
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    jsonLogic,
+    missing,
+    missing_some,
+    operations,
+    scoped_operations,
+)
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+from openforms.typing import DataMapping
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+CompiledExpression = Callable[[DataMapping | None], JSON]
+
+_DATA_OPERATORS = {
+    "var": get_var,
+    "missing": missing,
+    "missing_some": missing_some,
+}
+
+
+def compile_expression(expression: JSON) -> CompiledExpression:
+    """
+    Compile the jsonLogic expression into a callable taking the data as argument.
+
+    Invalid expressions do not raise during compilation - instead, evaluating the
+    compiled expression raises the same error that :func:`json_logic.jsonLogic` would
+    raise for the same input.
+    """
+    try:
+        compiled = _compile(expression)
+    except Exception:
+        return lambda data: jsonLogic(expression, data)
+
+    def evaluate(data: DataMapping | None = None) -> JSON:
+        return compiled(data or {})
+
+    return evaluate
+
+
+def _compile(expression: JSON) -> Callable[[DataMapping], JSON]:
+    if isinstance(expression, list):
+        items = [_compile(item) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # You've recursed to a primitive, stop!
+    if expression is None or not isinstance(expression, dict):
+        return lambda data: expression
+
+    operator, values = destructure(expression)
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    if operator in scoped_operations:
+        scoped_operation = scoped_operations[operator]
+        return lambda data: scoped_operation(data, *values)
+
+    args = [_compile(value) for value in values]
+
+    if (data_operation := _DATA_OPERATORS.get(operator)) is not None:
+        # optimize the most common case - a variable lookup with a literal key
+        if operator == "var" and all(not isinstance(v, (dict, list)) for v in values):
+            literal_args = tuple(values)
+            return lambda data: data_operation(data, *literal_args)
+        return lambda data: data_operation(data, *_evaluate_args(args, data))
+
+    if operator not in operations:
+
+        def unrecognized(data: DataMapping) -> JSON:
+            # the arguments are evaluated first, mimicking the interpreter
+            _evaluate_args(args, data)
+            raise ValueError("Unrecognized operation %s" % operator)
+
+        return unrecognized
+
+    operation = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+    if not empty_values:
+        return lambda data: operation(*_evaluate_args(args, data))
+
+    def evaluate_operation(data: DataMapping) -> JSON:
+        evaluated = _evaluate_args(args, data)
+        # Some operators raise errors if operands are empty - see jsonLogic
+        if any([value in empty_values for value in evaluated]):
+            return None
+        return operation(*evaluated)
+
+    return evaluate_operation
+
+
+def _evaluate_args(
+    args: Sequence[Callable[[DataMapping], JSON]], data: DataMapping
+) -> list[JSON]:
+    return [arg(data) for arg in args]
@@ -71,6 +71,52 @@ class ExpressionIntrospection:
 
         return inputs
 
+    def get_input_keys(self) -> set[str] | None:
+        """
+        Determine the keys of the (variables) data that the expression reads.
+
+        ``None`` is returned when the outcome cannot be derived from statically known
+        keys, e.g. because a variable key is computed, the whole data object is
+        referenced or the result depends on the current date.
+        """
+        keys = set()
+        for node in iter_tree(self.tree):
+            if isinstance(node, Primitive):
+                continue
+
+            match node.operator:
+                case "today" | "log":
+                    return None
+                case "var":
+                    key = node.arguments[0] if node.arguments else None
+                    if not _is_static_key(key):
+                        return None
+                    keys.add(str(key))
+                case "missing" | "missing_some":
+                    arguments = (
+                        node.arguments[1:]
+                        if node.operator == "missing_some"
+                        else node.arguments
+                    )
+                    for argument in _flatten(arguments):
+                        if not _is_static_key(argument):
+                            return None
+                        keys.add(str(argument))
+
+        return keys
+
+
+def _is_static_key(key: Primitive | Operation) -> bool:
+    return isinstance(key, (str, int)) and key != ""
+
+
+def _flatten(tree: JSONLogicExpressionTree) -> Iterator[Primitive | Operation]:
+    if isinstance(tree, list):
+        for item in tree:
+            yield from _flatten(item)
+    else:
+        yield tree
+
 
 def iter_tree(tree: JSONLogicExpressionTree) -> Iterator[Operation | Primitive]:
     if isinstance(tree, Primitive):
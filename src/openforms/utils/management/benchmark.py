@@ -0,0 +1,109 @@
+"""
+Shared timing and reporting of the ``benchmark_*`` management commands.
+
+The commands only build their input and the implementation(s) to time, the
+:class:`BenchmarkCommand` runs them for the requested number of iterations and
+outputs the timings.
+"""
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from django.core.management import BaseCommand
+
+T = TypeVar("T")
+
+UNITS = {"s": 1, "ms": 1000}
+
+
+@dataclass
+class Timings:
+    durations: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.durations)
+
+    def format(self, unit: str = "ms") -> str:
+        scale = UNITS[unit]
+        return ", ".join(
+            f"{name}: {value * scale:.3f}{unit}"
+            for name, value in (
+                ("min", min(self.durations)),
+                ("max", max(self.durations)),
+                ("mean", statistics.mean(self.durations)),
+                ("median", self.median),
+            )
+        )
+
+
+class BenchmarkCommand(BaseCommand):
+    default_iterations: int = 10
+    unit: str = "ms"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=self.default_iterations,
+            help=(
+                "Number of times to run the benchmark. "
+                f"Defaults to {self.default_iterations}."
+            ),
+        )
+
+    def benchmark(
+        self,
+        label: str,
+        func: Callable[..., T],
+        iterations: int,
+        setup: Callable[[], Any] | None = None,
+        verbose: bool = False,
+    ) -> tuple[Timings, T]:
+        """
+        Time the calls of ``func`` and output the timings.
+
+        :arg setup: called before every iteration, outside of the timing. Its return
+          value is passed to ``func``.
+        :arg verbose: output the duration of every iteration.
+        :returns: the timings and the result of the last call.
+        """
+        durations = []
+        for iteration in range(iterations):
+            args = (setup(),) if setup is not None else ()
+            start = time.perf_counter()
+            result = func(*args)
+            duration = time.perf_counter() - start
+
+            durations.append(duration)
+            if verbose:
+                self.stdout.write(
+                    f"Iteration {iteration + 1}: "
+                    f"{duration * UNITS[self.unit]:.3f}{self.unit}"
+                )
+
+        timings = Timings(durations)
+        self.stdout.write(f"{label}: {timings.format(self.unit)}")
+        return timings, result
+
+    def compare(
+        self,
+        baseline: tuple[str, Callable[[], T]],
+        candidate: tuple[str, Callable[[], T]],
+        iterations: int,
+    ) -> tuple[T, T]:
+        """
+        Time the baseline and candidate implementations and output the speed-up.
+
+        :returns: the results of both implementations, to be checked by the caller.
+        """
+        baseline_timings, baseline_result = self.benchmark(*baseline, iterations)
+        candidate_timings, candidate_result = self.benchmark(*candidate, iterations)
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Speed-up (median): "
+                f"{baseline_timings.median / candidate_timings.median:.1f}x"
+            )
+        )
+        return baseline_result, candidate_result
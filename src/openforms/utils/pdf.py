@@ -1,5 +1,7 @@
 import logging
 import mimetypes
+import os
+from functools import lru_cache
 from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Optional, Tuple
@@ -15,6 +17,35 @@ import weasyprint
 
 logger = logging.getLogger(__name__)
 
+ASSET_CACHE_SIZE = 128
+ASSET_CACHE_MAX_FILE_SIZE = 1024 * 1024  # 1 MiB
+
+
+@lru_cache(maxsize=ASSET_CACHE_SIZE)
+def _read_cached_asset(path: str, mtime_ns: int, size: int) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_asset(path: str) -> bytes:
+    """
+    Read the contents of a (static/media) file, using a process-level cache.
+
+    Stylesheets, fonts and logos are referenced by every PDF that is rendered. The
+    cache is keyed on the modification time and size of the file, so that changed
+    files (e.g. a new logo uploaded in the admin) are picked up. Large files are not
+    cached to keep the memory usage of the worker processes bounded.
+    """
+    stat = os.stat(path)
+    if stat.st_size > ASSET_CACHE_MAX_FILE_SIZE:
+        with open(path, "rb") as f:
+            return f.read()
+    return _read_cached_asset(path, stat.st_mtime_ns, stat.st_size)
+
+
+def get_asset_cache_info():
+    return _read_cached_asset.cache_info()
+
 
 class UrlFetcher:
 
@@ -73,8 +104,7 @@ class UrlFetcher:
                 redirected_url=orig_url,
                 filename=path.parts[-1],
             )
-            with open(absolute_path, "rb") as f:
-                result["file_obj"] = BytesIO(f.read())
+            result["file_obj"] = BytesIO(read_asset(absolute_path))
             return result
         return weasyprint.default_url_fetcher(orig_url)
 
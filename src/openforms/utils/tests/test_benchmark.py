@@ -0,0 +1,72 @@
+from io import StringIO
+from itertools import count
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from ..management.benchmark import BenchmarkCommand, Timings
+
+
+class TimingsTests(SimpleTestCase):
+    def test_format(self):
+        timings = Timings([0.001, 0.004, 0.002, 0.003])
+
+        self.assertEqual(
+            timings.format(),
+            "min: 1.000ms, max: 4.000ms, mean: 2.500ms, median: 2.500ms",
+        )
+        self.assertEqual(
+            timings.format("s"),
+            "min: 0.001s, max: 0.004s, mean: 0.003s, median: 0.003s",
+        )
+
+
+@patch(
+    "openforms.utils.management.benchmark.time.perf_counter",
+    side_effect=(tick / 1000 for tick in count()),
+)
+class BenchmarkCommandTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.stdout = StringIO()
+        self.command = BenchmarkCommand(stdout=self.stdout, no_color=True)
+
+    def test_benchmark(self, mock_perf_counter):
+        setups = []
+
+        timings, result = self.command.benchmark(
+            "Label",
+            lambda value: value * 2,
+            iterations=3,
+            setup=lambda: setups.append(len(setups)) or len(setups),
+            verbose=True,
+        )
+
+        self.assertEqual(result, 6)
+        self.assertEqual(len(timings.durations), 3)
+        self.assertEqual(setups, [0, 1, 2])
+        self.assertEqual(
+            self.stdout.getvalue().splitlines(),
+            [
+                "Iteration 1: 1.000ms",
+                "Iteration 2: 1.000ms",
+                "Iteration 3: 1.000ms",
+                "Label: min: 1.000ms, max: 1.000ms, mean: 1.000ms, median: 1.000ms",
+            ],
+        )
+
+    def test_compare(self, mock_perf_counter):
+        def slow():
+            next(mock_perf_counter.side_effect)
+            return "slow"
+
+        results = self.command.compare(
+            ("baseline", slow), ("candidate", lambda: "fast"), iterations=2
+        )
+
+        self.assertEqual(results, ("slow", "fast"))
+        output = self.stdout.getvalue()
+        self.assertIn("baseline: min: 2.000ms", output)
+        self.assertIn("candidate: min: 1.000ms", output)
+        self.assertIn("Speed-up (median): 2.0x", output)
@@ -1,12 +1,17 @@
 import contextlib
+import threading
 import time
 from unittest.mock import patch
 
 from django.core.cache import caches
+from django.db.models.signals import post_delete
 from django.http import HttpResponse
 from django.test import Client, TestCase, override_settings
 from django.urls import path
 
+from openforms.config.models import GlobalConfiguration
+from openforms.submissions.models import Submission
+
 
 @override_settings(
     CACHES={
@@ -229,3 +234,159 @@ class WithinRequestProxyCacheTests(TestCase):
                 client.get("/")
             except Exception:
                 self.fail("Assertions in test view failed")
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default",
+        },
+        "local": {
+            "BACKEND": "openforms.utils.cache.ProcessLocalProxyCache",
+            "OPTIONS": {"CHECK_INTERVAL": 60},
+        },
+    }
+)
+class ProcessLocalProxyCacheTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        def clear_caches():
+            for cache in caches.all():
+                cache.clear()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_items_kept_in_memory(self):
+        cache = caches["local"]
+        upstream = caches["default"]
+        upstream.set("foo", {"bar": "baz"})
+
+        self.assertEqual(cache.get("foo"), {"bar": "baz"})
+
+        with patch.object(upstream, "get") as mock_get:
+            value = cache.get("foo")
+
+        mock_get.assert_not_called()
+        self.assertEqual(value, {"bar": "baz"})
+
+    def test_modifications_do_not_leak(self):
+        cache = caches["local"]
+        value = {"bar": "baz", "nested": ["a"]}
+        cache.set("foo", value)
+
+        value["bar"] = "modified"
+        value["nested"].append("b")
+        cached = cache.get("foo")
+        cached["bar"] = "modified"
+        cached["nested"].append("c")
+
+        self.assertEqual(cache.get("foo"), {"bar": "baz", "nested": ["a"]})
+
+    def test_set_and_delete_are_proxied(self):
+        cache = caches["local"]
+        upstream = caches["default"]
+
+        cache.set("foo", "bar")
+        self.assertEqual(upstream.get("foo"), "bar")
+
+        cache.delete("foo")
+        self.assertIsNone(upstream.get("foo"))
+        self.assertIsNone(cache.get("foo"))
+
+    def test_changes_by_other_processes_picked_up_after_interval(self):
+        cache = caches["local"]
+        upstream = caches["default"]
+        cache.set("foo", "bar")
+        self.assertEqual(cache.get("foo"), "bar")
+
+        # mimick another process changing the item
+        upstream.set("foo", "changed")
+        upstream.set(cache.VERSION_KEY, 1, timeout=None)
+
+        with self.subTest("within interval"):
+            self.assertEqual(cache.get("foo"), "bar")
+
+        with self.subTest("after interval"):
+            with patch(
+                "openforms.utils.cache.time.monotonic",
+                return_value=time.monotonic() + 61,
+            ):
+                self.assertEqual(cache.get("foo"), "changed")
+
+    def test_items_shared_between_threads(self):
+        upstream = caches["default"]
+        caches["local"].set("foo", "bar")
+        self.assertEqual(caches["local"].get("foo"), "bar")
+        results = {}
+
+        def get_in_thread():
+            try:
+                # the cache instances are thread-local
+                results["cache"] = caches["local"]
+                with patch.object(caches["default"], "get") as mock_get:
+                    results["value"] = caches["local"].get("foo")
+                results["upstream_called"] = mock_get.called
+            except Exception as exc:
+                results["exception"] = exc
+
+        cache = caches["local"]
+        thread = threading.Thread(target=get_in_thread)
+        thread.start()
+        thread.join()
+
+        self.assertNotIn("exception", results)
+        self.assertIsNot(results["cache"], cache)
+        self.assertEqual(results["value"], "bar")
+        self.assertFalse(results["upstream_called"])
+        self.assertEqual(upstream.get("foo"), "bar")
+
+    def test_set_does_not_discard_items_of_other_processes(self):
+        cache = caches["local"]
+        upstream = caches["default"]
+        cache.set("foo", "bar")
+        version = upstream.get(cache.VERSION_KEY)
+
+        cache.set("other", "item")
+
+        self.assertEqual(upstream.get(cache.VERSION_KEY), version)
+
+    def test_solo_configuration(self):
+        with override_settings(SOLO_CACHE="local"):
+            config = GlobalConfiguration.get_solo()
+            config.main_website = "https://example.com"
+            config.save()
+
+            with self.assertNumQueries(0), patch.object(caches["default"], "get"):
+                cached_config = GlobalConfiguration.get_solo()
+
+        self.assertEqual(cached_config.main_website, "https://example.com")
+        self.assertIsNot(cached_config, config)
+
+    def test_solo_configuration_changes_bump_version(self):
+        cache = caches["local"]
+        upstream = caches["default"]
+
+        with override_settings(SOLO_CACHE="local"):
+            GlobalConfiguration.get_solo()
+            version = upstream.get(cache.VERSION_KEY)
+
+            with self.subTest("cache fill"):
+                cache.delete(GlobalConfiguration.get_cache_key())
+                upstream.delete(GlobalConfiguration.get_cache_key())
+
+                GlobalConfiguration.get_solo()
+
+                self.assertEqual(upstream.get(cache.VERSION_KEY), version)
+
+            with self.subTest("save"):
+                GlobalConfiguration.get_solo().save()
+
+                self.assertNotEqual(upstream.get(cache.VERSION_KEY), version)
+
+    def test_receivers_only_connected_for_solo_models(self):
+        # a post_delete receiver disables the fast deletes of Django
+        self.assertFalse(post_delete.has_listeners(Submission))
+        self.assertTrue(post_delete.has_listeners(GlobalConfiguration))
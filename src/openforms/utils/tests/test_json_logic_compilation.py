@@ -0,0 +1,125 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from json_logic import jsonLogic
+
+from ..json_logic import introspect_json_logic
+from ..json_logic.compilation import compile_expression
+
+DATA = {
+    "textfield": "foo",
+    "number": 3,
+    "other": {"nested": 2.5},
+    "items": [{"price": 1}, {"price": 3}],
+    "empty": None,
+    "date": "2023-01-31",
+}
+
+
+class CompiledExpressionTests(SimpleTestCase):
+    def test_results_identical_to_interpreter(self):
+        expressions = (
+            True,
+            "a literal",
+            [1, {"var": "number"}],
+            {"var": "textfield"},
+            {"var": ["unknown", "default"]},
+            {"var": [{"cat": ["other", ".nested"]}]},
+            {"var": ""},
+            {"==": [{"var": "textfield"}, "foo"]},
+            {"===": [{"var": "number"}, "3"]},
+            {"!=": [{"var": "number"}, 4]},
+            {">": [{"var": "other.nested"}, 2]},
+            {"<=": [1, {"var": "number"}, 3]},
+            {"+": [{"var": "number"}, {"var": "empty"}]},
+            {"-": [{"var": "number"}]},
+            {"*": [{"var": "number"}, "2"]},
+            {"/": [{"var": "number"}, 2]},
+            {"%": [{"var": "number"}, 2]},
+            {"and": [{"var": "textfield"}, {"!": {"var": "empty"}}]},
+            {"or": [{"var": "empty"}, 0, ""]},
+            {"if": [{"var": "empty"}, "yes", {"var": "number"}, "three", "no"]},
+            {"?:": [{"var": "number"}, "truthy", "falsy"]},
+            {"in": ["oo", {"var": "textfield"}]},
+            {"cat": ["a", {"var": "number"}]},
+            {"merge": [[1, 2], {"var": "number"}]},
+            {"missing": ["textfield", "unknown"]},
+            {"missing_some": [1, ["unknown", "number"]]},
+            {"reduce": [{"var": "items"}, {"+": [{"var": "accumulator"}, 1]}, 0]},
+            {"map": [{"var": "items"}, {"var": "price"}]},
+            {"+": [{"date": {"var": "date"}}, {"rdelta": [0, 1, 1]}]},
+            {"max": [{"var": "number"}, 7, 1]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                compiled = compile_expression(expression)
+
+                self.assertEqual(compiled(DATA), jsonLogic(expression, DATA))
+                self.assertEqual(compiled(None), jsonLogic(expression, None))
+
+    def test_errors_are_raised_during_evaluation(self):
+        expressions = (
+            {"unknown_op": [{"var": "number"}]},
+            {"==": [1, 1], "!=": [1, 2]},
+            {"/": [{"var": "number"}, 0]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                compiled = compile_expression(expression)
+
+                with self.assertRaises(Exception) as interpreter_error:
+                    jsonLogic(expression, DATA)
+                with self.assertRaises(type(interpreter_error.exception)):
+                    compiled(DATA)
+
+    def test_compiled_expression_does_not_share_state(self):
+        compiled = compile_expression({"merge": [[1], {"var": "number"}]})
+
+        first = compiled(DATA)
+        first.append("mutated")
+
+        self.assertEqual(compiled(DATA), [1, 3])
+
+    def test_today_is_evaluated_on_every_call(self):
+        compiled = compile_expression({"today": []})
+
+        self.assertEqual(compiled({}), date.today())
+
+
+class InputKeysTests(SimpleTestCase):
+    def test_static_keys(self):
+        expressions = (
+            ({"==": [1, 1]}, set()),
+            ({"var": "foo"}, {"foo"}),
+            ({"var": ["foo.bar", {"var": "baz"}]}, {"foo.bar", "baz"}),
+            ({"missing": ["a", "b"]}, {"a", "b"}),
+            ({"missing": [["a", "b"]]}, {"a", "b"}),
+            ({"missing_some": [1, ["a", "b"]]}, {"a", "b"}),
+            (
+                {"reduce": [{"var": "items"}, {"+": [{"var": "accumulator"}, 1]}, 0]},
+                {"items", "accumulator"},
+            ),
+        )
+
+        for expression, expected in expressions:
+            with self.subTest(expression=expression):
+                keys = introspect_json_logic(expression).get_input_keys()
+
+                self.assertEqual(keys, expected)
+
+    def test_dynamic_inputs(self):
+        expressions = (
+            {"var": ""},
+            {"var": [{"cat": ["a", "b"]}]},
+            {"missing": [{"var": "keys"}]},
+            {">": [{"today": []}, {"date": {"var": "foo"}}]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                keys = introspect_json_logic(expression).get_input_keys()
+
+                self.assertIsNone(keys)
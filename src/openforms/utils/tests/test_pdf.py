@@ -0,0 +1,41 @@
+import os
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from ..pdf import _read_cached_asset, read_asset
+
+
+class AssetCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _read_cached_asset.cache_clear()
+        self.addCleanup(_read_cached_asset.cache_clear)
+
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.path = Path(tempdir.name) / "style.css"
+        self.path.write_bytes(b"body { color: red; }")
+
+    def test_asset_read_once(self):
+        content1 = read_asset(str(self.path))
+        content2 = read_asset(str(self.path))
+
+        self.assertEqual(content1, b"body { color: red; }")
+        self.assertEqual(content2, b"body { color: red; }")
+        cache_info = _read_cached_asset.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+    def test_modified_asset_read_again(self):
+        read_asset(str(self.path))
+        self.path.write_bytes(b"body { color: blue; }")
+        # ensure the modification time changes, even on coarse filesystems
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        content = read_asset(str(self.path))
+
+        self.assertEqual(content, b"body { color: blue; }")
@@ -5,3 +5,7 @@ from django.utils.translation import gettext_lazy as _
 class SOAPAppConfig(AppConfig):
     name = "soap"
     verbose_name = _("SOAP Settings & Services")
+
+    def ready(self):
+        # register signal receivers
+        from . import signals  # noqa
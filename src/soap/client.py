@@ -1,12 +1,33 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Callable
+
 from django.conf import settings
 
 from ape_pie.client import APIClient as SessionBase, is_base_url
+from zeep.cache import SqliteCache
 from zeep.client import Client
 from zeep.transports import Transport
 
 from .models import SoapService
 from .session_factory import SessionFactory
 
+CLIENT_MAX_AGE = 60 * 60  # seconds
+
+_client_pool: dict[int, tuple[str, float, Client]] = {}
+_client_pool_lock = threading.Lock()
+
+
+def get_wsdl_cache() -> SqliteCache | None:
+    if not settings.SOAP_WSDL_CACHE_TIMEOUT:
+        return None
+    return SqliteCache(
+        path=settings.SOAP_WSDL_CACHE_PATH or None,
+        timeout=settings.SOAP_WSDL_CACHE_TIMEOUT,
+    )
+
 
 def build_client(
     service: SoapService,
@@ -26,6 +47,7 @@ def build_client(
     session = SOAPSession.configure_from(session_factory)
     transport = transport_factory(
         session=session,
+        cache=get_wsdl_cache(),
         timeout=settings.DEFAULT_TIMEOUT_REQUESTS,
         # operation_timeout gets passed as a parameter on all requests, overriding any
         # monkeypatched requests.Session defaults
@@ -40,6 +62,82 @@ def build_client(
     return client
 
 
+def _get_config_hash(service: SoapService) -> str:
+    config = [
+        service.url,
+        service.soap_version,
+        service.endpoint_security,
+        service.user,
+        service.password,
+        service.client_certificate_id,
+        service.server_certificate_id,
+    ]
+    return hashlib.md5(json.dumps(config).encode(), usedforsecurity=False).hexdigest()
+
+
+def get_pooled_client(
+    service: SoapService, build: Callable[[SoapService], Client] = build_client
+) -> Client:
+    """
+    Get a ready to use :class:`zeep.Client` for the service from the process-level pool.
+
+    Building a client parses the WSDL, which is slow. The clients are therefore re-used
+    by all the threads of a process, and their sessions keep the connections to the
+    service alive. A client is rebuilt when the service configuration changes (see
+    :func:`clear_client_pool`) or after :data:`CLIENT_MAX_AGE` seconds, to pick up
+    configuration changes made in other processes, e.g. replaced certificate files.
+
+    :param build: callable building the client if there is no pooled client.
+    """
+    if service.pk is None:
+        return build(service)
+
+    config_hash = _get_config_hash(service)
+    with _client_pool_lock:
+        pooled = _client_pool.get(service.pk)
+    if pooled is not None:
+        pooled_config_hash, built_at, client = pooled
+        if (
+            pooled_config_hash == config_hash
+            and time.monotonic() - built_at < CLIENT_MAX_AGE
+        ):
+            return client
+
+    client = build(service)
+    # keep the connections alive between requests, like the session context manager
+    # does
+    if isinstance(session := getattr(client.transport, "session", None), SessionBase):
+        session.__enter__()
+
+    with _client_pool_lock:
+        previous = _client_pool.get(service.pk)
+        _client_pool[service.pk] = (config_hash, time.monotonic(), client)
+    if previous is not None and previous[2] is not client:
+        _close_client(previous[2])
+    return client
+
+
+def _close_client(client: Client) -> None:
+    if isinstance(session := getattr(client.transport, "session", None), SessionBase):
+        session.__exit__()
+
+
+def clear_client_pool(service_pk: int | None = None) -> None:
+    """
+    Remove the pooled client of a service, or all pooled clients.
+    """
+    with _client_pool_lock:
+        if service_pk is None:
+            removed = list(_client_pool.values())
+            _client_pool.clear()
+        else:
+            removed = (
+                [_client_pool.pop(service_pk)] if service_pk in _client_pool else []
+            )
+    for _, _, client in removed:
+        _close_client(client)
+
+
 class SOAPSession(SessionBase):
     def to_absolute_url(self, maybe_relative_url: str) -> str:
         """
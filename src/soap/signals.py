@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from simple_certmanager.models import Certificate
+
+from .client import clear_client_pool
+from .models import SoapService
+
+
+@receiver([post_save, post_delete], sender=SoapService)
+def clear_pooled_client(sender, instance: SoapService, **kwargs):
+    clear_client_pool(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Certificate)
+def clear_pooled_clients(sender, **kwargs):
+    # the certificate (files) may be used by any of the services
+    clear_client_pool()
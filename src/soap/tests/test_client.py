@@ -2,6 +2,7 @@
 Test the client factory from SOAPService configuration.
 """
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from django.test import TestCase, override_settings
 
@@ -14,8 +15,9 @@ from zeep.wsse import Signature, UsernameToken
 
 from openforms.utils.tests.vcr import OFVCRMixin
 
-from ..client import SOAPSession, build_client
+from ..client import SOAPSession, build_client, clear_client_pool, get_pooled_client
 from ..constants import EndpointSecurity
+from ..models import SoapService
 from ..session_factory import SessionFactory
 from .factories import SoapServiceFactory
 
@@ -256,3 +258,68 @@ class ClientTransportTimeoutTests(TestCase):
             except XMLSyntaxError:
                 # DEFAULT_TIMOUT_REQUESTS time has passed and we're trying
                 self.fail("DEFAULT_TIMEOUT_REQUESTS not honoured by SOAP client")
+
+
+def build_fake_client(service: SoapService) -> MagicMock:
+    # building an actual client parses the WSDL, which is irrelevant for the pool
+    session = SOAPSession.configure_from(SessionFactory(service))
+    return MagicMock(transport=MagicMock(session=session))
+
+
+class ClientPoolTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_client_pool()
+        self.addCleanup(clear_client_pool)
+
+    def test_client_is_reused(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        client1 = get_pooled_client(service, build_fake_client)
+        client2 = get_pooled_client(SoapService.objects.get(), build_fake_client)
+
+        self.assertIs(client1, client2)
+        # the connections are kept alive
+        self.assertTrue(client1.transport.session._in_context_manager)
+
+    def test_unsaved_service_is_not_pooled(self):
+        service = SoapServiceFactory.build(url=WSDL_URI)
+
+        client1 = get_pooled_client(service, build_fake_client)
+        client2 = get_pooled_client(service, build_fake_client)
+
+        self.assertIsNot(client1, client2)
+
+    def test_client_rebuilt_when_configuration_changes(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        client1 = get_pooled_client(service, build_fake_client)
+
+        service.endpoint_security = EndpointSecurity.basicauth
+        service.user = "admin"
+        service.password = "secret"
+        client2 = get_pooled_client(service, build_fake_client)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(client2.transport.session.auth, ("admin", "secret"))
+        self.assertFalse(client1.transport.session._in_context_manager)
+
+    def test_pool_cleared_when_service_is_saved(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        build = MagicMock(side_effect=build_fake_client)
+        get_pooled_client(service, build)
+
+        service.save()
+        get_pooled_client(service, build)
+
+        self.assertEqual(build.call_count, 2)
+
+    def test_pool_cleared_when_certificate_is_saved(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        build = MagicMock(side_effect=build_fake_client)
+        get_pooled_client(service, build)
+
+        CertificateFactory.create(public_certificate__filename="server.pem")
+        get_pooled_client(service, build)
+
+        self.assertEqual(build.call_count, 2)
@@ -48,6 +48,7 @@ class StufServiceAdmin(admin.ModelAdmin):
                     "endpoint_beantwoord_vraag",
                     "endpoint_vrije_berichten",
                     "endpoint_ontvang_asynchroon",
+                    "enable_mtom",
                 ]
             },
         ),
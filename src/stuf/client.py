@@ -24,6 +24,7 @@ from requests.models import Response
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
+from .envelope import Attachment, StreamingEnvelope
 from .stuf import StuurGegevens, WSSecurity
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,7 @@ class BaseClient(APIClient):
         endpoints: dict[EndpointType | str, str],
         wss_security: WSSecurity,
         stuurgegevens: StuurGegevens,
+        enable_mtom: bool = False,
         # additional functionality - can probably be replaced with self.hooks at some point
         request_log_hook: LoggingHook = noop_log,
         response_log_hook: LoggingHook = noop_log,
@@ -104,6 +106,7 @@ class BaseClient(APIClient):
         self._endpoints = endpoints
         self.wss_security = wss_security
         self.stuurgegevens = stuurgegevens
+        self.enable_mtom = enable_mtom
 
         self.request_log_hook = request_log_hook
         self.response_log_hook = response_log_hook
@@ -155,23 +158,27 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | StreamingEnvelope,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
         self._log(normalized_url, direction="request")
 
+        headers = {
+            "SOAPAction": (
+                "http://www.egem.nl/StUF/sector/"
+                f"{self.sector_alias}/0310/{soap_action}"
+            ),
+        }
+        if isinstance(body, StreamingEnvelope):
+            headers["Content-Type"] = body.content_type
+
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
-            headers={
-                "SOAPAction": (
-                    "http://www.egem.nl/StUF/sector/"
-                    f"{self.sector_alias}/0310/{soap_action}"
-                ),
-            },
+            headers=headers,
         )
 
         self._log(normalized_url, direction="response")
@@ -204,12 +211,18 @@ class BaseClient(APIClient):
         template: str,
         context: dict[str, Any] | None = None,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
+        attachment: Attachment | None = None,
     ) -> Response:
         """
         Make a request by templating out a template with the provided context.
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        If an ``attachment`` is provided, the template must render its
+        :attr:`~stuf.envelope.Attachment.placeholder`. The attachment content is then
+        streamed into the request body in place of the placeholder, using MTOM if
+        enabled for the client.
         """
         full_context = {**self.build_base_context(), **(context or {})}
         ref_nr = full_context["referentienummer"]
@@ -220,6 +233,10 @@ class BaseClient(APIClient):
             extra={"ref_nr": ref_nr, "sector_alias": self.sector_alias},
         )
         body = loader.render_to_string(template, full_context)
+        if attachment is not None:
+            body = StreamingEnvelope(
+                body, attachment, soap_version=self.soap_version, mtom=self.enable_mtom
+            )
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
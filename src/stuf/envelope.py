@@ -0,0 +1,127 @@
+"""
+Stream (large) documents inside StUF/SOAP envelopes.
+
+Embedding a document in a rendered envelope keeps the raw bytes, the base64 encoded
+text and the complete XML string in memory at the same time. Instead, the envelope is
+rendered with a placeholder in place of the document content and split into a head and
+a tail. The request body then yields the head, the document content in chunks and
+finally the tail, so at most one chunk of the document is held in memory.
+
+Two transfer modes are supported:
+
+* inline (default) - the document is base64 encoded in the XML element, exactly like
+  the fully rendered envelope.
+* MTOM/XOP - the envelope is sent as the root part of a ``multipart/related`` body
+  referring (``xop:Include``) to the raw document in a second MIME part. This avoids
+  the base64 overhead, but the endpoint must support it.
+"""
+import base64
+import uuid
+from dataclasses import dataclass, field
+from typing import IO, Iterator
+
+from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
+
+# multiple of 3, so that every chunk encodes to base64 without padding
+CHUNK_SIZE = 3 * 64 * 1024
+
+XOP_NAMESPACE = "http://www.w3.org/2004/08/xop/include"
+
+
+@dataclass
+class Attachment:
+    """
+    A document to stream into the envelope.
+
+    Render the value of :attr:`placeholder` in the template where the (base64 encoded)
+    content of the document belongs.
+    """
+
+    content: IO[bytes]
+    size: int
+    content_type: str = "application/octet-stream"
+    placeholder: str = field(default_factory=lambda: f"attachment-{uuid.uuid4()}")
+
+
+class StreamingEnvelope:
+    """
+    Re-iterable request body of a rendered envelope with a streamed attachment.
+
+    The length is known upfront, so ``requests`` sends a ``Content-Length`` header
+    rather than using chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        rendered: str,
+        attachment: Attachment,
+        soap_version: SOAPVersion,
+        mtom: bool = False,
+    ):
+        head, sep, tail = rendered.partition(attachment.placeholder)
+        if not sep or attachment.placeholder in tail:
+            raise ValueError(
+                "The rendered envelope must contain the attachment placeholder exactly "
+                "once."
+            )
+        self.attachment = attachment
+        self.mtom = mtom
+
+        if not mtom:
+            self.content_type = SOAP_VERSION_CONTENT_TYPES[soap_version]
+            self._head, self._tail = head.encode("utf-8"), tail.encode("utf-8")
+            return
+
+        boundary = f"MIMEBoundary_{uuid.uuid4().hex}"
+        root_id, attachment_id = f"root.{uuid.uuid4()}", f"{uuid.uuid4()}"
+        soap_content_type = SOAP_VERSION_CONTENT_TYPES[soap_version]
+        self.content_type = (
+            f'multipart/related; type="application/xop+xml"; '
+            f'start="<{root_id}>"; start-info="{soap_content_type}"; '
+            f'boundary="{boundary}"'
+        )
+        include = (
+            f'<xop:Include xmlns:xop="{XOP_NAMESPACE}" href="cid:{attachment_id}"/>'
+        )
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Type: application/xop+xml; charset=UTF-8; type="{soap_content_type}"\r\n'
+            "Content-Transfer-Encoding: 8bit\r\n"
+            f"Content-ID: <{root_id}>\r\n"
+            "\r\n"
+            f"{head}{include}{tail}\r\n"
+            f"--{boundary}\r\n"
+            f"Content-Type: {attachment.content_type}\r\n"
+            "Content-Transfer-Encoding: binary\r\n"
+            f"Content-ID: <{attachment_id}>\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+    def __len__(self) -> int:
+        size = self.attachment.size
+        content_length = size if self.mtom else 4 * ((size + 2) // 3)
+        return len(self._head) + content_length + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        yield from (self._iter_raw() if self.mtom else self._iter_base64())
+        yield self._tail
+
+    def _iter_raw(self) -> Iterator[bytes]:
+        content = self.attachment.content
+        content.seek(0)
+        while chunk := content.read(CHUNK_SIZE):
+            yield chunk
+
+    def _iter_base64(self) -> Iterator[bytes]:
+        remainder = b""
+        for chunk in self._iter_raw():
+            chunk = remainder + chunk
+            # file objects may return less than requested - only encode whole groups
+            # of 3 bytes so no padding ends up in the middle of the output
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            yield base64.b64encode(chunk[:cutoff])
+        if remainder:
+            yield base64.b64encode(remainder)
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.23 on 2026-10-18 08:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stuf", "0013_auto_20230718_1036"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stufservice",
+            name="enable_mtom",
+            field=models.BooleanField(
+                default=False,
+                help_text="Send (large) documents as binary MTOM/XOP attachments rather than base64 encoded inside the message. Only enable this if the endpoints support it.",
+                verbose_name="enable MTOM",
+            ),
+        ),
+    ]
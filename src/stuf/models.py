@@ -92,6 +92,14 @@ class StufService(models.Model):
             "Endpoint for asynchronous messages, usually '[...]/OntvangAsynchroon'."
         ),
     )
+    enable_mtom = models.BooleanField(
+        _("enable MTOM"),
+        default=False,
+        help_text=_(
+            "Send (large) documents as binary MTOM/XOP attachments rather than base64 "
+            "encoded inside the message. Only enable this if the endpoints support it."
+        ),
+    )
 
     objects = StufServiceManager()
 
@@ -54,4 +54,5 @@ def get_client_init_kwargs(
         "response_log_hook": response_log_hook,
         "wss_security": wss_security,
         "stuurgegevens": stuurgegevens,
+        "enable_mtom": service.enable_mtom,
     }
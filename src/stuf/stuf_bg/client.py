@@ -1,10 +1,12 @@
 import logging
-from collections.abc import Mapping
-from functools import partial
+from collections.abc import Mapping, Sequence
+from functools import lru_cache, partial
+from io import BytesIO
 from typing import TypeVar
 
 import xmltodict
 from glom import glom
+from lxml import etree
 
 from openforms.logging import logevent
 
@@ -17,6 +19,9 @@ from .models import StufBGConfig
 
 logger = logging.getLogger(__name__)
 
+XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+STUF_NO_VALUE = "{http://www.egem.nl/StUF/StUF0301}noValue"
+
 
 class NoServiceConfigured(RuntimeError):
     pass
@@ -61,6 +66,19 @@ class Client(BaseClient):
         )
         return response.content
 
+    def get_attribute_values(
+        self, bsn: str, paths: Mapping[str, Sequence[str]]
+    ) -> dict[str, str]:
+        """
+        Retrieve the text values of the requested attributes of a person.
+
+        :arg paths: mapping of the requested attributes to the (local) names of the
+          elements leading to its value, relative to the person object in the response.
+        :returns: the values of the attributes that are present and have a value.
+        """
+        response_data = self.get_values_for_attributes(bsn, list(paths))
+        return parse_attribute_values(response_data, paths)
+
     def get_values(self, bsn: str, attributes: list[str]) -> dict:
         response_data = self.get_values_for_attributes(bsn, attributes)
 
@@ -95,6 +113,78 @@ class Client(BaseClient):
         raise ValueError("Problem processing StUF-BG response")
 
 
+@lru_cache
+def _compile_path(path: tuple[str, ...]) -> etree.XPath:
+    return etree.XPath("/".join(f"*[local-name()='{bit}']" for bit in path))
+
+
+def parse_attribute_values(
+    content: str | bytes, paths: Mapping[str, Sequence[str]]
+) -> dict[str, str]:
+    """
+    Extract the values of the requested attributes from a StUF-BG ``npsLa01`` response.
+
+    The response is parsed incrementally until the end of the person object. Children
+    of the object that don't lead to a requested attribute (like family relations that
+    weren't asked for) are discarded as soon as they are parsed.
+
+    Nil values (``xsi:nil`` or ``StUF:noValue``) and empty values are left out.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    requested = {path[0] for path in paths.values()}
+    fault = None
+    for _, element in etree.iterparse(
+        BytesIO(content), events=("end",), resolve_entities=False, no_network=True
+    ):
+        if (parent := element.getparent()) is None:
+            continue
+        name, parent_name = _localname(element.tag), _localname(parent.tag)
+        if parent_name == "object" and name not in requested:
+            element.clear()
+        elif name == "object" and parent_name == "antwoord":
+            return _extract_values(element, paths)
+        elif name == "Fault" and parent_name == "Body":
+            fault = element
+
+    # handle missing keys/empty data graciously, see #1842
+    # some include a fault response, others use an empty <antwoord /> XML element
+    if fault is None:
+        return {}
+
+    # we have a fault -> log it appropriately and raise an exception
+    fault_dict = xmltodict.parse(
+        etree.tostring(fault),
+        process_namespaces=True,
+        namespaces=NAMESPACE_REPLACEMENTS,
+    )
+    logger.error(
+        "Response data has an unexpected shape",
+        extra={"fault": fault_dict["Fault"]},
+    )
+    raise ValueError("Problem processing StUF-BG response")
+
+
+def _localname(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _extract_values(
+    person: etree._Element, paths: Mapping[str, Sequence[str]]
+) -> dict[str, str]:
+    values = {}
+    for attribute, path in paths.items():
+        if not (nodes := _compile_path(tuple(path))(person)):
+            continue
+        node = nodes[0]
+        if node.get(XSI_NIL) == "true" or node.get(STUF_NO_VALUE) is not None:
+            continue
+        if text := (node.text or "").strip():
+            values[attribute] = text
+    return values
+
+
 # `Sequence` isn't used here at it would match str (and possibly others)
 C = TypeVar("C", bound=Mapping | list)
 
@@ -0,0 +1,90 @@
+from django.template import loader
+
+import xmltodict
+from glom import glom
+
+from openforms.prefill.contrib.stufbg.plugin import (
+    ATTRIBUTES_TO_STUF_BG_MAPPING,
+    ATTRIBUTES_TO_STUF_BG_PATHS,
+)
+from openforms.utils.management.benchmark import BenchmarkCommand
+
+from ...client import _remove_nils, parse_attribute_values
+from ...constants import NAMESPACE_REPLACEMENTS
+
+CHILD = """
+                    <ns:inp.heeftAlsKinderen StUF:entiteittype="NPSNPSKND">
+                        <ns:gerelateerde StUF:entiteittype="NPS">
+                            <ns:inp.bsn>{bsn:09d}</ns:inp.bsn>
+                            <ns:geslachtsnaam>Doe</ns:geslachtsnaam>
+                            <ns:voorvoegselGeslachtsnaam>van</ns:voorvoegselGeslachtsnaam>
+                            <ns:voorletters>K</ns:voorletters>
+                            <ns:voornamen>Child {bsn}</ns:voornamen>
+                            <ns:geboortedatum>19990615</ns:geboortedatum>
+                            <ns:inp.geboorteplaats>Amsterdam</ns:inp.geboorteplaats>
+                            <ns:inp.geboorteLand>6030</ns:inp.geboorteLand>
+                        </ns:gerelateerde>
+                    </ns:inp.heeftAlsKinderen>"""
+
+
+def _generate_response(num_relations: int) -> bytes:
+    response = loader.render_to_string("stuf_bg/tests/responses/StufBgResponse.xml")
+    relations = "".join(CHILD.format(bsn=index) for index in range(num_relations))
+    head, sep, tail = response.rpartition("</ns:object>")
+    return f"{head}{relations}{sep}{tail}".encode("utf-8")
+
+
+def _xmltodict_values(content: bytes) -> dict:
+    # the implementation of the prefill plugin before the streaming parser
+    data = glom(
+        _remove_nils(
+            xmltodict.parse(
+                content, process_namespaces=True, namespaces=NAMESPACE_REPLACEMENTS
+            )
+        ),
+        "Envelope.Body.npsLa01.antwoord.object",
+    )
+    values = {}
+    for attribute, target in ATTRIBUTES_TO_STUF_BG_MAPPING.items():
+        value = glom(data, target, default=None)
+        if isinstance(value, dict) and "#text" in value:
+            value = value["#text"]
+        if value and "@noValue" not in value:
+            values[attribute] = value
+    return values
+
+
+def _lxml_values(content: bytes) -> dict:
+    return parse_attribute_values(content, ATTRIBUTES_TO_STUF_BG_PATHS)
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Parse a generated StUF-BG person response repeatedly and output the timings, "
+        "compared to the xmltodict implementation."
+    )
+
+    default_iterations = 50
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--relations",
+            type=int,
+            default=500,
+            help=(
+                "Number of family relations (children) in the generated response. "
+                "Defaults to 500."
+            ),
+        )
+
+    def handle(self, **options):
+        content = _generate_response(options["relations"])
+        self.stdout.write(f"Response size: {len(content) / 1024:.1f}KiB")
+
+        xmltodict_result, lxml_result = self.compare(
+            ("xmltodict", lambda: _xmltodict_values(content)),
+            ("lxml", lambda: _lxml_values(content)),
+            iterations=options["iterations"],
+        )
+        assert xmltodict_result == lxml_result
@@ -14,14 +14,22 @@ from glom import T as GlomTarget, glom
 from lxml import etree
 
 from openforms.logging.models import TimelineLogProxy
-from openforms.prefill.contrib.stufbg.plugin import ATTRIBUTES_TO_STUF_BG_MAPPING
+from openforms.prefill.contrib.stufbg.plugin import (
+    ATTRIBUTES_TO_STUF_BG_MAPPING,
+    ATTRIBUTES_TO_STUF_BG_PATHS,
+)
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 from stuf.models import StufService
 from stuf.stuf_zds.client import nsmap
 from stuf.tests.factories import StufServiceFactory
 from stuf.xml import fromstring
 
-from ..client import NoServiceConfigured, StufBGClient, get_client
+from ..client import (
+    NoServiceConfigured,
+    StufBGClient,
+    get_client,
+    parse_attribute_values,
+)
 from ..constants import NAMESPACE_REPLACEMENTS, FieldChoices
 from ..models import StufBGConfig
 
@@ -255,6 +263,95 @@ class StufBGClientTests(TestCase):
         self.assertNotEqual(value, missing)
 
 
+class ParseAttributeValuesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.stufbg_client = StufBGClient(service=StufServiceFactory.build())
+
+    def _glom_values(self, content: str) -> dict:
+        # the xmltodict based implementation of the prefill plugin
+        with patch.object(
+            self.stufbg_client, "get_values_for_attributes", return_value=content
+        ):
+            data = self.stufbg_client.get_values("999992314", FieldChoices.values)
+        values = {}
+        for attribute, target in ATTRIBUTES_TO_STUF_BG_MAPPING.items():
+            value = glom(data, target, default=None)
+            if isinstance(value, dict) and "#text" in value:
+                value = value["#text"]
+            if value and "@noValue" not in value:
+                values[attribute] = value
+        return values
+
+    def test_same_values_as_xmltodict(self):
+        templates = (
+            "StufBgResponse.xml",
+            "StufBgResponseOnvolledigeDatum.xml",
+            "StufBgResponseWithVoorvoegsel.xml",
+            "StufBgResponseMissingSomeData.xml",
+            "StufBgResponseGemeenteVanInschrijving.xml",
+            "StufBgNoAnswerResponse.xml",
+            "StufBgNoObjectResponse.xml",
+        )
+        for template in templates:
+            with self.subTest(template=template):
+                content = loader.render_to_string(f"stuf_bg/tests/responses/{template}")
+
+                values = parse_attribute_values(content, ATTRIBUTES_TO_STUF_BG_PATHS)
+
+                self.assertEqual(values, self._glom_values(content))
+
+    def test_only_requested_attributes(self):
+        content = loader.render_to_string("stuf_bg/tests/responses/StufBgResponse.xml")
+
+        values = parse_attribute_values(
+            content,
+            {
+                "geslachtsnaam": ("geslachtsnaam",),
+                "postcode": ("verblijfsadres", "aoa.postcode"),
+                "missing": ("verblijfsadres", "doesNotExist"),
+            },
+        )
+
+        self.assertEqual(values, {"geslachtsnaam": "Maykin", "postcode": "1015CJ"})
+
+    def test_nils_and_empty_values_are_skipped(self):
+        content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:ns="http://www.egem.nl/StUF/sector/bg/0310"
+    xmlns:StUF="http://www.egem.nl/StUF/StUF0301"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <soapenv:Body>
+    <ns:npsLa01>
+      <ns:antwoord>
+        <ns:object StUF:entiteittype="NPS">
+          <ns:voornamen>  Jan  </ns:voornamen>
+          <ns:voorvoegselGeslachtsnaam xsi:nil="true" StUF:noValue="geenWaarde"/>
+          <ns:geslachtsnaam StUF:noValue="waardeOnbekend"/>
+          <ns:geboortedatum StUF:indOnvolledigeDatum="M">19600701</ns:geboortedatum>
+          <ns:overlijdensdatum> </ns:overlijdensdatum>
+        </ns:object>
+      </ns:antwoord>
+    </ns:npsLa01>
+  </soapenv:Body>
+</soapenv:Envelope>"""
+
+        values = parse_attribute_values(content, ATTRIBUTES_TO_STUF_BG_PATHS)
+
+        self.assertEqual(
+            values,
+            {FieldChoices.voornamen: "Jan", FieldChoices.geboortedatum: "19600701"},
+        )
+
+    def test_fault_response_raises(self):
+        content = loader.render_to_string(
+            "stuf_bg/tests/responses/StufBgErrorResponse.xml"
+        )
+
+        with self.assertRaises(ValueError):
+            parse_attribute_values(content, ATTRIBUTES_TO_STUF_BG_PATHS)
+
+
 def _contains_nils(d: dict):
     """Check if xmltodict result contains xsi:nil="true" or StUF:noValue="geenWaarde"
     where
@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class CommandTests(SimpleTestCase):
+    def test_compares_lxml_parser_with_xmltodict(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_stuf_bg_parser",
+            relations=5,
+            iterations=2,
+            stdout=stdout,
+            no_color=True,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("xmltodict: min:", output)
+        self.assertIn("lxml: min:", output)
+        self.assertIn("Speed-up (median):", output)
@@ -6,6 +6,7 @@ from datetime import datetime
 from functools import partial
 from typing import Callable, Literal, TypedDict
 
+from django.conf import settings
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -21,6 +22,7 @@ from openforms.submissions.models import SubmissionFileAttachment, SubmissionRep
 
 from ..client import BaseClient
 from ..constants import EndpointType
+from ..envelope import Attachment
 from ..models import StufService
 from ..service_client_factory import ServiceClientFactory, get_client_init_kwargs
 from ..xml import fromstring
@@ -301,8 +303,22 @@ class Client(BaseClient):
         document: SubmissionReport | SubmissionFileAttachment,
         doc_data: dict,
     ) -> None:
-        document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
+        # stream large documents (and all documents if MTOM is used) into the request
+        # body rather than rendering them into the envelope in memory
+        attachment = None
+        if (
+            self.enable_mtom
+            or document.content.size > settings.STUF_ZDS_STREAMING_THRESHOLD
+        ):
+            attachment = Attachment(
+                content=document.content,
+                size=document.content.size,
+                content_type=doc_data["formaat"],
+            )
+            inhoud = attachment.placeholder
+        else:
+            document.content.seek(0)
+            inhoud = base64.b64encode(document.content.read()).decode()
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -320,7 +336,7 @@ class Client(BaseClient):
             "document_identificatie": doc_id,
             "auteur": "open-forms",
             "taal": "nld",
-            "inhoud": base64_body,
+            "inhoud": inhoud,
             "status": "definitief",
             **doc_data,
         }
@@ -329,6 +345,7 @@ class Client(BaseClient):
             template="stuf_zds/soap/voegZaakdocumentToe.xml",
             context=context,
             endpoint_type=EndpointType.ontvang_asynchroon,
+            attachment=attachment,
         )
 
     def create_zaak_document(
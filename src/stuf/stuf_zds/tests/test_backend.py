@@ -1,4 +1,8 @@
-from django.test import tag
+import base64
+from email.parser import BytesParser
+from email.policy import HTTP
+
+from django.test import override_settings, tag
 
 import requests_mock
 from freezegun import freeze_time
@@ -15,9 +19,10 @@ from openforms.submissions.tests.factories import (
 from soap.constants import SOAPVersion
 from stuf.tests.factories import StufServiceFactory
 
+from ...envelope import XOP_NAMESPACE, StreamingEnvelope
 from ..client import PaymentStatus, StufZDSClient, ZaakOptions
 from . import StUFZDSTestBase
-from .utils import load_mock, match_text, xml_from_request_history
+from .utils import get_request_text, load_mock, match_text, xml_from_request_history
 
 
 @freeze_time("2021-10-11 11:23:00")
@@ -448,6 +453,83 @@ class StufZDSClientTests(StUFZDSTestBase):
             1,
         )
 
+    @override_settings(STUF_ZDS_STREAMING_THRESHOLD=0)
+    def test_create_zaak_attachment_streamed(self, m):
+        client = StufZDSClient(self.service, self.options)
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+            additional_matcher=match_text("edcLk01"),
+        )
+        submission_attachment = SubmissionFileAttachmentFactory.create(
+            file_name="my-attachment.doc",
+            content_type="application/msword",
+            content__data=b"some binary content" * 1000,
+        )
+
+        client.create_zaak_attachment(
+            zaak_id="foo", doc_id="bar", submission_attachment=submission_attachment
+        )
+
+        request = m.request_history[0]
+        self.assertIsInstance(request.body, StreamingEnvelope)
+        self.assertEqual(
+            int(request.headers["Content-Length"]),
+            len(get_request_text(request).encode("utf8")),
+        )
+        xml_doc = xml_from_request_history(m, 0)
+        self.assertSoapXMLCommon(xml_doc)
+        self.assertXPathEqualDict(
+            xml_doc,
+            {
+                "//zkn:object/zkn:identificatie": "bar",
+                "//zkn:object/zkn:inhoud/@stuf:bestandsnaam": "my-attachment.doc",
+                "//zkn:object/zkn:inhoud": base64.b64encode(
+                    b"some binary content" * 1000
+                ).decode(),
+            },
+        )
+
+    def test_create_zaak_attachment_mtom(self, m):
+        self.service.enable_mtom = True
+        client = StufZDSClient(self.service, self.options)
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+        )
+        submission_attachment = SubmissionFileAttachmentFactory.create(
+            file_name="my-attachment.doc",
+            content_type="application/msword",
+            content__data=b"\x00binary\xff",
+        )
+
+        client.create_zaak_attachment(
+            zaak_id="foo", doc_id="bar", submission_attachment=submission_attachment
+        )
+
+        request = m.request_history[0]
+        body = b"".join(request.body)
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode() + body
+        )
+        self.assertEqual(message.get_content_type(), "multipart/related")
+        self.assertEqual(message.get_param("type"), "application/xop+xml")
+        root, attachment = message.iter_parts()
+
+        xml_doc = etree.fromstring(root.get_payload(decode=True))
+        self.assertSoapXMLCommon(xml_doc)
+        include = xml_doc.xpath(
+            "//zkn:object/zkn:inhoud/xop:Include",
+            namespaces={**self.namespaces, "xop": XOP_NAMESPACE},
+        )
+        self.assertEqual(len(include), 1)
+        self.assertEqual(
+            include[0].get("href"), f"cid:{attachment['Content-ID'].strip('<>')}"
+        )
+        self.assertEqual(attachment.get_content_type(), "application/msword")
+        self.assertEqual(attachment.get_payload(decode=True), b"\x00binary\xff")
+
     def test_client_wraps_network_error(self, m):
         client = StufZDSClient(self.service, self.options)
         m.post(self.service.soap_service.url, exc=RequestException)
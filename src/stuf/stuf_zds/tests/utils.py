@@ -3,6 +3,8 @@ from django.template import loader
 from lxml import etree
 from lxml.etree import ElementTree
 
+from ...envelope import StreamingEnvelope
+
 
 def load_mock(name, context=None):
     return loader.render_to_string(
@@ -10,15 +12,22 @@ def load_mock(name, context=None):
     ).encode("utf8")
 
 
+def get_request_text(request) -> str:
+    # documents may be streamed into the request body, see :mod:`stuf.envelope`
+    if isinstance(body := request.body, StreamingEnvelope):
+        return b"".join(body).decode("utf8")
+    return request.text or ""
+
+
 def match_text(text):
     # requests_mock matcher for SOAP requests
     def _matcher(request):
-        return text in (request.text or "")
+        return text in get_request_text(request)
 
     return _matcher
 
 
 def xml_from_request_history(m, index) -> ElementTree:
     request = m.request_history[index]
-    xml = etree.fromstring(bytes(request.text, encoding="utf8"))
+    xml = etree.fromstring(bytes(get_request_text(request), encoding="utf8"))
     return xml
@@ -0,0 +1,71 @@
+import base64
+from io import BytesIO
+
+from django.test import SimpleTestCase
+
+from soap.constants import SOAPVersion
+
+from ..envelope import Attachment, StreamingEnvelope
+
+
+class ShortReadsIO(BytesIO):
+    # mimick streams that return less data than requested
+    def read(self, size=-1):
+        return super().read(min(size, 7) if size > 0 else size)
+
+
+class StreamingEnvelopeTests(SimpleTestCase):
+    def _get_attachment(self, data: bytes, content=None) -> Attachment:
+        return Attachment(content=content or BytesIO(data), size=len(data))
+
+    def test_inline_base64_equivalent_to_rendered_envelope(self):
+        for data in (b"", b"a", b"ab", b"abc", b"abcd" * 1000):
+            with self.subTest(size=len(data)):
+                attachment = self._get_attachment(data, ShortReadsIO(data))
+                envelope = StreamingEnvelope(
+                    f"<inhoud>{attachment.placeholder}</inhoud>",
+                    attachment,
+                    soap_version=SOAPVersion.soap12,
+                )
+
+                body = b"".join(envelope)
+
+                expected = f"<inhoud>{base64.b64encode(data).decode()}</inhoud>"
+                self.assertEqual(body, expected.encode())
+                self.assertEqual(len(envelope), len(body))
+                self.assertEqual(envelope.content_type, "application/soap+xml")
+
+    def test_can_be_iterated_repeatedly(self):
+        attachment = self._get_attachment(b"content")
+        envelope = StreamingEnvelope(
+            attachment.placeholder, attachment, soap_version=SOAPVersion.soap11
+        )
+
+        self.assertEqual(b"".join(envelope), b"".join(envelope))
+
+    def test_mtom_content_length(self):
+        attachment = self._get_attachment(b"\x00" * 1000)
+        envelope = StreamingEnvelope(
+            f"<inhoud>{attachment.placeholder}</inhoud>",
+            attachment,
+            soap_version=SOAPVersion.soap11,
+            mtom=True,
+        )
+
+        body = b"".join(envelope)
+
+        self.assertEqual(len(envelope), len(body))
+        self.assertIn(b"\x00" * 1000, body)
+        self.assertNotIn(attachment.placeholder.encode(), body)
+        self.assertTrue(envelope.content_type.startswith("multipart/related;"))
+        self.assertIn('start-info="text/xml"', envelope.content_type)
+
+    def test_placeholder_must_be_rendered_once(self):
+        attachment = self._get_attachment(b"content")
+
+        for rendered in ("", f"{attachment.placeholder}{attachment.placeholder}"):
+            with self.subTest(rendered=rendered):
+                with self.assertRaises(ValueError):
+                    StreamingEnvelope(
+                        rendered, attachment, soap_version=SOAPVersion.soap12
+                    )